@@ -15,14 +15,148 @@ Copyright (c) Maurice H.T. Ling <mauriceling@acm.org>
 Date created: 1st September 2008
 """
 
+import collections
+import threading
 from math import sqrt, log, e
+from .copadsexceptions import DistributionParameterError
 from .statisticsdistribution import *
 
+# Least recently used cache of critical values, keyed by distribution type,
+# parameters and probability (please see critical_value function)
+_critical_values = collections.OrderedDict()
+_critical_values_size = 4096
+_critical_values_lock = threading.Lock()
+# Quantile tables, keyed by distribution type and parameters (please see
+# add_quantile_table function)
+_quantile_tables = {}
+
+def _distribution_key(distribution):
+    """Gives a hashable key of a distribution from its type and parameters
+    (attributes), or None if a parameter is not a number or string."""
+    parameters = []
+    for (name, value) in sorted(vars(distribution).items()):
+        if isinstance(value, Distribution):
+            value = _distribution_key(value)
+            if value is None: return None
+        elif not isinstance(value, (int, float, str)):
+            return None
+        parameters.append((name, value))
+    return (type(distribution), tuple(parameters))
+
+def critical_value(distribution, probability):
+    """Gives the critical value (value on the x-axis) of a distribution for
+    a probability, using the distribution's inverseCDF method.
+
+    Critical values are kept in a least recently used cache (please see
+    critical_value_cache function), which is shared by all tests, keyed by
+    the type and parameters of the distribution and the probability. Hence,
+    repeated tests with the same degrees of freedom and confidence do not
+    solve the critical values again. Critical values of distributions with
+    a quantile table (please see add_quantile_table function) are
+    interpolated from the table instead.
+
+    @param distribution: distribution to calculate critical value
+    @type distribution: instance of a statistics distribution
+    @param probability: probability under the curve to the critical value
+    @type probability: float
+    @return: critical value (float)"""
+    key = _distribution_key(distribution)
+    if key is None:
+        return distribution.inverseCDF(probability)[0]
+    if key in _quantile_tables:
+        return _quantile_tables[key].quantile(probability)
+    key = (key, float(probability))
+    with _critical_values_lock:
+        if key in _critical_values:
+            _critical_values.move_to_end(key)
+            return _critical_values[key]
+    value = distribution.inverseCDF(probability)[0]
+    with _critical_values_lock:
+        _critical_values[key] = value
+        while len(_critical_values) > _critical_values_size:
+            _critical_values.popitem(last=False)
+    return value
+
+def critical_value_cache(size=None, clear=False):
+    """Sets the size of, or clears, the least recently used cache of
+    critical values (please see critical_value function).
+
+    @param size: maximum number of critical values in the cache, where 0
+    disables the cache. Default = None (size is not changed)
+    @type size: integer
+    @param clear: clears the cache if True. Default = False
+    @return: number of critical values in the cache"""
+    global _critical_values_size
+    with _critical_values_lock:
+        if size is not None: _critical_values_size = int(size)
+        if clear: _critical_values.clear()
+        while len(_critical_values) > _critical_values_size:
+            _critical_values.popitem(last=False)
+        return len(_critical_values)
+
+def add_quantile_table(distribution, lower=0.0005, upper=0.9995, size=2001):
+    """Precomputes a dense quantile table of a continuous distribution
+    (please see QuantileTable class), which is used by critical_value
+    function (hence, all tests) for the critical values of distributions
+    with the same type and parameters. With the default table, the error of
+    the quantiles (x) is about 1e-7 of the larger of |x| and 1, or less, for
+    standard normal, t, chi-square and F distributions (including the heavy
+    tails of 1 degree of freedom), as the quantiles of the table are closer
+    together towards both ends of the table; probabilities outside the table
+    are solved by inverseCDF method of the distribution.
+
+    @param distribution: continuous distribution with PDF method
+    @type distribution: instance of a statistics distribution
+    @param lower: smallest probability of the table. Default = 0.0005
+    @param upper: largest probability of the table. Default = 0.9995
+    @param size: number of quantiles in the table. Default = 2001
+    @return: quantile table (instance of QuantileTable)"""
+    key = _distribution_key(distribution)
+    if key is None:
+        raise DistributionParameterError('Parameters of %s are not \
+        numbers' % type(distribution).__name__)
+    table = QuantileTable(distribution, lower, upper, size)
+    _quantile_tables[key] = table
+    return table
+
+def precompute_quantile_tables(df=range(1, 31), fdf=range(1, 11),
+                               lower=0.0005, upper=0.9995, size=2001):
+    """Precomputes dense quantile tables (please see add_quantile_table
+    function) for the common distributions of the tests - standard normal
+    distribution, t distribution and chi-square distribution for the given
+    degrees of freedom, and F distribution for all pairs of the given
+    degrees of freedom of numerator and denominator.
+
+    @param df: degrees of freedom of t and chi-square distributions.
+    Default = 1 to 30
+    @type df: list of integers
+    @param fdf: degrees of freedom of F distribution. Default = 1 to 10
+    @type fdf: list of integers
+    @param lower: smallest probability of the tables. Default = 0.0005
+    @param upper: largest probability of the tables. Default = 0.9995
+    @param size: number of quantiles in each table. Default = 2001
+    @return: number of quantile tables"""
+    distributions = [NormalDistribution()]
+    for n in df:
+        distributions.append(TDistribution(shape=n))
+        distributions.append(ChiSquareDistribution(df=n))
+    for n in fdf:
+        for m in fdf:
+            distributions.append(FDistribution(df1=n, df2=m))
+    for distribution in distributions:
+        add_quantile_table(distribution, lower, upper, size)
+    return len(_quantile_tables)
+
+def clear_quantile_tables():
+    """Removes all quantile tables (please see add_quantile_table
+    function)."""
+    _quantile_tables.clear()
+
 def test_CI(statistic, distribution, confidence):
     """Generates the critical value from distribution and confidence value
-    using the distribution's inverseCDF method and performs 1-tailed and
-    2-tailed test by comparing the calculated statistic with the critical
-    value.
+    using the distribution's inverseCDF method (please see critical_value
+    function) and performs 1-tailed and 2-tailed test by comparing the
+    calculated statistic with the critical value.
 
     Returns a 5-element list
     [left result, left critical, statistic, right critical, right result]
@@ -45,10 +179,10 @@ def test_CI(statistic, distribution, confidence):
         test (usually 0.95 or 0.99), use 0.975 or 0.995 for 2-tail test
     @type confidence: float of less than 1.0"""
     data = [None, None, statistic, None, None]
-    data[1] = distribution.inverseCDF(1.0 - confidence)[0]
+    data[1] = critical_value(distribution, 1.0 - confidence)
     if data[1] < statistic: data[0] = False
     else: data[0] = True
-    data[3] = distribution.inverseCDF(confidence)[0]
+    data[3] = critical_value(distribution, confidence)
     if statistic < data[3]: data[4] = False
     else: data[4] = True
     return data
@@ -38,10 +38,19 @@ Date created: 19th March 2008
 
 import math
 
-from . import constants
-from .copadsexceptions import FunctionParameterTypeError
-from .copadsexceptions import FunctionParameterValueError
-from .copadsexceptions import MaxIterationsException
+import numpy as np
+
+try:
+    from . import constants
+    from .copadsexceptions import FunctionParameterTypeError
+    from .copadsexceptions import FunctionParameterValueError
+    from .copadsexceptions import MaxIterationsException
+except ImportError:
+    # nrpy.py is imported as a module from copads directory (sys.path)
+    import constants
+    from copadsexceptions import FunctionParameterTypeError
+    from copadsexceptions import FunctionParameterValueError
+    from copadsexceptions import MaxIterationsException
 
 # medfit global data
 ndatat = 0
@@ -567,6 +576,26 @@ def erfcc(x):
     else:
         return 2.0 - r
 
+def erfccln(x):
+    """
+    Natural logarithm of complementary error function (erfcc), which is
+    calculated in log-space for positive x, where erfcc(x) underflows for
+    x larger than about 26.
+
+    @param x: float number
+    @return: float number
+    """
+    z = abs(x)
+    t = 1.0 / (1.0 + 0.5*z)
+    e = -z*z-1.26551223+t*(1.00002368+t*(0.37409196+
+        t*(0.09678418+t*(-0.18628806+t*(0.27886807+
+        t*(-1.13520398+t*(1.48851587+t*(-0.82215223+
+        t*0.17087277))))))))
+    if (x >= 0.0):
+        return math.log(t) + e
+    else:
+        return math.log(2.0 - t * math.exp(e))
+
 def expdev(x):
     """Depends: ran3
     @see: NRP 7.2"""
@@ -883,6 +912,81 @@ def svdvar(v, ma, w, cvm):
         cvm[i][j] = sum
     return cvm
 
+def zbrent(func, x1, x2, tol=3.0e-8, itmax=100):
+    """
+    Finds the root of a function, known to lie between x1 and x2, using 
+    Brent's method (inverse quadratic interpolation, falling back to 
+    bisection). @see: NRP 9.3
+
+    @param func: function of one variable
+    @param x1: one end of the bracket
+    @param x2: other end of the bracket; func(x1) and func(x2) must have 
+    opposite signs
+    @param tol: tolerance of the root
+    @param itmax: maximum number of iterations
+    @return: root of func between x1 and x2
+    """
+    EPS = 3.0e-16
+    a = x1
+    b = x2
+    fa = func(a)
+    fb = func(b)
+    if (fa > 0.0 and fb > 0.0) or (fa < 0.0 and fb < 0.0):
+        raise FunctionParameterValueError('Root must be bracketed: f(%s) = '
+                                          '%s, f(%s) = %s' % 
+                                          (a, fa, b, fb))
+    c = b
+    fc = fb
+    d = e = b - a
+    for iter in range(itmax):
+        if (fb > 0.0 and fc > 0.0) or (fb < 0.0 and fc < 0.0):
+            c = a
+            fc = fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a = b
+            b = c
+            c = a
+            fa = fb
+            fb = fc
+            fc = fa
+        tol1 = 2.0 * EPS * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0.0:
+            return b
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p = 2.0 * xm * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0.0: q = -q
+            p = abs(p)
+            min1 = 3.0 * xm * q - abs(tol1 * q)
+            min2 = abs(e * q)
+            if 2.0 * p < MIN(min1, min2):
+                e = d
+                d = p / q
+            else:
+                d = xm
+                e = d
+        else:
+            d = xm
+            e = d
+        a = b
+        fa = fb
+        if abs(d) > tol1:
+            b = b + d
+        else:
+            b = b + SIGN(tol1, xm)
+        fb = func(b)
+    raise MaxIterationsException('Maximum iterations reached: %s' 
+                                 % abs(xm))
+
 #def adi(): raise NotImplementedError
 #def amoeba(): raise NotImplementedError
 #def anneal(): raise NotImplementedError
@@ -1040,7 +1144,6 @@ def svdvar(v, ma, w, cvm):
 #def vander(): raise NotImplementedError
 #def zbrac(): raise NotImplementedError
 #def zbrak(): raise NotImplementedError
-#def zbrent(): raise NotImplementedError
 #def zroots(): raise NotImplementedError
 #def airy(): raise NotImplementedError
 #def amebsa(): raise NotImplementedError
@@ -1191,3 +1294,279 @@ def cdf_poisson(k, x):
     with the mean of x
     """
     return gammq(k, x)
+
+
+# Array versions of special functions, which evaluate every element of
+# NumPy arrays (with broadcasting of the arguments) in the same way as the
+# functions above, for statistical distributions over arrays (please see
+# statisticsdistribution module). Elements where the functions above raise
+# an exception, or do not converge, are given as not-a-number (nan).
+
+def gammln_array(n):
+    """
+    Array version of gammln (complete Gamma function).
+    @see: NRP 6.1
+
+    @param n: array of float numbers
+    @return: array of float numbers
+    """
+    gammln_cof = [76.18009173, -86.50532033, 24.01409822,
+                  -1.231739516e0, 0.120858003e-2, -0.536382e-5]
+    x = np.asarray(n, dtype=float) - 1.0
+    with np.errstate(all='ignore'):
+        tmp = x + 5.5
+        tmp = (x + 0.5) * np.log(tmp) - tmp
+        ser = np.ones(x.shape)
+        for j in range(6):
+            x = x + 1.
+            ser = ser + gammln_cof[j] / x
+        return tmp + np.log(2.50662827465 * ser)
+
+def bico_array(n, k):
+    """
+    Array version of bico (binomial coefficient), which is nan where k is
+    not within 0 to n.
+    @see: NRP 6.1
+
+    @param n: array of total number of items
+    @param k: array of required number of items
+    @return: array of float numbers
+    """
+    n = np.asarray(n, dtype=float)
+    k = np.asarray(k, dtype=float)
+    with np.errstate(all='ignore'):
+        result = np.floor(np.exp(gammln_array(n + 1.0) -
+                                 gammln_array(k + 1.0) -
+                                 gammln_array(n - k + 1.0)))
+    return np.where((k >= 0.0) & (k <= n), result, np.nan)
+
+def betacf_array(a, b, x):
+    """
+    Array version of betacf (continued fraction for incomplete beta
+    function). Only the elements which have not converged are iterated.
+    @see: NRP 6.3
+    """
+    (a, b, x) = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                    np.asarray(b, dtype=float),
+                                    np.asarray(x, dtype=float))
+    iter_max = 200
+    eps = 3.0e-7
+
+    shape = x.shape
+    result = np.full(x.size, np.nan)
+    index = np.arange(x.size)
+    (a, b, x) = (a.ravel(), b.ravel(), x.ravel())
+    bm = np.ones(x.size)
+    az = np.ones(x.size)
+    am = np.ones(x.size)
+    qab = a + b
+    qap = a + 1.0
+    qam = a - 1.0
+    with np.errstate(all='ignore'):
+        bz = 1.0 - qab * x / qap
+        for i in range(iter_max + 1):
+            em = float(i + 1)
+            tem = em + em
+            d = em * (b - em) * x / ((qam + tem) * (a + tem))
+            ap = az + d * am
+            bp = bz + d * bm
+            d = -(a + em) * (qab + em) * x / ((qap + tem) * (a + tem))
+            app = ap + d * az
+            bpp = bp + d * bz
+            aold = az
+            am = ap / bpp
+            bm = bp / bpp
+            az = app / bpp
+            bz = 1.0
+            converged = np.abs(az - aold) < (eps * np.abs(az))
+            if converged.any():
+                result[index[converged]] = az[converged]
+                active = ~converged
+                (index, a, b, x, qab, qap, qam, am, bm, az) = \
+                    [v[active] for v in (index, a, b, x, qab, qap, qam,
+                                         am, bm, az)]
+                if index.size == 0: break
+    return result.reshape(shape)
+
+def betai_array(a, b, x):
+    """
+    Array version of betai (incomplete beta function), which is nan where
+    x is not within 0 to 1, or a or b is not positive.
+    Depend: betacf_array, gammln_array
+    @see: NRP 6.3
+
+    @param a: array of float numbers
+    @param b: array of float numbers
+    @param x: array of float numbers
+    @return: array of float numbers
+    """
+    (a, b, x) = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                    np.asarray(b, dtype=float),
+                                    np.asarray(x, dtype=float))
+    with np.errstate(all='ignore'):
+        bt = np.where((x == 0.0) | (x == 1.0), 0.0,
+                      np.exp(gammln_array(a + b) - gammln_array(a) -
+                             gammln_array(b) + a * np.log(x) +
+                             b * np.log(1.0 - x)))
+        lower = x < (a + 1.0) / (a + b + 2.0)
+        cf = betacf_array(np.where(lower, a, b), np.where(lower, b, a),
+                          np.where(lower, x, 1.0 - x))
+        result = np.where(lower, bt * cf / a, 1.0 - bt * cf / b)
+    return np.where((x >= 0.0) & (x <= 1.0) & (a > 0.0) & (b > 0.0),
+                    result, np.nan)
+
+def gser_array(a, x, itmax=700, eps=3.e-7):
+    """
+    Array version of gser (series approximation to the incomplete gamma
+    function), which gives the array of incomplete gamma function, P(a,x),
+    only. Only the elements which have not converged are iterated.
+    """
+    (a, x) = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                 np.asarray(x, dtype=float))
+    shape = x.shape
+    (a, x) = (a.ravel(), x.ravel())
+    result = np.full(x.size, np.nan)
+    result[x == 0.0] = 0.0
+    index = np.flatnonzero(x > 0.0)
+    (a, x) = (a[index], x[index])
+    with np.errstate(all='ignore'):
+        gln = gammln_array(a)
+        ap = a.copy()
+        total = 1.0 / a
+        delta = total.copy()
+        n = 1
+        while n <= itmax and index.size > 0:
+            ap = ap + 1.0
+            delta = delta * x / ap
+            total = total + delta
+            converged = np.abs(delta) < np.abs(total) * eps
+            if converged.any():
+                result[index[converged]] = \
+                    (total * np.exp(-x + a * np.log(x) - gln))[converged]
+                active = ~converged
+                (index, a, x, gln, ap, total, delta) = \
+                    [v[active] for v in (index, a, x, gln, ap, total,
+                                         delta)]
+            n = n + 1
+    return result.reshape(shape)
+
+def gcf_array(a, x, itmax=200, eps=3.e-7):
+    """
+    Array version of gcf (continued fraction approximation of the
+    incomplete gamma function), which gives the array of incomplete gamma
+    function, Q(a,x), only. Only the elements which have not converged are
+    iterated.
+    """
+    (a, x) = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                 np.asarray(x, dtype=float))
+    shape = x.shape
+    (a, x) = (a.ravel(), x.ravel())
+    result = np.full(x.size, np.nan)
+    index = np.flatnonzero(x > 0.0)
+    (a, x) = (a[index], x[index])
+    gold = np.zeros(x.size)
+    a0 = np.ones(x.size)
+    a1 = x.copy()
+    b0 = np.zeros(x.size)
+    b1 = np.ones(x.size)
+    fac = np.ones(x.size)
+    n = 1
+    with np.errstate(all='ignore'):
+        gln = gammln_array(a)
+        while n <= itmax and index.size > 0:
+            an = float(n)
+            ana = an - a
+            a0 = (a1 + a0 * ana) * fac
+            b0 = (b1 + b0 * ana) * fac
+            anf = an * fac
+            a1 = x * a0 + anf * a1
+            b1 = x * b0 + anf * b1
+            nonzero = a1 != 0.0
+            fac = np.where(nonzero, 1.0 / a1, fac)
+            g = b1 * fac
+            converged = nonzero & (np.abs((g - gold) / g) < eps)
+            gold = np.where(nonzero, g, gold)
+            if converged.any():
+                result[index[converged]] = \
+                    (g * np.exp(-x + a * np.log(x) - gln))[converged]
+                active = ~converged
+                (index, a, x, gln, gold, a0, a1, b0, b1, fac) = \
+                    [v[active] for v in (index, a, x, gln, gold, a0, a1,
+                                         b0, b1, fac)]
+            n = n + 1
+    return result.reshape(shape)
+
+def gammp_array(a, x):
+    """
+    Array version of gammp (incomplete gamma function, P(a,x)).
+    Depend: gser_array, gcf_array, gammln_array
+    @see: NRP 6.2
+
+    @param a: array of float numbers
+    @param x: array of float numbers
+    @return: array of float numbers
+    """
+    (a, x) = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                 np.asarray(x, dtype=float))
+    result = np.full(x.shape, np.nan)
+    valid = (x >= 0.0) & (a > 0.0)
+    series = valid & (x < a + 1.0)
+    fraction = valid & ~series
+    result[series] = gser_array(a[series], x[series])
+    result[fraction] = 1.0 - gcf_array(a[fraction], x[fraction])
+    return result
+
+def gammq_array(a, x):
+    """
+    Array version of gammq (incomplete gamma function, Q(a,x) = 1 -
+    P(a,x)).
+    Depend: gser_array, gcf_array, gammln_array
+
+    @param a: array of float numbers
+    @param x: array of float numbers
+    @return: array of float numbers
+    """
+    (a, x) = np.broadcast_arrays(np.asarray(a, dtype=float),
+                                 np.asarray(x, dtype=float))
+    result = np.full(x.shape, np.nan)
+    valid = (x >= 0.0) & (a > 0.0)
+    series = valid & (x < a + 1.0)
+    fraction = valid & ~series
+    result[series] = 1.0 - gser_array(a[series], x[series])
+    result[fraction] = gcf_array(a[fraction], x[fraction])
+    return result
+
+def erfcc_array(x):
+    """
+    Array version of erfcc (complementary error function with fractional
+    error lesser than 1.2e-7).
+    @see: NRP 6.2
+
+    @param x: array of float numbers
+    @return: array of float numbers
+    """
+    x = np.asarray(x, dtype=float)
+    z = np.abs(x)
+    t = 1.0 / (1.0 + 0.5*z)
+    r = t * np.exp(-z*z-1.26551223+t*(1.00002368+t*(0.37409196+
+        t*(0.09678418+t*(-0.18628806+t*(0.27886807+
+        t*(-1.13520398+t*(1.48851587+t*(-0.82215223+
+        t*0.17087277)))))))))
+    return np.where(x >= 0.0, r, 2.0 - r)
+
+def erfccln_array(x):
+    """
+    Array version of erfccln (natural logarithm of complementary error
+    function).
+
+    @param x: array of float numbers
+    @return: array of float numbers
+    """
+    x = np.asarray(x, dtype=float)
+    z = np.abs(x)
+    t = 1.0 / (1.0 + 0.5*z)
+    e = -z*z-1.26551223+t*(1.00002368+t*(0.37409196+
+        t*(0.09678418+t*(-0.18628806+t*(0.27886807+
+        t*(-1.13520398+t*(1.48851587+t*(-0.82215223+
+        t*0.17087277))))))))
+    return np.where(x >= 0.0, np.log(t) + e, np.log(2.0 - t * np.exp(e)))
@@ -1,11 +1,88 @@
 '''
 Ordinary Differential Equation (ODE) Solvers.
 
+All solvers take the system of ODEs (funcs parameter) in one of two 
+calling conventions:
+    - a list of functions, one per ODE, where each function takes x 
+    (usually time) and the list of variables (y), and returns the 
+    derivative of its variable. Each function is evaluated one at a time.
+    - a single function taking x and a NumPy array of variables, and 
+    returning a NumPy array of derivatives of all variables (vectorized 
+    mode). The function is evaluated once per stage and all stage 
+    combinations are performed as NumPy array operations on preallocated 
+    buffers. In vectorized mode, the solvers generate NumPy arrays of 
+    [x] + y instead of lists, and nonODEfunc will be given a NumPy array.
+
+By default, the solvers generate results at every step. Results can be 
+reduced to every N-th step (every parameter), or to given values of 
+x-axis (output_times parameter), where results between steps are 
+interpolated by cubic Hermite interpolation and integration stops after 
+the last given value of x-axis. The reduction is done within the loops of 
+the solvers, so a result ([x] + y) is only built for the steps which are 
+given as results (please see _Output class).
+
+Events, defined as roots of event functions of x-axis and variables (please 
+see Event class), can be located during integration by the solvers, where 
+occurrences of events are recorded, and integration can be stopped at the 
+first occurrence of an event, instead of integrating to the maximum value 
+of x-axis.
+
+Statistics of integration (such as the number of evaluations of the system 
+of ODEs, accepted and rejected steps, and time spent in the system of ODEs 
+and nonODEfunc) can be collected by giving a Statistics object to the 
+solvers (stats parameter).
+
+Jacobian matrices of systems of ODEs (for stiff solvers, sensitivity 
+analysis and steady states) are approximated by finite differences 
+(please see jacobian_matrix function), where the sparsity pattern of the 
+system of ODEs is detected once per model and structurally independent 
+variables are perturbed together.
+
+Steady states of a system of ODEs can be found directly by Newton 
+iteration (please see steady_state function), or integration can be 
+stopped as soon as the system of ODEs settles (please see SteadyState 
+class).
+
+Sensitivities of the results of an ODE model to its parameters can be 
+integrated together with the variables, in a single integration (please 
+see ODE_sensitivity function).
+
+ODE models can be integrated for many samples of parameter values across 
+worker processes (please see parameter_sweep function).
+
 Copyright (c) Maurice H.T. Ling <mauriceling@acm.org>
 
 Date created: 20th December 2014
 '''
 
+import abc
+import ast
+import asyncio
+import collections
+import concurrent.futures
+import copy
+import functools
+import itertools
+import math
+import os
+import queue
+import struct
+import threading
+import time
+
+import numpy as np
+
+try:
+    from . import nrpy
+    from .copadsexceptions import FunctionParameterValueError
+    from .copadsexceptions import MaxIterationsException
+except ImportError:
+    # ode.py is imported as a module from copads directory (sys.path)
+    import nrpy
+    from copadsexceptions import FunctionParameterValueError
+    from copadsexceptions import MaxIterationsException
+
+
 def boundary_checker(y, boundary, type):
     '''
     Private function - called by ODE solvers to perform boundary checking 
@@ -28,16 +105,776 @@ def boundary_checker(y, boundary, type):
     @param type: the type of boundary to be checked, either 'upper' (upper 
     boundary) or 'lower' (lower boundary)
     '''
-    for k in list(boundary.keys()):
-        if y[int(k)] < boundary[k][0] and type == 'lower':
-            y[int(k)] = boundary[k][1]
-        if y[int(k)] > boundary[k][0] and type == 'upper':
-            y[int(k)] = boundary[k][1]
+    return _list_boundary(y, _compile_list_boundary(boundary) or [], type)
+
+def _compile_list_boundary(boundary):
+    '''
+    Private function - converts a boundary dictionary (please see 
+    boundary_checker) into a list of (variable index, boundary value, value 
+    to set if boundary is exceeded) for use by _list_boundary, so that 
+    variable indices are only converted from the keys once per integration 
+    instead of at every step. In list mode, a loop over the compiled 
+    boundary is faster than a vectorized clamp as converting the list of 
+    variables to and from a NumPy array costs more than the comparisons.
+    
+    @param boundary: set of values for boundary of variables
+    @type boundary: dictionary
+    @return: list of (index, boundary value, value to set), or None if 
+    there is no boundary
+    '''
+    if not boundary: return None
+    return [(int(k), boundary[k][0], boundary[k][1]) for k in boundary]
+
+def _list_boundary(y, boundary, type):
+    '''
+    Private function - equivalent of boundary_checker using a compiled 
+    boundary (please see _compile_list_boundary), called by ODE solvers 
+    in list mode. Variable values (y) are modified in place.
+    
+    @param y: values for variables
+    @type y: list
+    @param boundary: compiled boundary
+    @type boundary: list
+    @param type: the type of boundary to be checked, either 'upper' (upper 
+    boundary) or 'lower' (lower boundary)
+    '''
+    if type == 'lower':
+        for (i, limit, value) in boundary:
+            if y[i] < limit: y[i] = value
+    elif type == 'upper':
+        for (i, limit, value) in boundary:
+            if y[i] > limit: y[i] = value
+    return y
+
+def _compile_boundary(boundary):
+    '''
+    Private function - converts a boundary dictionary (please see 
+    boundary_checker) into NumPy arrays of variable indices, boundary 
+    values and values to set if boundary is exceeded, for use by 
+    _vector_boundary.
+    
+    @param boundary: set of values for boundary of variables
+    @type boundary: dictionary
+    @return: tuple of (indices, boundary values, values to set), or None 
+    if there is no boundary
+    '''
+    if not boundary: return None
+    keys = list(boundary.keys())
+    index = np.array([int(k) for k in keys], dtype=int)
+    limit = np.array([boundary[k][0] for k in keys], dtype=float)
+    value = np.array([boundary[k][1] for k in keys], dtype=float)
+    return (index, limit, value)
+
+def _vector_boundary(y, boundary, type):
+    '''
+    Private function - vectorized equivalent of boundary_checker, called 
+    by ODE solvers in vectorized mode. Variable values (y) are modified 
+    in place.
+    
+    @param y: values for variables
+    @type y: numpy.ndarray
+    @param boundary: compiled boundary (please see _compile_boundary)
+    @type boundary: tuple
+    @param type: the type of boundary to be checked, either 'upper' (upper 
+    boundary) or 'lower' (lower boundary)
+    '''
+    (index, limit, value) = boundary
+    current = y[index]
+    if type == 'lower': exceeded = current < limit
+    else: exceeded = current > limit
+    if exceeded.any():
+        y[index[exceeded]] = value[exceeded]
+    return y
+
+class _ZeroDivision(object):
+    '''
+    Private class - records division by zero (as NumPy error call, please 
+    see numpy.seterrcall) during an evaluation of a system of ODEs in 
+    vectorized mode, where division by zero gives infinity instead of 
+    ZeroDivisionError. For example,
+    
+    >>> division = _ZeroDivision()
+    >>> with division.errstate():
+            f = funcs(x, y)
+    >>> _replace_nonfinite(f, overflow, zerodivision, division.occurred)
+    '''
+    def __init__(self):
+        self.occurred = False
+    def __call__(self, error, flag):
+        self.occurred = True
+    def errstate(self):
+        '''
+        Gives the NumPy error state for an evaluation, where division by 
+        zero is recorded and other floating point errors are ignored.
+        '''
+        self.occurred = False
+        return np.errstate(divide='call', over='ignore', under='ignore', 
+                           invalid='ignore', call=self)
+
+def _replace_nonfinite(y, overflow, zerodivision, divided=False):
+    '''
+    Private function - called by ODE solvers in vectorized mode to replace 
+    non-finite values in place; NaN by zerodivision, positive infinity by 
+    overflow, and negative infinity by -overflow. If a division by zero 
+    occurred in the evaluation (please see _ZeroDivision class), 
+    infinities are taken as results of the division by zero and replaced 
+    by zerodivision, as ZeroDivisionError in list mode. As the evaluation 
+    is of all variables at once, infinities from over flow in the same 
+    evaluation are also replaced by zerodivision.
+    
+    @param y: values to check
+    @type y: numpy.ndarray
+    @param overflow: value to assign to infinities
+    @type overflow: float
+    @param zerodivision: value to assign to NaN
+    @type zerodivision: float
+    @param divided: flag of division by zero in the evaluation. 
+    Default = False
+    @type divided: boolean
+    '''
+    np.copyto(y, zerodivision, where=np.isnan(y))
+    if divided:
+        np.copyto(y, zerodivision, where=np.isinf(y))
+    else:
+        np.copyto(y, overflow, where=np.isposinf(y))
+        np.copyto(y, -overflow, where=np.isneginf(y))
     return y
 
+def _derivative(funcs, x, y, overflow, zerodivision):
+    '''
+    Private function - evaluates a system of ODEs (in either list or 
+    vectorized mode) at (x, y), with the same handling of zero division 
+    and over flow errors as the ODE solvers.
+    
+    @param funcs: system of differential equations
+    @type funcs: list or function
+    @param x: value of x-axis
+    @type x: float
+    @param y: values for variables
+    @type y: list or numpy.ndarray
+    @return: derivatives of variables
+    @rtype: list or numpy.ndarray
+    '''
+    if callable(funcs):
+        division = _ZeroDivision()
+        with division.errstate():
+            f = np.array(funcs(x, y), dtype=float)
+        if not np.isfinite(f).all():
+            _replace_nonfinite(f, overflow, zerodivision, division.occurred)
+        return f
+    f = [0.0]*len(y)
+    for i in range(len(funcs)):
+        try: f[i] = funcs[i](x, y)
+        except TypeError: pass
+        except ZeroDivisionError: f[i] = zerodivision
+        except OverflowError: f[i] = overflow
+    return f
+
+def _hermite(row0, f0, row1, f1, x):
+    '''
+    Private function - cubic Hermite interpolation of variables between 
+    2 steps, using the values and derivatives of variables at both steps.
+    
+    @param row0: [x] + y of the first step
+    @type row0: list or numpy.ndarray
+    @param f0: derivatives of variables at the first step
+    @type f0: list or numpy.ndarray
+    @param row1: [x] + y of the second step
+    @type row1: list or numpy.ndarray
+    @param f1: derivatives of variables at the second step
+    @type f1: list or numpy.ndarray
+    @param x: value of x-axis to interpolate, between the 2 steps
+    @type x: float
+    @return: interpolated [x] + y, of the same type as row0
+    '''
+    h = row1[0] - row0[0]
+    s = (x - row0[0]) / h
+    h00 = (1.0 + 2.0*s) * (1.0 - s) * (1.0 - s)
+    h10 = s * (1.0 - s) * (1.0 - s) * h
+    h01 = s * s * (3.0 - 2.0*s)
+    h11 = s * s * (s - 1.0) * h
+    if isinstance(row0, np.ndarray):
+        row = h00*row0 + h01*row1
+        row[1:] = row[1:] + h10*f0 + h11*f1
+        row[0] = x
+        return row
+    return [x] + [h00*row0[i+1] + h10*f0[i] + h01*row1[i+1] + h11*f1[i]
+                  for i in range(len(f0))]
+
+class Event(object):
+    '''
+    Class for an event during integration of ODEs, which is defined as a 
+    root of an event function, g(x, y), of x-axis and variables. For 
+    example, the following event function
+    
+    >>> def extinction(x, y):
+            return y[1] - 1.0
+    
+    occurs when y[1] falls to 1.0. The event function is evaluated at every 
+    step and a change of sign between 2 steps is located by Brent's method 
+    (nrpy.zbrent) on the cubic Hermite interpolation of variables between 
+    the 2 steps. Each occurrence of the event is recorded as [x] + y in 
+    occurrences list, which is cleared at the start of each integration 
+    using the event; hence, an event reused in another integration only 
+    keeps the occurrences of the latest integration. A terminal event 
+    stops the integration at the first occurrence, where the result at 
+    the occurrence is generated as the last result.
+    '''
+    def __init__(self, function, terminal=False, direction=0, 
+                 tolerance=1e-12):
+        '''
+        Constructor method.
+        
+        @param function: event function, which takes x (usually time) and 
+        the list of variables (y), and returns a float
+        @type function: function
+        @param terminal: flag to stop integration at the first occurrence 
+        of the event. Default = False (record all occurrences)
+        @type terminal: boolean
+        @param direction: direction of sign change of event function, where 
+        1 is from negative to positive, -1 is from positive to negative, and 
+        0 is either. Default = 0.
+        @type direction: integer
+        @param tolerance: tolerance of x-axis for locating the event. 
+        Default = 1e-12.
+        @type tolerance: float
+        '''
+        self.function = function
+        self.terminal = terminal
+        self.direction = direction
+        self.tolerance = tolerance
+        self.occurrences = []
+    def crossed(self, g0, g1):
+        '''
+        Checks for the event between 2 steps from the values of event 
+        function at both steps. An event function starting at zero is not an 
+        occurrence; hence, an occurrence exactly at a step is not repeated in 
+        the next step.
+        
+        @param g0: value of event function at the first step
+        @type g0: float
+        @param g1: value of event function at the second step
+        @type g1: float
+        @rtype: boolean
+        '''
+        if g0 < 0.0 and g1 >= 0.0: return self.direction >= 0
+        if g0 > 0.0 and g1 <= 0.0: return self.direction <= 0
+        return False
+
+class SteadyState(Event):
+    '''
+    Class for a terminal event (please see Event class), which occurs when 
+    a system of ODEs settles - when the largest absolute derivative of the 
+    variables, max(|dy/dt|), falls below a tolerance. Giving a SteadyState 
+    event to an ODE solver stops the integration as soon as the system of 
+    ODEs settles, instead of integrating to the maximum value of x-axis. 
+    For example,
+    
+    >>> for x in RK4(ODE, 0.0, y0, 0.1, 1e6,
+                     events=[SteadyState(ODE, 1e-8)]):
+            print(x)
+    
+    Each evaluation of the event function is an evaluation of the system 
+    of ODEs. A system of ODEs which is already settled at the initial 
+    values is not an occurrence.
+    '''
+    def __init__(self, funcs, tolerance=1e-8,
+                 overflow=1e100, zerodivision=1e100):
+        '''
+        Constructor method.
+        
+        @param funcs: system of differential equations, either as a list 
+        of functions (one per ODE) or as a single function returning a 
+        NumPy array of derivatives (vectorized mode)
+        @type funcs: list or function
+        @param tolerance: tolerance of the largest absolute derivative of 
+        variables. Default = 1e-8.
+        @type tolerance: float
+        @param overflow: value (usually a large value) to assign in event 
+        of over flow error (usually caused by a large number). 
+        Default = 1e100.
+        @type overflow: float
+        @param zerodivision: value (usually a large value) to assign in 
+        event of zero division error, which results in positive infinity. 
+        Default = 1e100.
+        @type zerodivision: float
+        '''
+        functions = {}
+        def settled(x, y):
+            y = np.array(y, dtype=float)
+            if len(y) not in functions:
+                functions[len(y)] = _array_functions(funcs, len(y), None,
+                                                     None, None, overflow,
+                                                     zerodivision)[0]
+            return float(np.max(np.abs(functions[len(y)](x, y)))) - \
+                tolerance
+        Event.__init__(self, settled, terminal=True, direction=-1)
+
+class _Output(object):
+    '''
+    Private class - reduces the results of an ODE solver to results at 
+    requested values of x-axis (output_times) or at every N-th step 
+    (every), and locates events (please see Event class), within the loop 
+    of the solver. The solver gives the variables before and after each 
+    step, and a result ([x] + y) is only built for a step which is given 
+    as a result, or which spans a requested value of x-axis or an 
+    occurrence of an event; hence, no result is built for the other 
+    steps. For example, in the loop of a solver,
+    
+    >>> output = _output(funcs, output_times, every, events, 
+                         overflow, zerodivision, stats)
+    >>> yield from output.first(x0, y0)
+    >>> while x0 < xmax:
+            (x1, y1) = <step from (x0, y0)>
+            yield from output.step(x0, y0, x1, y1)
+            if output.done: return
+            (x0, y0) = (x1, y1)
+    >>> yield from output.last(x0, y0)
+    
+    Results at requested values of x-axis between 2 steps, and the 
+    variables between 2 steps given to event functions to locate an 
+    occurrence, are interpolated by cubic Hermite interpolation using 
+    the derivatives at both steps, which are only evaluated for steps 
+    spanning a requested value or an occurrence. Integration stops after 
+    the last requested value of x-axis, or at the first occurrence of a 
+    terminal event.
+    '''
+    def __init__(self, funcs, output_times, every, events, overflow, 
+                 zerodivision, stats=None):
+        '''
+        Constructor method.
+        
+        @param funcs: system of differential equations
+        @type funcs: list or function
+        @param output_times: values of x-axis for results
+        @type output_times: list
+        @param every: number of steps between results, when output_times 
+        is not given. Results of the first and last steps are always 
+        given.
+        @type every: integer
+        @param events: events to locate. Please see Event class.
+        @type events: list of Event objects
+        @param stats: statistics object to count steps into
+        @type stats: Statistics object
+        '''
+        self.funcs = funcs
+        self.vectorized = callable(funcs)
+        self.overflow = overflow
+        self.zerodivision = zerodivision
+        self.stats = stats
+        self.times = None
+        self.every = None
+        if output_times is not None:
+            self.times = sorted([float(x) for x in output_times])
+        elif every is not None:
+            self.every = max(int(every), 1)
+        if isinstance(events, Event): events = [events]
+        self.events = list(events or [])
+        self.index = 0
+        self.count = 0
+        self.pending = False
+        self.done = False
+        self.g0 = None
+        # Derivatives at the end of the previous step, which are reused 
+        # at the start of the next step
+        self.derivative_x = None
+        self.derivative_f = None
+    def row(self, x, y):
+        '''
+        Builds a result ([x] + y) of the same type as the results of the 
+        solver - NumPy array in vectorized mode, or list in list mode.
+        '''
+        if self.vectorized:
+            r = np.empty(len(y) + 1)
+            r[0] = x
+            r[1:] = y
+            return r
+        if isinstance(y, np.ndarray): return [x] + y.tolist()
+        return [x] + y
+    def values(self, y):
+        '''
+        Gives the variables to event functions, as a list in list mode.
+        '''
+        if not self.vectorized and isinstance(y, np.ndarray): 
+            return y.tolist()
+        return y
+    def derivative(self, row):
+        '''
+        Evaluates the derivatives of variables at a result.
+        '''
+        if row[0] == self.derivative_x: return self.derivative_f
+        return _derivative(self.funcs, row[0], row[1:], 
+                           self.overflow, self.zerodivision)
+    def first(self, x, y):
+        '''
+        Gives the results at the initial values (x, y) of integration.
+        
+        @return: list of results
+        '''
+        # occurrences are of the current integration only
+        for event in self.events: event.occurrences = []
+        if self.events:
+            self.g0 = [event.function(x, self.values(y)) 
+                       for event in self.events]
+        if self.times is None: return [self.row(x, y)]
+        # Requested values of x-axis before the first step are skipped
+        while self.index < len(self.times) and self.times[self.index] < x:
+            self.index = self.index + 1
+        results = []
+        while self.index < len(self.times) and self.times[self.index] == x:
+            results.append(self.row(x, y))
+            self.index = self.index + 1
+        if self.index >= len(self.times): self.done = True
+        return results
+    def step(self, x0, y0, x1, y1):
+        '''
+        Gives the results of a step from (x0, y0) to (x1, y1), where done 
+        attribute is set to True if integration is to be stopped after 
+        the step.
+        
+        @return: list of results, which is empty for most steps
+        '''
+        if self.stats is not None:
+            self.stats.accepted_steps = self.stats.accepted_steps + 1
+        if self.events:
+            return self.locate(x0, y0, x1, y1)
+        if self.every is not None:
+            self.count = self.count + 1
+            if self.count % self.every:
+                self.pending = True
+                return ()
+            self.pending = False
+            return [self.row(x1, y1)]
+        if self.times is None: return [self.row(x1, y1)]
+        if self.times[self.index] > x1: return ()
+        return self.reduce(self.row(x0, y0), None, self.row(x1, y1), None)
+    def last(self, x, y):
+        '''
+        Gives the result of the last step (x, y) of integration, if it 
+        has not been given.
+        
+        @return: list of results
+        '''
+        if not self.pending: return ()
+        self.pending = False
+        return [self.row(x, y)]
+    def locate(self, x0, y0, x1, y1):
+        '''
+        Locates the occurrences of events in a step, where a change of 
+        sign of an event function is located by Brent's method 
+        (nrpy.zbrent), and gives the results of the step, which ends at 
+        the first occurrence of a terminal event.
+        
+        @return: list of results
+        '''
+        events = self.events
+        g0 = self.g0
+        g1 = [event.function(x1, self.values(y1)) for event in events]
+        self.g0 = g1
+        crossed = [i for i in range(len(events)) 
+                   if events[i].crossed(g0[i], g1[i])]
+        row0 = self.row(x0, y0)
+        row1 = self.row(x1, y1)
+        f0 = None
+        f1 = None
+        found = []
+        for i in crossed:
+            if g1[i] == 0.0:
+                found.append((x1, i))
+                continue
+            if f0 is None:
+                f0 = self.derivative(row0)
+                f1 = self.derivative(row1)
+            function = events[i].function
+            def g(x):
+                return function(x, _hermite(row0, f0, row1, f1, x)[1:])
+            x = nrpy.zbrent(g, x0, x1, events[i].tolerance)
+            found.append((x, i))
+        found.sort(key=lambda occurrence: occurrence[0])
+        for (x, i) in found:
+            if x == x1: event_row = row1
+            else: event_row = _hermite(row0, f0, row1, f1, x)
+            events[i].occurrences.append(event_row)
+            if events[i].terminal:
+                self.done = True
+                if event_row is not row1: (row1, f1) = (event_row, None)
+                break
+        return self.reduce(row0, f0, row1, f1)
+    def reduce(self, row0, f0, row1, f1):
+        '''
+        Gives the results of a step from result row0 to result row1, with 
+        derivatives f0 and f1 at the results if they have been evaluated 
+        (or None otherwise).
+        
+        @return: list of results
+        '''
+        if self.every is not None:
+            self.count = self.count + 1
+            if self.count % self.every and not self.done:
+                self.pending = True
+                return ()
+            self.pending = False
+            return [row1]
+        if self.times is None: return [row1]
+        results = []
+        times = self.times
+        while self.index < len(times) and times[self.index] <= row1[0]:
+            if times[self.index] == row1[0]:
+                results.append(row1)
+            else:
+                if f0 is None: f0 = self.derivative(row0)
+                if f1 is None: f1 = self.derivative(row1)
+                results.append(_hermite(row0, f0, row1, f1, 
+                                        times[self.index]))
+            self.index = self.index + 1
+        if self.index >= len(times): self.done = True
+        if f1 is not None: 
+            (self.derivative_x, self.derivative_f) = (row1[0], f1)
+        return results
+
+def _output(funcs, output_times, every, events, overflow, zerodivision, 
+            stats=None):
+    '''
+    Private function - called by ODE solvers to give the reduction of 
+    results and location of events within the loop of the solver (please 
+    see _Output class), or None if all results are given and no event is 
+    located.
+    
+    @return: _Output object or None
+    '''
+    if output_times is None and every is None and not events: return None
+    return _Output(funcs, output_times, every, events, overflow, 
+                   zerodivision, stats)
+
+class Statistics(object):
+    '''
+    Class for opt-in statistics of integration of ODEs, which is given to 
+    ODE solvers as stats parameter. For example,
+    
+    >>> stats = ode.Statistics()
+    >>> results = list(ode.DP54(ODE, 0.0, y, 0.1, 100.0, stats=stats))
+    >>> print(stats)
+    
+    The following statistics are accumulated over all integrations with 
+    the same Statistics object:
+        - rhs_evaluations: number of evaluations of the system of ODEs (in 
+        list mode, an evaluation of all functions in funcs is counted as 1 
+        evaluation)
+        - accepted_steps: number of steps performed
+        - rejected_steps: number of steps rejected by adaptive solvers
+        - boundary_corrections: number of variable values reset by lower 
+        or upper boundaries
+        - fallbacks: dictionary of the number of times that values for 
+        zero division (ZeroDivisionError) or over flow (OverflowError) are 
+        used, or zero is used (TypeError), in list mode; and the number of 
+        evaluations with non-finite derivatives (nonfinite) in vectorized 
+        mode
+        - rhs_time: time (in seconds) spent in the system of ODEs
+        - nonODEfunc_time: time (in seconds) spent in nonODEfunc
+        - boundary_time: time (in seconds) spent in boundary checking
+        - total_time: time (in seconds) spent in ODE solver, excluding the 
+        time spent by the consumer of results
+    
+    Statistics are collected by wrapping the system of ODEs, nonODEfunc 
+    and boundaries, and the ODE solver is not modified. Hence, there is no 
+    overhead when statistics are not requested. An integration with 
+    statistics gives the same results as that without statistics.
+    '''
+    def __init__(self):
+        '''
+        Constructor method.
+        '''
+        self.rhs_evaluations = 0
+        self.accepted_steps = 0
+        self.rejected_steps = 0
+        self.boundary_corrections = 0
+        self.fallbacks = {'ZeroDivisionError': 0, 
+                          'OverflowError': 0,
+                          'TypeError': 0, 
+                          'nonfinite': 0}
+        self.rhs_time = 0.0
+        self.nonODEfunc_time = 0.0
+        self.boundary_time = 0.0
+        self.total_time = 0.0
+        self.running = False
+    def report(self):
+        '''
+        Gives the statistics as a dictionary.
+        
+        @return: dictionary of statistics
+        '''
+        return {'rhs_evaluations': self.rhs_evaluations,
+                'accepted_steps': self.accepted_steps,
+                'rejected_steps': self.rejected_steps,
+                'boundary_corrections': self.boundary_corrections,
+                'fallbacks': dict(self.fallbacks),
+                'rhs_time': self.rhs_time,
+                'nonODEfunc_time': self.nonODEfunc_time,
+                'boundary_time': self.boundary_time,
+                'total_time': self.total_time}
+    def __str__(self):
+        return '\n'.join(['%s: %s' % (k, str(v)) 
+                          for (k, v) in self.report().items()])
+    def wrap_function(self, function, index):
+        '''
+        Wraps an ODE (in list mode) to count evaluations and fallbacks, 
+        and time the evaluations.
+        '''
+        def wrapped(x, y):
+            if index == 0: 
+                self.rhs_evaluations = self.rhs_evaluations + 1
+            start = time.perf_counter()
+            try: 
+                return function(x, y)
+            except (ZeroDivisionError, OverflowError, TypeError) as e:
+                if isinstance(e, ZeroDivisionError): 
+                    name = 'ZeroDivisionError'
+                elif isinstance(e, OverflowError): 
+                    name = 'OverflowError'
+                else: 
+                    name = 'TypeError'
+                self.fallbacks[name] = self.fallbacks[name] + 1
+                raise
+            finally:
+                self.rhs_time = self.rhs_time + \
+                    (time.perf_counter() - start)
+        wrapped.__wrapped__ = function
+        return wrapped
+    def wrap_system(self, funcs):
+        '''
+        Wraps a system of ODEs (in list or vectorized mode) to count 
+        evaluations and fallbacks, and time the evaluations.
+        '''
+        if not callable(funcs):
+            return [self.wrap_function(funcs[i], i) 
+                    for i in range(len(funcs))]
+        def wrapped(x, y):
+            self.rhs_evaluations = self.rhs_evaluations + 1
+            start = time.perf_counter()
+            try:
+                # floating-point error state of the solver (please see 
+                # _ZeroDivision) is kept, so that statistics do not 
+                # change the results
+                f = funcs(x, y)
+                if not np.isfinite(f).all():
+                    self.fallbacks['nonfinite'] = \
+                        self.fallbacks['nonfinite'] + 1
+                return f
+            finally:
+                self.rhs_time = self.rhs_time + \
+                    (time.perf_counter() - start)
+        wrapped.__wrapped__ = funcs
+        return wrapped
+    def bound(self, y, boundary, type):
+        '''
+        Boundary checking (please see boundary_checker) with counting of 
+        corrections.
+        '''
+        for k in list(boundary.keys()):
+            i = int(k)
+            if (type == 'lower' and y[i] < boundary[k][0]) or \
+                (type == 'upper' and y[i] > boundary[k][0]):
+                y[i] = boundary[k][1]
+                self.boundary_corrections = self.boundary_corrections + 1
+        return y
+    def wrap_modifier(self, nonODEfunc, lower_bound, upper_bound):
+        '''
+        Wraps nonODEfunc and boundary checking, which are performed in 
+        that order after every step by ODE solvers, into a single function 
+        to time nonODEfunc and count boundary corrections.
+        '''
+        if not nonODEfunc and not lower_bound and not upper_bound:
+            return None
+        def wrapped(y, step):
+            if nonODEfunc:
+                start = time.perf_counter()
+                y = nonODEfunc(y, step)
+                self.nonODEfunc_time = self.nonODEfunc_time + \
+                    (time.perf_counter() - start)
+            start = time.perf_counter()
+            if lower_bound: y = self.bound(y, lower_bound, 'lower')
+            if upper_bound: y = self.bound(y, upper_bound, 'upper')
+            self.boundary_time = self.boundary_time + \
+                (time.perf_counter() - start)
+            return y
+        return wrapped
+    def run(self, solver, funcs, x0, y0, step, xmax, nonODEfunc=None,
+            lower_bound=None, upper_bound=None, 
+            overflow=1e100, zerodivision=1e100, 
+            output_times=None, every=None, events=None, **keywords):
+        '''
+        Generator to run an ODE solver with collection of statistics. 
+        Called by ODE solvers when stats parameter is given.
+        
+        @param solver: ODE solver
+        @type solver: function
+        @param keywords: other parameters of ODE solver, such as rtol 
+        and atol of adaptive solvers
+        @return: generator of [x] + y
+        '''
+        system = self.wrap_system(funcs)
+        modifier = self.wrap_modifier(nonODEfunc, lower_bound, upper_bound)
+        # the solver is given a running view of the statistics for this 
+        # integration only; hence, other integrations with the same 
+        # statistics, such as interleaved generators, are also counted
+        rows = solver(system, x0, y0, step, xmax, modifier, None, None, 
+                      overflow, zerodivision, output_times=output_times, 
+                      every=every, events=events, 
+                      stats=_RunningStatistics(self), **keywords)
+        # steps are counted by the solver (please see _Output class) when 
+        # results are reduced or events are located
+        if output_times is None and every is None and not events:
+            rows = self.count_steps(rows)
+        while True:
+            start = time.perf_counter()
+            try: 
+                row = next(rows)
+            except StopIteration:
+                return
+            finally:
+                self.total_time = self.total_time + \
+                    (time.perf_counter() - start)
+            yield row
+    def count_steps(self, rows):
+        '''
+        Generator to count the steps performed (results after the initial 
+        values) from an ODE solver.
+        '''
+        first = True
+        for row in rows:
+            if first: first = False
+            else: self.accepted_steps = self.accepted_steps + 1
+            yield row
+
+class _RunningStatistics(object):
+    '''
+    Private class - view of a Statistics object given by Statistics.run to 
+    the ODE solver of an integration, which marks the integration as 
+    already collecting statistics (running is True), so that the solver 
+    does not run itself again with collection of statistics. All other 
+    attributes are of the Statistics object; hence, all integrations with 
+    the same Statistics object, including interleaved generators, are 
+    counted in it.
+    '''
+    running = True
+    def __init__(self, stats):
+        '''
+        Constructor method.
+        
+        @param stats: statistics of integration
+        @type stats: Statistics object
+        '''
+        object.__setattr__(self, 'stats', stats)
+    def __getattr__(self, name):
+        return getattr(self.stats, name)
+    def __setattr__(self, name, value):
+        setattr(self.stats, name, value)
+
 def Euler(funcs, x0, y0, step, xmax, nonODEfunc=None,
           lower_bound=None, upper_bound=None,
-          overflow=1e100, zerodivision=1e100):
+          overflow=1e100, zerodivision=1e100,
+          output_times=None, every=None, events=None,
+          stats=None):
     '''
     Generator to integrate a system of ODEs, y0' = funcs(x0, y0), using 
     Euler method.
@@ -66,8 +903,10 @@ def Euler(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -90,8 +929,38 @@ def Euler(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(Euler, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['Euler'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         y1 = [0]*n
@@ -101,21 +970,30 @@ def Euler(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y0[i] = zerodivision
             except OverflowError: y0[i] = overflow
         return y1
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y1 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y1 = boundary_checker(y1, lower_bound, 'lower')
-        if upper_bound: 
-            y1 = boundary_checker(y1, upper_bound, 'upper')
+        if lower: 
+            y1 = _list_boundary(y1, lower, 'lower')
+        if upper: 
+            y1 = _list_boundary(y1, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y1
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
 
 def Heun(funcs, x0, y0, step, xmax, nonODEfunc=None,
          lower_bound=None, upper_bound=None,
-         overflow=1e100, zerodivision=1e100):
+         overflow=1e100, zerodivision=1e100,
+         output_times=None, every=None, events=None,
+         stats=None):
     '''
     Generator to integrate a system of ODEs, y0' = funcs(x0, y0), using Heun's 
     method, which is also known as Runge-Kutta 2nd method or Trapezoidal method.
@@ -144,8 +1022,10 @@ def Heun(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -168,8 +1048,38 @@ def Heun(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(Heun, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['Heun'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         f1 = [0]*n
@@ -190,21 +1100,30 @@ def Heun(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y2[i] = zerodivision
             except OverflowError: y2[i] = overflow
         return y2
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y2 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y2 = boundary_checker(y2, lower_bound, 'lower')
-        if upper_bound: 
-            y2 = boundary_checker(y2, upper_bound, 'upper')
+        if lower: 
+            y2 = _list_boundary(y2, lower, 'lower')
+        if upper: 
+            y2 = _list_boundary(y2, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y2
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
     
 def RK3(funcs, x0, y0, step, xmax, nonODEfunc=None,
         lower_bound=None, upper_bound=None,
-        overflow=1e100, zerodivision=1e100):
+        overflow=1e100, zerodivision=1e100,
+        output_times=None, every=None, events=None,
+        stats=None):
     '''
     Generator to integrate a system of ODEs, y0' = funcs(x0, y0), using third
     order Runge-Kutta method.
@@ -233,8 +1152,10 @@ def RK3(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -257,8 +1178,38 @@ def RK3(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(RK3, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['RK3'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         f1, f2, f3 = [0]*n, [0]*n, [0]*n
@@ -289,21 +1240,30 @@ def RK3(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y1[i] = zerodivision
             except OverflowError: y1[i] = overflow
         return y1
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y1 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y1 = boundary_checker(y1, lower_bound, 'lower')
-        if upper_bound: 
-            y1 = boundary_checker(y1, upper_bound, 'upper')
+        if lower: 
+            y1 = _list_boundary(y1, lower, 'lower')
+        if upper: 
+            y1 = _list_boundary(y1, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y1
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
         
 def RK4(funcs, x0, y0, step, xmax, nonODEfunc=None,
         lower_bound=None, upper_bound=None,
-        overflow=1e100, zerodivision=1e100):
+        overflow=1e100, zerodivision=1e100,
+        output_times=None, every=None, events=None,
+        stats=None):
     '''
     Generator to integrate a system of ODEs, y' = f(x, y), using fourth
     order Runge-Kutta method.
@@ -332,8 +1292,10 @@ def RK4(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -356,8 +1318,38 @@ def RK4(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(RK4, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['RK4'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         f1, f2, f3, f4 = [0]*n, [0]*n, [0]*n, [0]*n
@@ -395,21 +1387,30 @@ def RK4(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y1[i] = zerodivision
             except OverflowError: y1[i] = overflow
         return y1
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y1 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y1 = boundary_checker(y1, lower_bound, 'lower')
-        if upper_bound: 
-            y1 = boundary_checker(y1, upper_bound, 'upper')
+        if lower: 
+            y1 = _list_boundary(y1, lower, 'lower')
+        if upper: 
+            y1 = _list_boundary(y1, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y1
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
         
 def RK38(funcs, x0, y0, step, xmax, nonODEfunc=None,
         lower_bound=None, upper_bound=None,
-        overflow=1e100, zerodivision=1e100):
+        overflow=1e100, zerodivision=1e100,
+        output_times=None, every=None, events=None,
+        stats=None):
     '''
     Generator to integrate a system of ODEs, y' = f(x, y), using fourth
     order Runge-Kutta method, 3/8 rule.
@@ -438,8 +1439,10 @@ def RK38(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -462,8 +1465,38 @@ def RK38(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(RK38, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['RK38'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         f1, f2, f3, f4 = [0]*n, [0]*n, [0]*n, [0]*n
@@ -501,21 +1534,30 @@ def RK38(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y1[i] = zerodivision
             except OverflowError: y1[i] = overflow
         return y1
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y1 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y1 = boundary_checker(y1, lower_bound, 'lower')
-        if upper_bound: 
-            y1 = boundary_checker(y1, upper_bound, 'upper')
+        if lower: 
+            y1 = _list_boundary(y1, lower, 'lower')
+        if upper: 
+            y1 = _list_boundary(y1, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y1
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
 
 def CK4(funcs, x0, y0, step, xmax, nonODEfunc=None,
         lower_bound=None, upper_bound=None,
-        overflow=1e100, zerodivision=1e100):
+        overflow=1e100, zerodivision=1e100,
+        output_times=None, every=None, events=None,
+        stats=None):
     '''
     Generator to integrate a system of ODEs, y' = f(x, y), using fourth 
     order Cash-Karp method.
@@ -544,8 +1586,10 @@ def CK4(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -568,8 +1612,38 @@ def CK4(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(CK4, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['CK4'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         f1, f2, f3, f4, f5, f6 = [0]*n, [0]*n, [0]*n, [0]*n, [0]*n, [0]*n
@@ -627,21 +1701,30 @@ def CK4(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y1[i] = zerodivision
             except OverflowError: y1[i] = overflow
         return y1
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y1 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y1 = boundary_checker(y1, lower_bound, 'lower')
-        if upper_bound: 
-            y1 = boundary_checker(y1, upper_bound, 'upper')
+        if lower: 
+            y1 = _list_boundary(y1, lower, 'lower')
+        if upper: 
+            y1 = _list_boundary(y1, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y1
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
         
 def CK5(funcs, x0, y0, step, xmax, nonODEfunc=None,
         lower_bound=None, upper_bound=None,
-        overflow=1e100, zerodivision=1e100):
+        overflow=1e100, zerodivision=1e100,
+        output_times=None, every=None, events=None,
+        stats=None):
     '''
     Generator to integrate a system of ODEs, y' = f(x, y), using fifth 
     order Cash-Karp method.
@@ -670,8 +1753,10 @@ def CK5(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -694,8 +1779,38 @@ def CK5(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(CK5, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['CK5'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         f1, f2, f3, f4, f5, f6 = [0]*n, [0]*n, [0]*n, [0]*n, [0]*n, [0]*n
@@ -752,21 +1867,30 @@ def CK5(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y1[i] = zerodivision
             except OverflowError: y1[i] = overflow
         return y1
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y1 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y1 = boundary_checker(y1, lower_bound, 'lower')
-        if upper_bound: 
-            y1 = boundary_checker(y1, upper_bound, 'upper')
+        if lower: 
+            y1 = _list_boundary(y1, lower, 'lower')
+        if upper: 
+            y1 = _list_boundary(y1, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y1
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
         
 def RKF4(funcs, x0, y0, step, xmax, nonODEfunc=None,
         lower_bound=None, upper_bound=None,
-        overflow=1e100, zerodivision=1e100):
+        overflow=1e100, zerodivision=1e100,
+        output_times=None, every=None, events=None,
+        stats=None):
     '''
     Generator to integrate a system of ODEs, y' = f(x, y), using fourth 
     order Runge-Kutta-Fehlberg method.
@@ -795,8 +1919,10 @@ def RKF4(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -819,8 +1945,38 @@ def RKF4(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(RKF4, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['RKF4'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         f1, f2, f3, f4, f5, f6 = [0]*n, [0]*n, [0]*n, [0]*n, [0]*n, [0]*n
@@ -878,21 +2034,30 @@ def RKF4(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y1[i] = zerodivision
             except OverflowError: y1[i] = overflow
         return y1
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y1 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y1 = boundary_checker(y1, lower_bound, 'lower')
-        if upper_bound: 
-            y1 = boundary_checker(y1, upper_bound, 'upper')
+        if lower: 
+            y1 = _list_boundary(y1, lower, 'lower')
+        if upper: 
+            y1 = _list_boundary(y1, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y1
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
       
 def RKF5(funcs, x0, y0, step, xmax, nonODEfunc=None,
         lower_bound=None, upper_bound=None,
-        overflow=1e100, zerodivision=1e100):
+        overflow=1e100, zerodivision=1e100,
+        output_times=None, every=None, events=None,
+        stats=None):
     '''
     Generator to integrate a system of ODEs, y' = f(x, y), using fifth 
     order Runge-Kutta-Fehlberg method.
@@ -921,8 +2086,10 @@ def RKF5(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -945,8 +2112,38 @@ def RKF5(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(RKF5, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['RKF5'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         f1, f2, f3, f4, f5, f6 = [0]*n, [0]*n, [0]*n, [0]*n, [0]*n, [0]*n
@@ -1006,21 +2203,30 @@ def RKF5(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y1[i] = zerodivision
             except OverflowError: y1[i] = overflow
         return y1
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y1 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y1 = boundary_checker(y1, lower_bound, 'lower')
-        if upper_bound: 
-            y1 = boundary_checker(y1, upper_bound, 'upper')
+        if lower: 
+            y1 = _list_boundary(y1, lower, 'lower')
+        if upper: 
+            y1 = _list_boundary(y1, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y1
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
         
 def DP4(funcs, x0, y0, step, xmax, nonODEfunc=None,
         lower_bound=None, upper_bound=None,
-        overflow=1e100, zerodivision=1e100):
+        overflow=1e100, zerodivision=1e100,
+        output_times=None, every=None, events=None,
+        stats=None):
     '''
     Generator to integrate a system of ODEs, y' = f(x, y), using fourth 
     order Dormand-Prince method.
@@ -1049,8 +2255,10 @@ def DP4(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -1073,8 +2281,38 @@ def DP4(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(DP4, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['DP4'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         f1, f2, f3 = [0]*n, [0]*n, [0]*n
@@ -1144,21 +2382,30 @@ def DP4(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y1[i] = zerodivision
             except OverflowError: y1[i] = overflow
         return y1
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y1 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y1 = boundary_checker(y1, lower_bound, 'lower')
-        if upper_bound: 
-            y1 = boundary_checker(y1, upper_bound, 'upper')
+        if lower: 
+            y1 = _list_boundary(y1, lower, 'lower')
+        if upper: 
+            y1 = _list_boundary(y1, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y1
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
         
 def DP5(funcs, x0, y0, step, xmax, nonODEfunc=None,
         lower_bound=None, upper_bound=None,
-        overflow=1e100, zerodivision=1e100):
+        overflow=1e100, zerodivision=1e100,
+        output_times=None, every=None, events=None,
+        stats=None):
     '''
     Generator to integrate a system of ODEs, y' = f(x, y), using fifth 
     order Dormand-Prince method.
@@ -1187,8 +2434,10 @@ def DP5(funcs, x0, y0, step, xmax, nonODEfunc=None,
     value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
     the original y[0] value is negative.
     
-    @param funcs: system of differential equations
-    @type funcs: list
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
     @param x0: initial value of x-axis, which is usually starting time
     @type x0: float
     @param y0: initial values for variables
@@ -1211,8 +2460,38 @@ def DP5(funcs, x0, y0, step, xmax, nonODEfunc=None,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
     '''
-    yield [x0] + y0
+    if stats is not None and not stats.running:
+        yield from stats.run(DP5, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs):
+        yield from _vector_solver(_fixed_tableau['DP5'], funcs, x0, y0, 
+                                  step, xmax, nonODEfunc, 
+                                  lower_bound, upper_bound, 
+                                  overflow, zerodivision, output=output)
+        return
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
     def solver(funcs, x0, y0, step):
         n = len(funcs)
         f1, f2, f3 = [0]*n, [0]*n, [0]*n
@@ -1282,161 +2561,3213 @@ def DP5(funcs, x0, y0, step, xmax, nonODEfunc=None,
             except ZeroDivisionError: y1[i] = zerodivision
             except OverflowError: y1[i] = overflow
         return y1
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
     while x0 < xmax:
         y1 = solver(funcs, x0, y0, step)
         if nonODEfunc:
             y1 = nonODEfunc(y1, step)
-        if lower_bound: 
-            y1 = boundary_checker(y1, lower_bound, 'lower')
-        if upper_bound: 
-            y1 = boundary_checker(y1, upper_bound, 'upper')
+        if lower: 
+            y1 = _list_boundary(y1, lower, 'lower')
+        if upper: 
+            y1 = _list_boundary(y1, upper, 'upper')
+        (xp, yp) = (x0, y0)
         y0 = y1
         x0 = x0 + step
-        yield [x0] + y0
+        if output is None: yield [x0] + y0
+        else:
+            yield from output.step(xp, yp, x0, y0)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y0)
 
-def _equation_constructor(expressions={},
-                          parameters={},
-                          variables=[]):
+# Butcher tableaus of embedded Runge-Kutta pairs used by the adaptive 
+# solvers. For each pair, 'c' is the list of nodes, 'a' is the list of 
+# stage coefficients (one list per stage), 'b' is the list of weights for 
+# the propagated (higher order) solution, 'bhat' is the list of weights 
+# for the embedded (lower order) solution, 'order' is the order of the 
+# embedded solution, and 'fsal' indicates that the last stage is evaluated 
+# at the propagated solution and can be reused as the first stage of the 
+# next step (First Same As Last).
+_embedded_tableau = {
+    'RKF45': {'c': [0.0, 1/4.0, 3/8.0, 12/13.0, 1.0, 1/2.0],
+              'a': [[],
+                    [1/4.0],
+                    [3/32.0, 9/32.0],
+                    [1932/2197.0, -7200/2197.0, 7296/2197.0],
+                    [439/216.0, -8.0, 3680/513.0, -845/4104.0],
+                    [-8/27.0, 2.0, -3544/2565.0, 1859/4104.0, 
+                     -11/40.0]],
+              'b': [16/135.0, 0.0, 6656/12825.0, 28561/56430.0, 
+                    -9/50.0, 2/55.0],
+              'bhat': [25/216.0, 0.0, 1408/2565.0, 2197/4104.0, 
+                       -1/5.0, 0.0],
+              'order': 4,
+              'fsal': False},
+    'CK45': {'c': [0.0, 1/5.0, 3/10.0, 3/5.0, 1.0, 7/8.0],
+             'a': [[],
+                   [1/5.0],
+                   [3/40.0, 9/40.0],
+                   [3/10.0, -9/10.0, 6/5.0],
+                   [-11/54.0, 5/2.0, -70/27.0, 35/27.0],
+                   [1631/55296.0, 175/512.0, 575/13824.0, 
+                    44275/110592.0, 253/4096.0]],
+             'b': [37/378.0, 0.0, 250/621.0, 125/594.0, 0.0, 
+                   512/1771.0],
+             'bhat': [2825/27648.0, 0.0, 18575/48384.0, 13525/55296.0, 
+                      277/14336.0, 1/4.0],
+             'order': 4,
+             'fsal': False},
+    'DP54': {'c': [0.0, 1/5.0, 3/10.0, 4/5.0, 8/9.0, 1.0, 1.0],
+             'a': [[],
+                   [1/5.0],
+                   [3/40.0, 9/40.0],
+                   [44/45.0, -56/15.0, 32/9.0],
+                   [19372/6561.0, -25360/2187.0, 64448/6561.0, 
+                    -212/729.0],
+                   [9017/3168.0, -355/33.0, 46732/5247.0, 49/176.0, 
+                    -5103/18656.0],
+                   [35/384.0, 0.0, 500/1113.0, 125/192.0, 
+                    -2187/6784.0, 11/84.0]],
+             'b': [35/384.0, 0.0, 500/1113.0, 125/192.0, -2187/6784.0, 
+                   11/84.0, 0.0],
+             'bhat': [5179/57600.0, 0.0, 7571/16695.0, 393/640.0, 
+                      -92097/339200.0, 187/2100.0, 1/40.0],
+             'order': 4,
+             'fsal': True}
+    }
+
+# Butcher tableaus of the fixed step solvers, used in vectorized mode. The 
+# keys are as in _embedded_tableau; fourth and fifth order Cash-Karp, 
+# Runge-Kutta-Fehlberg and Dormand-Prince methods use the corresponding 
+# weights of the embedded pairs.
+_fixed_tableau = {
+    'Euler': {'c': [0.0], 'a': [[]], 'b': [1.0]},
+    'Heun': {'c': [0.0, 1.0], 
+             'a': [[], [1.0]], 
+             'b': [0.5, 0.5]},
+    'RK3': {'c': [0.0, 0.5, 1.0], 
+            'a': [[], [0.5], [-1.0, 2.0]], 
+            'b': [1/6.0, 4/6.0, 1/6.0]},
+    'RK4': {'c': [0.0, 0.5, 0.5, 1.0], 
+            'a': [[], [0.5], [0.0, 0.5], [0.0, 0.0, 1.0]], 
+            'b': [1/6.0, 2/6.0, 2/6.0, 1/6.0]},
+    'RK38': {'c': [0.0, 1/3.0, 2/3.0, 1.0], 
+             'a': [[], [1/3.0], [-1/3.0, 1.0], [1.0, -1.0, 1.0]], 
+             'b': [1/8.0, 3/8.0, 3/8.0, 1/8.0]},
+    'CK4': {'c': _embedded_tableau['CK45']['c'],
+            'a': _embedded_tableau['CK45']['a'],
+            'b': _embedded_tableau['CK45']['bhat']},
+    'CK5': {'c': _embedded_tableau['CK45']['c'],
+            'a': _embedded_tableau['CK45']['a'],
+            'b': _embedded_tableau['CK45']['b']},
+    'RKF4': {'c': _embedded_tableau['RKF45']['c'],
+             'a': _embedded_tableau['RKF45']['a'],
+             'b': _embedded_tableau['RKF45']['bhat']},
+    'RKF5': {'c': _embedded_tableau['RKF45']['c'],
+             'a': _embedded_tableau['RKF45']['a'],
+             'b': _embedded_tableau['RKF45']['b']},
+    'DP4': {'c': _embedded_tableau['DP54']['c'],
+            'a': _embedded_tableau['DP54']['a'],
+            'b': _embedded_tableau['DP54']['bhat']},
+    'DP5': {'c': _embedded_tableau['DP54']['c'][:6],
+            'a': _embedded_tableau['DP54']['a'][:6],
+            'b': _embedded_tableau['DP54']['b'][:6]}
+    }
+
+def _error_norm(error, y0, y1, rtol, atol):
     '''
-    Private function to support ODE_constructor to generate ODE function 
-    for each ODE.
+    Private function - called by adaptive ODE solvers to calculate the 
+    root-mean-square of the local error estimates, where each error 
+    estimate is scaled by (atol + rtol * max(|y0|, |y1|)). A value of 1.0 
+    or less indicates that the step is within tolerance.
     
-    @param expressions: dictionary of expressions for ODE(s). Please see 
-    above documentation. 
-    @param parameters: dictionary of parameter values to be substituted 
-    into the ODE equations
-    @param variables: list of additional variables to be tagged for 
-    substitution(s)
-    @return: tuple of (<list of generated ODE functions>, <list of tagged 
-    variables>) 
+    @param error: local error estimates of each variable
+    @type error: list
+    @param y0: values for variables at the start of the step
+    @type y0: list
+    @param y1: values for variables at the end of the step
+    @type y1: list
+    @param rtol: relative tolerance
+    @type rtol: float
+    @param atol: absolute tolerance
+    @type atol: float
+    @return: scaled error norm
+    @rtype: float
     '''
-    statements = []
-    # Generate ODE function, one at a time
-    for name in expressions.keys():
-        # Generate ODE function definition
-        stmt = '\ndef %s(t, y):' % str(name)
-        expression = expressions[name]
-        if type(expression) == type(''): expression = [expression]
-        count = 1
-        # Generate list of expression(s) for current ODE function
-        exp_list = []
-        variables = list(set(list(variables) + list(expressions.keys())))
-        for exp in expression:
-            # Substitute parameter/variable values 
-            for k in parameters.keys():
-                exp = exp.replace(str(k), str(parameters[k]))
-            #variables = list(set(variables + expressions.keys()))
-            
-            for v in variables:
-                exp = exp.replace(str(v), 'v@'+str(v))
-            # Generate expression codes
-            stmt = stmt + '\n    exp_%s = %s' % (str(count), str(exp))
-            exp_list.append('exp_%s' % str(count))
-            count = count + 1
-        # Compile generated expressions into return value
-        return_stmt = '\n    return ' + ' + '.join(exp_list)
-        stmt = stmt + return_stmt
-        statements.append(stmt)
-    return (statements, variables)
+    n = len(error)
+    total = 0.0
+    for i in range(n):
+        scale = atol + rtol * max(abs(y0[i]), abs(y1[i]))
+        total = total + (error[i] / scale) ** 2
+    return (total / n) ** 0.5
 
-def _modifying_constructor(modifying_expressions):
+def _embedded_solver(tableau, funcs, x0, y0, step, xmax, nonODEfunc,
+                     lower_bound, upper_bound, overflow, zerodivision,
+                     rtol, atol, stats=None, output=None):
     '''
-    Private function to support ODE_constructor to generate function code 
-    for modifying expressions.
+    Private generator - called by adaptive ODE solvers (RKF45, CK45 and 
+    DP54) to integrate a system of ODEs using an embedded Runge-Kutta pair. 
+    Both solutions of the pair are calculated from one set of stage 
+    evaluations and their difference is used as the local error estimate 
+    to accept or reject the step and to choose the next step size.
     
-    @param modifying_expressions: list of expressions to modify the 
-    variables
-    @return: generated function code
+    Variables in y0 without a corresponding ODE in funcs are carried along 
+    unchanged.
+    
+    @param tableau: Butcher tableau of the embedded pair (please see 
+    _embedded_tableau)
+    @type tableau: dictionary
+    @param stats: statistics object to count rejected steps into
+    @type stats: Statistics object
+    @param output: reduction of results and location of events (please 
+    see _Output class), or None for results at every accepted step
+    @type output: _Output object
+    @return: generator of [x] + y at every accepted step
     '''
-    stmt = '\ndef modifying_expression(y, step):'
-    for exp in modifying_expressions:
-        stmt = stmt + '\n    %s' % str(exp)
-    stmt = stmt + '\n    return y'
-    return stmt
+    c, a, b = tableau['c'], tableau['a'], tableau['b']
+    e = [b[j] - tableau['bhat'][j] for j in range(len(b))]
+    exponent = 1.0 / (tableau['order'] + 1)
+    fsal = tableau['fsal']
+    s = len(c)
+    m = len(funcs)
+    y0 = list(y0)
+    n = len(y0)
+    def evaluate(x, y):
+        f = [0.0]*n
+        for i in range(m):
+            try: f[i] = funcs[i](x, y)
+            except TypeError: pass
+            except ZeroDivisionError: f[i] = zerodivision
+            except OverflowError: f[i] = overflow
+        return f
+    if output is None: yield [x0] + y0
+    else:
+        yield from output.first(x0, y0)
+        if output.done: return
+    h = abs(step)
+    k = [None]*s
+    k[0] = evaluate(x0, y0)
+    rejected = False
+    lower = _compile_list_boundary(lower_bound)
+    upper = _compile_list_boundary(upper_bound)
+    while x0 < xmax:
+        hmin = 16 * 2.2e-16 * max(abs(x0), 1.0)
+        last = (x0 + h) >= xmax
+        if last: h = xmax - x0
+        # Stage evaluations shared by both solutions of the pair
+        for st in range(1, s):
+            y1 = y0[:]
+            for j in range(st):
+                coef = h * a[st][j]
+                if coef:
+                    kj = k[j]
+                    for i in range(n):
+                        y1[i] = y1[i] + coef * kj[i]
+            k[st] = evaluate(x0 + c[st]*h, y1)
+        if not fsal:
+            y1 = y0[:]
+            for j in range(s):
+                coef = h * b[j]
+                if coef:
+                    kj = k[j]
+                    for i in range(n):
+                        y1[i] = y1[i] + coef * kj[i]
+        error = [0.0]*n
+        for j in range(s):
+            coef = h * e[j]
+            if coef:
+                kj = k[j]
+                for i in range(n):
+                    error[i] = error[i] + coef * kj[i]
+        try: 
+            err = _error_norm(error, y0, y1, rtol, atol)
+        except (ZeroDivisionError, OverflowError): 
+            err = float('inf')
+        if err != err: err = float('inf')
+        if err <= 1.0 or h <= hmin:
+            # Step accepted
+            (xp, yp) = (x0, y0)
+            if last: x0 = xmax
+            else: x0 = x0 + h
+            ynew = y1[:]
+            if nonODEfunc:
+                ynew = nonODEfunc(ynew, h)
+            if lower: 
+                ynew = _list_boundary(ynew, lower, 'lower')
+            if upper: 
+                ynew = _list_boundary(ynew, upper, 'upper')
+            if fsal and ynew == y1: 
+                k[0] = k[s-1]
+            else: 
+                k[0] = evaluate(x0, ynew)
+            y0 = ynew
+            if output is None: yield [x0] + y0
+            else:
+                yield from output.step(xp, yp, x0, y0)
+                if output.done: return
+            if err == 0.0: factor = 5.0
+            else: factor = min(5.0, max(0.2, 0.9 * err ** -exponent))
+            if rejected: factor = min(1.0, factor)
+            rejected = False
+        else:
+            # Step rejected - retry with a smaller step
+            if err == float('inf'): factor = 0.2
+            else: factor = max(0.2, 0.9 * err ** -exponent)
+            rejected = True
+            if stats is not None:
+                stats.rejected_steps = stats.rejected_steps + 1
+        h = max(h * factor, hmin)
+    if output is not None: yield from output.last(x0, y0)
 
-def ODE_constructor(scriptfile,
-                    resultsfile,
-                    time=(0.0, 0.1, 100.0),
-                    ODE_solver='RK4',
-                    expressions={},
-                    parameters={},
-                    initial_conditions={},
-                    modifying_expressions=[],
-                    lower_bound=None, 
-                    upper_bound=None,
-                    overflow=1e100, 
-                    zerodivision=1e100):
+def _tableau_arrays(tableau):
     '''
-    Function to construct an ODE simulation script file from given 
-    definitions.
+    Private function - converts a Butcher tableau into NumPy arrays of 
+    nodes, stage coefficients (as a lower triangular matrix) and weights 
+    for vectorized mode.
     
-    For example, the following system of ODEs::
+    @param tableau: Butcher tableau (please see _fixed_tableau)
+    @type tableau: dictionary
+    @return: tuple of (nodes, stage coefficients, weights)
+    '''
+    s = len(tableau['c'])
+    c = np.array(tableau['c'], dtype=float)
+    a = np.zeros((s, s))
+    for st in range(s):
+        a[st, :len(tableau['a'][st])] = tableau['a'][st]
+    b = np.array(tableau['b'], dtype=float)
+    return (c, a, b)
+
+def _vector_solver(tableau, f, x0, y0, step, xmax, nonODEfunc,
+                   lower_bound, upper_bound, overflow, zerodivision,
+                   rtol=None, atol=None, stats=None, output=None):
+    '''
+    Private generator - called by ODE solvers to integrate a system of 
+    ODEs in vectorized mode, where the system of ODEs is given as a single 
+    function, f(x, y), taking an array of variables and returning an 
+    array of derivatives. All stage combinations are NumPy array 
+    operations on buffers allocated once before integration.
     
-        d(human)/dt = birth - zombied - death
-        d(zombie)/dt = zombied + resurrected - destroyed
-        d(dead)/dt = death + destroyed - resurrected
-        
-        birth = 0
-        zombied = 0.0095 * human * zombie
-        death = 0.0001 * human
-        resurrected = 0.0002 * dead
-        destroyed = 0.0003 * human * zombie
-         
-        where initially (t0), 
-         
-        number of humans = 500
-        number of zombies = 0
-        number of dead = 0
-         
-        and with the following boundaries
-         
-        number of humans > 0
-        number of zombies < 10000
-        number of dead < 10000
-         
-        and there is an influx of 5 humans per day into the infected village
+    Non-finite derivatives are replaced after each stage evaluation: NaN 
+    (such as 0/0) by zerodivision and positive or negative infinity (such 
+    as division by zero or overflow) by overflow or -overflow respectively.
     
-    can be specified as 
+    If the tableau is an embedded pair (please see _embedded_tableau), 
+    the step size is controlled adaptively using rtol and atol; otherwise, 
+    fixed step size is used.
     
-    >>> scriptfile = 'zombie_attack.py'
-        resultsfile = 'zombie_data.csv'
-        time = (0.0, 0.1, 100.0)
-        ODE_solver = 'RK4'
-        expressions = {'human': ['birth_rate',
-                                 '- (transmission_rate * human * zombie)',
-                                 '- (death_rate * human)'],
-                       'zombie': ['(transmission_rate * human * zombie)',
-                                  '(resurrection_rate * dead)',
-                                  '- (destroy_rate * human * zombie)'],
-                       'dead': ['(death_rate * human)',
-                                '(destroy_rate * human * zombie)',
-                                '- (resurrection_rate * dead)']}
-        parameters = {'birth_rate': 0.0,           # birth rate
-                      'transmission_rate': 0.0095, # transmission percent   
-                      'death_rate': 0.0001,        # natural death percent  
-                      'resurrection_rate': 0.0002, # resurect percent  
-                      'destroy_rate':0.0003        # destroy percent   
-                      }
-        initial_conditions = {'human': 500.0,
-                              'zombie': 0.0, 
-                              'dead': 0.0}
-        modifying_expression = ['human = human + (5 * step)']
-        lower_bound = {'human': [0.0, 0.0]}
-        upper_bound = {'zombie': [10000.0, 10000.0],
-                       'dead': [10000.0, 10000.0]}
-        overflow = 1e100
-        zerodivision = 1e100
+    @param tableau: Butcher tableau of the method
+    @type tableau: dictionary
+    @param stats: statistics object to count rejected steps into
+    @type stats: Statistics object
+    @param output: reduction of results and location of events (please 
+    see _Output class), or None for results at every step
+    @type output: _Output object
+    @return: generator of NumPy arrays of [x] + y at every step
+    '''
+    (c, a, b) = _tableau_arrays(tableau)
+    adaptive = 'bhat' in tableau
+    if adaptive:
+        e = b - np.array(tableau['bhat'], dtype=float)
+        exponent = 1.0 / (tableau['order'] + 1)
+        fsal = tableau['fsal']
+    s = len(c)
+    y = np.array(y0, dtype=float)
+    n = len(y)
+    lower = _compile_boundary(lower_bound)
+    upper = _compile_boundary(upper_bound)
+    # Preallocated buffers for stages, stage variables and error estimate
+    k = np.empty((s, n))
+    ytemp = np.empty(n)
+    y1 = np.empty(n)
+    error = np.empty(n)
+    scale = np.empty(n)
+    division = _ZeroDivision()
+    def evaluate(x, yv, out):
+        with division.errstate():
+            out[:] = f(x, yv)
+        if not np.isfinite(out).all():
+            _replace_nonfinite(out, overflow, zerodivision, 
+                               division.occurred)
+    def stages(x, h, first):
+        if not first: evaluate(x, y, k[0])
+        for st in range(1, s):
+            np.dot(a[st, :st], k[:st], out=ytemp)
+            np.multiply(ytemp, h, out=ytemp)
+            np.add(ytemp, y, out=ytemp)
+            evaluate(x + c[st]*h, ytemp, k[st])
+    def row(x, yv):
+        r = np.empty(n + 1)
+        r[0] = x
+        r[1:] = yv
+        return r
+    def modify(yv, h):
+        if nonODEfunc:
+            yv = np.asarray(nonODEfunc(yv, h), dtype=float)
+        if lower is not None: _vector_boundary(yv, lower, 'lower')
+        if upper is not None: _vector_boundary(yv, upper, 'upper')
+        return yv
+    if output is None: yield row(x0, y)
+    else:
+        yield from output.first(x0, y)
+        if output.done: return
+    if not adaptive:
+        while x0 < xmax:
+            stages(x0, step, False)
+            np.dot(b, k, out=y1)
+            y1 *= step
+            y1 += y
+            # variables before the step are kept in y1 until the next step
+            (y, y1) = (modify(y1, step), y)
+            (xp, x0) = (x0, x0 + step)
+            if output is None: yield row(x0, y)
+            else:
+                yield from output.step(xp, y1, x0, y)
+                if output.done: return
+        if output is not None: yield from output.last(x0, y)
+        return
+    h = abs(step)
+    evaluate(x0, y, k[0])
+    rejected = False
+    while x0 < xmax:
+        hmin = 16 * 2.2e-16 * max(abs(x0), 1.0)
+        last = (x0 + h) >= xmax
+        if last: h = xmax - x0
+        stages(x0, h, True)
+        if fsal:
+            y1[:] = ytemp
+        else:
+            np.dot(b, k, out=y1)
+            y1 *= h
+            y1 += y
+        np.dot(e, k, out=error)
+        error *= h
+        np.maximum(np.abs(y), np.abs(y1), out=scale)
+        scale *= rtol
+        scale += atol
+        with np.errstate(all='ignore'):
+            error /= scale
+            err = float(np.sqrt(np.mean(error * error)))
+        if err != err: err = float('inf')
+        if err <= 1.0 or h <= hmin:
+            # Step accepted
+            xp = x0
+            if last: x0 = xmax
+            else: x0 = x0 + h
+            ynew = modify(y1.copy(), h)
+            if fsal and np.array_equal(ynew, y1): 
+                k[0] = k[s-1]
+            else: 
+                evaluate(x0, ynew, k[0])
+            (yp, y) = (y, ynew)
+            if output is None: yield row(x0, y)
+            else:
+                yield from output.step(xp, yp, x0, y)
+                if output.done: return
+            if err == 0.0: factor = 5.0
+            else: factor = min(5.0, max(0.2, 0.9 * err ** -exponent))
+            if rejected: factor = min(1.0, factor)
+            rejected = False
+        else:
+            # Step rejected - retry with a smaller step
+            if err == float('inf'): factor = 0.2
+            else: factor = max(0.2, 0.9 * err ** -exponent)
+            rejected = True
+            if stats is not None:
+                stats.rejected_steps = stats.rejected_steps + 1
+        h = max(h * factor, hmin)
+    if output is not None: yield from output.last(x0, y)
+
+def RKF45(funcs, x0, y0, step, xmax, nonODEfunc=None,
+          lower_bound=None, upper_bound=None,
+          overflow=1e100, zerodivision=1e100,
+          rtol=1e-6, atol=1e-8,
+          output_times=None, every=None, events=None,
+          stats=None):
+    '''
+    Generator to integrate a system of ODEs, y' = f(x, y), using 
+    Runge-Kutta-Fehlberg 4(5) method with adaptive step size control. 
     
-    @param scriptfile: name of Python file for the generated ODE script 
-    file
-    @type scriptfile: string
-    @param resultsfile: name of ODE simulation results file (CSV file), 
-    which will be included into the generated simulation script file
-    @type resultsfile: string    
-    @param time: tuple of time parameters for simulation in the format of 
-    (<start time>, <time step>, <end time>). Default = (0.0, 0.1, 100.0)
-    @param ODE_solver: name of ODE solver to use. Default = RK4
-    @param expressions: dictionary of expressions for ODE(s). Please see 
+    Both orders of the embedded pair are calculated from a single set of 
+    stage evaluations; the difference between them is the local error 
+    estimate. A step is rejected and retried with a smaller step size if 
+    the estimate fails the tolerance set by rtol and atol; otherwise, the 
+    step is accepted and the next step size is grown or shrunk according 
+    to the estimate. Hence, step is only used as the initial step size and 
+    results are generated at every accepted step.
+    
+    A function (as nonODEfunc parameter) can be included to modify one or 
+    more variables (y0 list). This function will not be an ODE (not a 
+    dy/dt). This can be used to consolidate the modification of one or 
+    more variables at each ODE solving step. For example, y[0] = y[1] / y[2] 
+    can be written as 
+    
+    >>> def modifying_function(y, step):
+            y[0] = y[1] / y[2]
+            return y
+    
+    This function must take 'y' (variable list) and 'step' (time step) as 
+    parameters and must return 'y' (the modified variable list). This 
+    function will execute before boundary checking at each time step.
+    
+    Upper and lower boundaries of one or more variable can be set using 
+    upper_bound and lower_bound parameters respectively. These parameters 
+    takes the form of a dictionary with variable number as key and a list 
+    of [<boundary value>, <value to set if boundary is exceeded>]. For 
+    example, the following dictionary for lower boundary {'1': [0.0, 0.0], 
+    '5': [2.0, 2.0]} will set the lower boundary of variable y[0] and y[5] 
+    to 0.0 and 2.0 respectively. This also allows for setting to a different 
+    value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
+    the original y[0] value is negative.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables
+    @type y0: list
+    @param step: initial step size on the x-axis
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param nonODEfunc: a function to modify the variable list (y0)
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number) during integration. 
+    Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity, during 
+    integration. Default = 1e100.
+    @type zerodivision: float
+    @param rtol: relative tolerance of the local error estimate. 
+    Default = 1e-6.
+    @type rtol: float
+    @param atol: absolute tolerance of the local error estimate. 
+    Default = 1e-8.
+    @type atol: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
+    '''
+    if stats is not None and not stats.running:
+        return stats.run(RKF45, funcs, x0, y0, step, xmax, nonODEfunc,
+                         lower_bound, upper_bound, overflow, zerodivision,
+                         rtol=rtol, atol=atol, output_times=output_times,
+                         every=every, events=events)
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs): solver = _vector_solver
+    else: solver = _embedded_solver
+    return solver(_embedded_tableau['RKF45'], funcs, x0, y0, step, xmax, 
+                  nonODEfunc, lower_bound, upper_bound, 
+                  overflow, zerodivision, rtol, atol, stats, output)
+
+def CK45(funcs, x0, y0, step, xmax, nonODEfunc=None,
+         lower_bound=None, upper_bound=None,
+         overflow=1e100, zerodivision=1e100,
+         rtol=1e-6, atol=1e-8,
+         output_times=None, every=None, events=None,
+         stats=None):
+    '''
+    Generator to integrate a system of ODEs, y' = f(x, y), using 
+    Cash-Karp 4(5) method with adaptive step size control. 
+    
+    Both orders of the embedded pair are calculated from a single set of 
+    stage evaluations; the difference between them is the local error 
+    estimate. A step is rejected and retried with a smaller step size if 
+    the estimate fails the tolerance set by rtol and atol; otherwise, the 
+    step is accepted and the next step size is grown or shrunk according 
+    to the estimate. Hence, step is only used as the initial step size and 
+    results are generated at every accepted step.
+    
+    A function (as nonODEfunc parameter) can be included to modify one or 
+    more variables (y0 list). This function will not be an ODE (not a 
+    dy/dt). This can be used to consolidate the modification of one or 
+    more variables at each ODE solving step. For example, y[0] = y[1] / y[2] 
+    can be written as 
+    
+    >>> def modifying_function(y, step):
+            y[0] = y[1] / y[2]
+            return y
+    
+    This function must take 'y' (variable list) and 'step' (time step) as 
+    parameters and must return 'y' (the modified variable list). This 
+    function will execute before boundary checking at each time step.
+    
+    Upper and lower boundaries of one or more variable can be set using 
+    upper_bound and lower_bound parameters respectively. These parameters 
+    takes the form of a dictionary with variable number as key and a list 
+    of [<boundary value>, <value to set if boundary is exceeded>]. For 
+    example, the following dictionary for lower boundary {'1': [0.0, 0.0], 
+    '5': [2.0, 2.0]} will set the lower boundary of variable y[0] and y[5] 
+    to 0.0 and 2.0 respectively. This also allows for setting to a different 
+    value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
+    the original y[0] value is negative.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables
+    @type y0: list
+    @param step: initial step size on the x-axis
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param nonODEfunc: a function to modify the variable list (y0)
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number) during integration. 
+    Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity, during 
+    integration. Default = 1e100.
+    @type zerodivision: float
+    @param rtol: relative tolerance of the local error estimate. 
+    Default = 1e-6.
+    @type rtol: float
+    @param atol: absolute tolerance of the local error estimate. 
+    Default = 1e-8.
+    @type atol: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
+    '''
+    if stats is not None and not stats.running:
+        return stats.run(CK45, funcs, x0, y0, step, xmax, nonODEfunc,
+                         lower_bound, upper_bound, overflow, zerodivision,
+                         rtol=rtol, atol=atol, output_times=output_times,
+                         every=every, events=events)
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs): solver = _vector_solver
+    else: solver = _embedded_solver
+    return solver(_embedded_tableau['CK45'], funcs, x0, y0, step, xmax, 
+                  nonODEfunc, lower_bound, upper_bound, 
+                  overflow, zerodivision, rtol, atol, stats, output)
+
+def DP54(funcs, x0, y0, step, xmax, nonODEfunc=None,
+         lower_bound=None, upper_bound=None,
+         overflow=1e100, zerodivision=1e100,
+         rtol=1e-6, atol=1e-8,
+         output_times=None, every=None, events=None,
+         stats=None):
+    '''
+    Generator to integrate a system of ODEs, y' = f(x, y), using 
+    Dormand-Prince 5(4) method with adaptive step size control. 
+    
+    Both orders of the embedded pair are calculated from a single set of 
+    stage evaluations; the difference between them is the local error 
+    estimate. A step is rejected and retried with a smaller step size if 
+    the estimate fails the tolerance set by rtol and atol; otherwise, the 
+    step is accepted and the next step size is grown or shrunk according 
+    to the estimate. Hence, step is only used as the initial step size and 
+    results are generated at every accepted step.
+    
+    A function (as nonODEfunc parameter) can be included to modify one or 
+    more variables (y0 list). This function will not be an ODE (not a 
+    dy/dt). This can be used to consolidate the modification of one or 
+    more variables at each ODE solving step. For example, y[0] = y[1] / y[2] 
+    can be written as 
+    
+    >>> def modifying_function(y, step):
+            y[0] = y[1] / y[2]
+            return y
+    
+    This function must take 'y' (variable list) and 'step' (time step) as 
+    parameters and must return 'y' (the modified variable list). This 
+    function will execute before boundary checking at each time step.
+    
+    Upper and lower boundaries of one or more variable can be set using 
+    upper_bound and lower_bound parameters respectively. These parameters 
+    takes the form of a dictionary with variable number as key and a list 
+    of [<boundary value>, <value to set if boundary is exceeded>]. For 
+    example, the following dictionary for lower boundary {'1': [0.0, 0.0], 
+    '5': [2.0, 2.0]} will set the lower boundary of variable y[0] and y[5] 
+    to 0.0 and 2.0 respectively. This also allows for setting to a different 
+    value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
+    the original y[0] value is negative.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables
+    @type y0: list
+    @param step: initial step size on the x-axis
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param nonODEfunc: a function to modify the variable list (y0)
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number) during integration. 
+    Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity, during 
+    integration. Default = 1e100.
+    @type zerodivision: float
+    @param rtol: relative tolerance of the local error estimate. 
+    Default = 1e-6.
+    @type rtol: float
+    @param atol: absolute tolerance of the local error estimate. 
+    Default = 1e-8.
+    @type atol: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
+    '''
+    if stats is not None and not stats.running:
+        return stats.run(DP54, funcs, x0, y0, step, xmax, nonODEfunc,
+                         lower_bound, upper_bound, overflow, zerodivision,
+                         rtol=rtol, atol=atol, output_times=output_times,
+                         every=every, events=events)
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    if callable(funcs): solver = _vector_solver
+    else: solver = _embedded_solver
+    return solver(_embedded_tableau['DP54'], funcs, x0, y0, step, xmax, 
+                  nonODEfunc, lower_bound, upper_bound, 
+                  overflow, zerodivision, rtol, atol, stats, output)
+
+def _lu_factor(a):
+    '''
+    Private function - LU decomposition of a square matrix with partial 
+    pivoting (Doolittle algorithm), where the row operations are NumPy 
+    array operations. The decomposition can then be reused to solve for 
+    many right-hand side vectors using _lu_solve.
+    
+    @param a: square matrix to decompose
+    @type a: numpy.ndarray
+    @return: tuple of (combined L and U matrix, row permutation)
+    '''
+    lu = np.array(a, dtype=float)
+    n = lu.shape[0]
+    permutation = np.arange(n)
+    for k in range(n - 1):
+        pivot = k + int(np.argmax(np.abs(lu[k:, k])))
+        if pivot != k:
+            lu[[k, pivot]] = lu[[pivot, k]]
+            permutation[[k, pivot]] = permutation[[pivot, k]]
+        if lu[k, k] == 0.0: continue
+        lu[k+1:, k] /= lu[k, k]
+        lu[k+1:, k+1:] -= np.outer(lu[k+1:, k], lu[k, k+1:])
+    return (lu, permutation)
+
+def _lu_solve(factor, b):
+    '''
+    Private function - solves a linear system, A x = b, using the LU 
+    decomposition of A from _lu_factor by forward and backward 
+    substitution.
+    
+    @param factor: LU decomposition from _lu_factor
+    @type factor: tuple
+    @param b: right-hand side vector
+    @type b: numpy.ndarray
+    @return: solution vector
+    @rtype: numpy.ndarray
+    '''
+    (lu, permutation) = factor
+    n = lu.shape[0]
+    x = np.array(b, dtype=float)[permutation]
+    for i in range(1, n):
+        x[i] -= np.dot(lu[i, :i], x[:i])
+    for i in range(n - 1, -1, -1):
+        x[i] = (x[i] - np.dot(lu[i, i+1:], x[i+1:])) / lu[i, i]
+    return x
+
+def _jacobian_fd(f, x, y, f0, groups=None):
+    '''
+    Private function - approximates the Jacobian matrix of a system of 
+    ODEs by forward differences. Without column groups, one variable is 
+    perturbed at a time. With column groups (please see column_groups 
+    function), all variables of a group are perturbed together and the 
+    difference of each ODE is assigned to the one variable of the group 
+    it depends on.
+    
+    @param f: system of ODEs as a single function returning a NumPy array 
+    of derivatives
+    @type f: function
+    @param x: value of x-axis
+    @type x: float
+    @param y: values for variables
+    @type y: numpy.ndarray
+    @param f0: derivatives at (x, y)
+    @type f0: numpy.ndarray
+    @param groups: tuple of (sparsity pattern, list of column groups). 
+    Default = None (one variable at a time)
+    @type groups: tuple
+    @return: Jacobian matrix where element [i, j] is the derivative of 
+    ODE i with respect to variable j
+    @rtype: numpy.ndarray
+    '''
+    n = len(y)
+    yp = y.copy()
+    if groups is None:
+        jacobian = np.empty((n, n))
+        for j in range(n):
+            delta = 1.5e-8 * max(abs(y[j]), 1.0)
+            yp[j] = y[j] + delta
+            jacobian[:, j] = (f(x, yp) - f0) / delta
+            yp[j] = y[j]
+        return jacobian
+    (pattern, columns) = groups
+    jacobian = np.zeros((n, n))
+    delta = 1.5e-8 * np.maximum(np.abs(y), 1.0)
+    for group in columns:
+        yp[group] = y[group] + delta[group]
+        difference = f(x, yp) - f0
+        yp[group] = y[group]
+        for j in group:
+            rows = pattern[:, j]
+            jacobian[rows, j] = difference[rows] / delta[j]
+    return jacobian
+
+# Cache of sparsity patterns and column groups, keyed by system of ODEs 
+# and number of variables, where the least recently used patterns are 
+# discarded when there are more than _jacobian_patterns_size patterns so 
+# that the cache (and the ODE functions in its keys) does not grow 
+# without bound.
+_jacobian_patterns = collections.OrderedDict()
+_jacobian_patterns_size = 128
+
+def _probe_sparsity(f, x, y, probes=2):
+    '''
+    Private function - detects the sparsity pattern of the Jacobian matrix 
+    of a system of ODEs by perturbing one variable at a time at a number 
+    of pseudo-random points around y, where ODE i is taken to depend on 
+    variable j if its derivative changes at any of the points. Random 
+    points are used as derivatives may not change at y itself, such as 
+    the derivative of a * b with respect to a at b = 0.
+    
+    @param f: system of ODEs as a single function returning a NumPy array 
+    of derivatives
+    @type f: function
+    @param x: value of x-axis
+    @type x: float
+    @param y: values for variables
+    @type y: numpy.ndarray
+    @param probes: number of points. Default = 2
+    @type probes: integer
+    @return: sparsity pattern as a boolean matrix where element [i, j] is 
+    True if ODE i depends on variable j
+    @rtype: numpy.ndarray
+    '''
+    n = len(y)
+    pattern = np.zeros((n, n), dtype=bool)
+    generator = np.random.RandomState(n)
+    for probe in range(probes):
+        scale = np.maximum(np.abs(y), 1.0)
+        yc = y + 0.1 * scale * generator.uniform(0.5, 1.0, n)
+        fc = f(x, yc)
+        yp = yc.copy()
+        for j in range(n):
+            yp[j] = yc[j] + 1e-4 * scale[j]
+            with np.errstate(all='ignore'):
+                pattern[:, j] |= (f(x, yp) != fc)
+            yp[j] = yc[j]
+    return pattern
+
+def column_groups(pattern):
+    '''
+    Groups the columns (variables) of a sparse Jacobian matrix, such that 
+    no 2 columns in a group have a non-zero element in the same row 
+    (ODE). All variables in a group can then be perturbed together in a 
+    single evaluation of the system of ODEs to approximate the Jacobian 
+    matrix by finite differences. 
+    
+    Grouping is a colouring of the column intersection graph, using the 
+    greedy (Curtis-Powell-Reid) algorithm with columns ordered by 
+    decreasing number of non-zero elements. The number of groups is at 
+    least the maximum number of non-zero elements in a row, and is usually 
+    close to it.
+    
+    @param pattern: sparsity pattern as a boolean matrix where element 
+    [i, j] is True if ODE i depends on variable j
+    @type pattern: numpy.ndarray
+    @return: list of column groups, where each group is a NumPy array of 
+    column (variable) indices
+    '''
+    pattern = np.asarray(pattern, dtype=bool)
+    n = pattern.shape[1]
+    order = np.argsort(-pattern.sum(axis=0), kind='stable')
+    groups = []
+    covered = []
+    for j in order:
+        column = pattern[:, j]
+        for g in range(len(groups)):
+            if not (covered[g] & column).any():
+                groups[g].append(j)
+                covered[g] |= column
+                break
+        else:
+            groups.append([j])
+            covered.append(column.copy())
+    return [np.array(sorted(group), dtype=int) for group in groups]
+
+def _jacobian_key(funcs, n):
+    '''
+    Private function - gives the key of a system of ODEs in the cache of 
+    sparsity patterns, where ODEs wrapped by Statistics objects are 
+    unwrapped so that the same system of ODEs gives the same key.
+    '''
+    if callable(funcs): 
+        return (getattr(funcs, '__wrapped__', funcs), n)
+    return (tuple([getattr(func, '__wrapped__', func) for func in funcs]), 
+            n)
+
+def _jacobian_groups(funcs, f, x, y):
+    '''
+    Private function - gives the sparsity pattern and column groups of the 
+    Jacobian matrix of a system of ODEs, from the cache of patterns, or 
+    by detecting the pattern (please see jacobian_sparsity function).
+    
+    @return: tuple of (sparsity pattern, list of column groups)
+    '''
+    key = _jacobian_key(funcs, len(y))
+    if key in _jacobian_patterns:
+        _jacobian_patterns.move_to_end(key)
+        return _jacobian_patterns[key]
+    pattern = _probe_sparsity(f, x, y)
+    _jacobian_patterns[key] = (pattern, column_groups(pattern))
+    while len(_jacobian_patterns) > _jacobian_patterns_size:
+        _jacobian_patterns.popitem(last=False)
+    return _jacobian_patterns[key]
+
+def jacobian_sparsity(funcs, x, y, overflow=1e100, zerodivision=1e100, 
+                      refresh=False):
+    '''
+    Detects the sparsity pattern of the Jacobian matrix of a system of 
+    ODEs, which is the dependence of each ODE on each variable. The 
+    pattern is detected by perturbing one variable at a time at 2 
+    pseudo-random points around the given variables (y), and is cached 
+    per system of ODEs (funcs) - hence, the cost of detection (2 
+    evaluations of the system of ODEs per variable) is only incurred once 
+    per model. Only the patterns of the 128 most recently used systems of 
+    ODEs are kept.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x: value of x-axis, which is usually time
+    @type x: float
+    @param y: values for variables
+    @type y: list
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number). Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity. 
+    Default = 1e100.
+    @type zerodivision: float
+    @param refresh: detect the pattern again instead of using the cached 
+    pattern. Default = False
+    @type refresh: boolean
+    @return: sparsity pattern as a boolean matrix where element [i, j] is 
+    True if ODE i depends on variable j
+    @rtype: numpy.ndarray
+    '''
+    y = np.array(y, dtype=float)
+    (f, modify, row) = _array_functions(funcs, len(y), None, None, None, 
+                                        overflow, zerodivision)
+    if refresh:
+        _jacobian_patterns.pop(_jacobian_key(funcs, len(y)), None)
+    return _jacobian_groups(funcs, f, x, y)[0].copy()
+
+def jacobian_matrix(funcs, x, y, sparse=True, 
+                    overflow=1e100, zerodivision=1e100):
+    '''
+    Approximates the Jacobian matrix of a system of ODEs by forward 
+    differences, for use in stiff ODE solvers, sensitivity analysis and 
+    finding of steady states. 
+    
+    Dense approximation perturbs one variable at a time, needing one 
+    evaluation of the system of ODEs per variable. Sparse approximation 
+    (default) uses the sparsity pattern of the Jacobian matrix (please see 
+    jacobian_sparsity function) to perturb groups of structurally 
+    independent variables together (please see column_groups function), 
+    needing one evaluation of the system of ODEs per group - which is 
+    about the maximum number of variables that an ODE depends on.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x: value of x-axis, which is usually time
+    @type x: float
+    @param y: values for variables
+    @type y: list
+    @param sparse: use the sparsity pattern. Default = True
+    @type sparse: boolean
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number). Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity. 
+    Default = 1e100.
+    @type zerodivision: float
+    @return: Jacobian matrix where element [i, j] is the derivative of 
+    ODE i with respect to variable j
+    @rtype: numpy.ndarray
+    '''
+    y = np.array(y, dtype=float)
+    (f, modify, row) = _array_functions(funcs, len(y), None, None, None, 
+                                        overflow, zerodivision)
+    groups = None
+    if sparse: groups = _jacobian_groups(funcs, f, x, y)
+    return _jacobian_fd(f, x, y, f(x, y), groups)
+
+def _array_functions(funcs, n, nonODEfunc, lower_bound, upper_bound, 
+                     overflow, zerodivision):
+    '''
+    Private function - called by ODE solvers working on NumPy arrays of 
+    variables in both list and vectorized modes, to give the functions for 
+    (1) evaluating the system of ODEs as a NumPy array of derivatives, (2) 
+    applying nonODEfunc and boundaries to variables, and (3) generating 
+    [x] + y in the type of the mode (list or NumPy array).
+    
+    @param funcs: system of differential equations
+    @type funcs: list or function
+    @param n: number of variables
+    @type n: integer
+    @return: tuple of (f(x, y), modify(y, step), row(x, y)) functions
+    '''
+    vectorized = callable(funcs)
+    if vectorized:
+        division = _ZeroDivision()
+        def f(x, yv):
+            with division.errstate():
+                result = np.array(funcs(x, yv), dtype=float)
+            if not np.isfinite(result).all():
+                _replace_nonfinite(result, overflow, zerodivision, 
+                                   division.occurred)
+            return result
+        lower = _compile_boundary(lower_bound)
+        upper = _compile_boundary(upper_bound)
+    else:
+        m = len(funcs)
+        lower = _compile_list_boundary(lower_bound)
+        upper = _compile_list_boundary(upper_bound)
+        def f(x, yv):
+            yl = yv.tolist()
+            result = np.zeros(n)
+            for i in range(m):
+                try: result[i] = funcs[i](x, yl)
+                except TypeError: pass
+                except ZeroDivisionError: result[i] = zerodivision
+                except OverflowError: result[i] = overflow
+            return result
+    def modify(yv, h):
+        if vectorized:
+            if nonODEfunc:
+                yv = np.array(nonODEfunc(yv, h), dtype=float)
+            if lower is not None: _vector_boundary(yv, lower, 'lower')
+            if upper is not None: _vector_boundary(yv, upper, 'upper')
+            return yv
+        yl = yv.tolist()
+        if nonODEfunc:
+            yl = nonODEfunc(yl, h)
+        if lower: 
+            yl = _list_boundary(yl, lower, 'lower')
+        if upper: 
+            yl = _list_boundary(yl, upper, 'upper')
+        return np.array(yl, dtype=float)
+    def row(x, yv):
+        if vectorized:
+            r = np.empty(n + 1)
+            r[0] = x
+            r[1:] = yv
+            return r
+        return [x] + yv.tolist()
+    return (f, modify, row)
+
+def Rosenbrock(funcs, x0, y0, step, xmax, nonODEfunc=None,
+               lower_bound=None, upper_bound=None,
+               overflow=1e100, zerodivision=1e100,
+               jacobian=None, rtol=1e-6, atol=1e-8,
+               output_times=None, every=None, events=None,
+               stats=None):
+    '''
+    Generator to integrate a stiff system of ODEs, y' = f(x, y), using the 
+    second order, L-stable, Rosenbrock-W method (ROS2) with adaptive step 
+    size control. 
+    
+    Each step solves two linear systems with the matrix, W = I - gamma * 
+    step * J, where J is the Jacobian matrix of the system of ODEs. As 
+    ROS2 is a W-method, its order of accuracy does not depend on J being 
+    exact. Hence, J and the LU decomposition of W are reused across steps 
+    for as long as the step size is kept, and are only re-evaluated when 
+    the step size changes or a step is rejected; small increases of step 
+    size (up to 20%) are forgone to keep the decomposition. The local error 
+    estimate is the difference between the second order solution and the 
+    embedded first order solution.
+    
+    The Jacobian matrix can be given as a function (as jacobian parameter) 
+    taking x and the variables, and returning the matrix (as a list of 
+    lists or NumPy array) where element [i][j] is the derivative of ODE i 
+    with respect to variable j. If not given, the Jacobian matrix is 
+    approximated by finite differences, perturbing groups of structurally 
+    independent variables together using the sparsity pattern of the 
+    system of ODEs (please see jacobian_matrix function). As the sparsity 
+    pattern is detected once per system of ODEs, the first integration 
+    of a system of ODEs incurs 2 additional evaluations of the system of 
+    ODEs per variable.
+    
+    A function (as nonODEfunc parameter) can be included to modify one or 
+    more variables (y0 list). This function will not be an ODE (not a 
+    dy/dt). This can be used to consolidate the modification of one or 
+    more variables at each ODE solving step. For example, y[0] = y[1] / y[2] 
+    can be written as 
+    
+    >>> def modifying_function(y, step):
+            y[0] = y[1] / y[2]
+            return y
+    
+    This function must take 'y' (variable list) and 'step' (time step) as 
+    parameters and must return 'y' (the modified variable list). This 
+    function will execute before boundary checking at each time step.
+    
+    Upper and lower boundaries of one or more variable can be set using 
+    upper_bound and lower_bound parameters respectively. These parameters 
+    takes the form of a dictionary with variable number as key and a list 
+    of [<boundary value>, <value to set if boundary is exceeded>]. For 
+    example, the following dictionary for lower boundary {'1': [0.0, 0.0], 
+    '5': [2.0, 2.0]} will set the lower boundary of variable y[0] and y[5] 
+    to 0.0 and 2.0 respectively. This also allows for setting to a different 
+    value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
+    the original y[0] value is negative.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables
+    @type y0: list
+    @param step: initial step size on the x-axis
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param nonODEfunc: a function to modify the variable list (y0)
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number) during integration. 
+    Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity, during 
+    integration. Default = 1e100.
+    @type zerodivision: float
+    @param jacobian: a function to calculate the Jacobian matrix. 
+    Default = None (finite difference approximation)
+    @type jacobian: function
+    @param rtol: relative tolerance of the local error estimate. 
+    Default = 1e-6.
+    @type rtol: float
+    @param atol: absolute tolerance of the local error estimate. 
+    Default = 1e-8.
+    @type atol: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
+    '''
+    if stats is not None and not stats.running:
+        yield from stats.run(Rosenbrock, funcs, x0, y0, step, xmax,
+                             nonODEfunc, lower_bound, upper_bound, overflow,
+                             zerodivision, jacobian=jacobian, rtol=rtol,
+                             atol=atol, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    gamma = 1.0 + 1.0 / (2.0 ** 0.5)
+    y = np.array(y0, dtype=float)
+    n = len(y)
+    (f, modify, row) = _array_functions(funcs, n, nonODEfunc, 
+                                        lower_bound, upper_bound, 
+                                        overflow, zerodivision)
+    if output is None: yield row(x0, y)
+    else:
+        yield from output.first(x0, y)
+        if output.done: return
+    h = abs(step)
+    identity = np.eye(n)
+    f0 = f(x0, y)
+    J = None
+    factor = None
+    factor_step = None
+    groups = None
+    if jacobian is None: groups = _jacobian_groups(funcs, f, x0, y)
+    rejected = False
+    while x0 < xmax:
+        hmin = 16 * 2.2e-16 * max(abs(x0), 1.0)
+        last = (x0 + h) >= xmax
+        if last: h = xmax - x0
+        if J is None:
+            if jacobian is None: J = _jacobian_fd(f, x0, y, f0, groups)
+            else: J = np.array(jacobian(x0, y), dtype=float)
+            factor = None
+        if factor is None or factor_step != h:
+            factor = _lu_factor(identity - (gamma * h) * J)
+            factor_step = h
+        k1 = _lu_solve(factor, f0)
+        y1 = y + h * k1
+        k2 = _lu_solve(factor, f(x0 + h, y1) - 2.0 * k1)
+        y1 = y + (1.5 * h) * k1 + (0.5 * h) * k2
+        error = (0.5 * h) * (k1 + k2)
+        scale = atol + rtol * np.maximum(np.abs(y), np.abs(y1))
+        with np.errstate(all='ignore'):
+            err = float(np.sqrt(np.mean((error / scale) ** 2)))
+        if err != err: err = float('inf')
+        if err <= 1.0 or h <= hmin:
+            # Step accepted
+            (xp, yp) = (x0, y)
+            if last: x0 = xmax
+            else: x0 = x0 + h
+            y = modify(y1, h)
+            f0 = f(x0, y)
+            if output is None: yield row(x0, y)
+            else:
+                yield from output.step(xp, yp, x0, y)
+                if output.done: return
+            if err == 0.0: change = 5.0
+            else: change = min(5.0, max(0.2, 0.9 * err ** -0.5))
+            if rejected: change = min(1.0, change)
+            # Keep the step size (and LU decomposition) for small increases
+            if 1.0 <= change <= 1.2: change = 1.0
+            else: J = None
+            rejected = False
+        else:
+            # Step rejected - retry with a smaller step and fresh Jacobian
+            if err == float('inf'): change = 0.2
+            else: change = max(0.2, 0.9 * err ** -0.5)
+            rejected = True
+            if stats is not None:
+                stats.rejected_steps = stats.rejected_steps + 1
+            J = None
+        h = max(h * change, hmin)
+    if output is not None: yield from output.last(x0, y)
+
+_adams_bashforth = {
+    2: [3.0/2.0, -1.0/2.0],
+    3: [23.0/12.0, -16.0/12.0, 5.0/12.0],
+    4: [55.0/24.0, -59.0/24.0, 37.0/24.0, -9.0/24.0],
+    5: [1901.0/720.0, -2774.0/720.0, 2616.0/720.0, -1274.0/720.0, 
+        251.0/720.0]}
+
+_adams_moulton = {
+    2: [1.0/2.0, 1.0/2.0],
+    3: [5.0/12.0, 8.0/12.0, -1.0/12.0],
+    4: [9.0/24.0, 19.0/24.0, -5.0/24.0, 1.0/24.0],
+    5: [251.0/720.0, 646.0/720.0, -264.0/720.0, 106.0/720.0, 
+        -19.0/720.0]}
+
+def _adams_solver(order, funcs, x0, y0, step, xmax, nonODEfunc, 
+                  lower_bound, upper_bound, overflow, zerodivision, 
+                  output=None):
+    '''
+    Private generator - called by Adams-Bashforth-Moulton solvers (ABM2 to 
+    ABM5) to integrate a system of ODEs, in both list and vectorized modes, 
+    by predict-evaluate-correct-evaluate (PECE) steps. 
+    
+    Coefficients of Adams-Bashforth (predictor) formulae are given from the 
+    most recent derivative (_adams_bashforth); coefficients of Adams-Moulton 
+    (corrector) formulae are given from the derivative at the predicted 
+    variables, followed by the most recent derivative (_adams_moulton).
+    
+    @param order: order of the method, from 2 to 5
+    @type order: integer
+    @param output: reduction of results and location of events (please 
+    see _Output class), or None for results at every step
+    @type output: _Output object
+    @return: generator of [x] + y at every step
+    '''
+    predictor = step * np.array(_adams_bashforth[order], dtype=float)
+    corrector = step * np.array(_adams_moulton[order], dtype=float)
+    n = len(y0)
+    (f, modify, row) = _array_functions(funcs, n, nonODEfunc, 
+                                        lower_bound, upper_bound, 
+                                        overflow, zerodivision)
+    # Derivatives of the previous steps, from the most recent
+    F = np.empty((order, n))
+    count = 0
+    starter = RK4(funcs, x0, y0, step, xmax, nonODEfunc, 
+                  lower_bound, upper_bound, overflow, zerodivision)
+    for r in starter:
+        (xp, yp) = (x0, y0)
+        x0 = r[0]
+        y = np.array(r[1:], dtype=float)
+        if output is None: yield r
+        elif count == 0: yield from output.first(x0, y)
+        else: yield from output.step(xp, yp, x0, y)
+        if output is not None and output.done:
+            starter.close()
+            return
+        y0 = y
+        F[1:] = F[:-1]
+        F[0] = f(x0, y)
+        count = count + 1
+        if count == order: break
+    starter.close()
+    if count < order:
+        if output is not None: yield from output.last(x0, y)
+        return
+    while x0 < xmax:
+        yp = y + np.dot(predictor, F)
+        fp = f(x0 + step, yp)
+        y1 = y + corrector[0] * fp + np.dot(corrector[1:], F[:-1])
+        (xp, yp) = (x0, y)
+        x0 = x0 + step
+        y = modify(y1, step)
+        F[1:] = F[:-1]
+        F[0] = f(x0, y)
+        if output is None: yield row(x0, y)
+        else:
+            yield from output.step(xp, yp, x0, y)
+            if output.done: return
+    if output is not None: yield from output.last(x0, y)
+
+def ABM2(funcs, x0, y0, step, xmax, nonODEfunc=None,
+         lower_bound=None, upper_bound=None,
+         overflow=1e100, zerodivision=1e100,
+         output_times=None, every=None, events=None,
+         stats=None):
+    '''
+    Generator to integrate a system of ODEs, y' = f(x, y), using second 
+    order Adams-Bashforth-Moulton predictor-corrector method.
+    
+    As a linear multistep method, each step reuses the derivatives of the 
+    previous 2 steps: the variables are predicted by Adams-Bashforth 
+    formula, the derivatives are evaluated at the prediction, and the 
+    prediction is corrected by Adams-Moulton formula, before the 
+    derivatives are evaluated at the corrected variables for the next 
+    step. Hence, each step costs 2 evaluations of the system of ODEs 
+    regardless of the order. The first step is started by fourth order 
+    Runge-Kutta method (please see RK4).
+    
+    A function (as nonODEfunc parameter) can be included to modify one or 
+    more variables (y0 list). This function will not be an ODE (not a 
+    dy/dt). This can be used to consolidate the modification of one or 
+    more variables at each ODE solving step. For example, y[0] = y[1] / y[2] 
+    can be written as 
+    
+    >>> def modifying_function(y, step):
+            y[0] = y[1] / y[2]
+            return y
+    
+    This function must take 'y' (variable list) and 'step' (time step) as 
+    parameters and must return 'y' (the modified variable list). This 
+    function will execute before boundary checking at each time step.
+    
+    Upper and lower boundaries of one or more variable can be set using 
+    upper_bound and lower_bound parameters respectively. These parameters 
+    takes the form of a dictionary with variable number as key and a list 
+    of [<boundary value>, <value to set if boundary is exceeded>]. For 
+    example, the following dictionary for lower boundary {'1': [0.0, 0.0], 
+    '5': [2.0, 2.0]} will set the lower boundary of variable y[0] and y[5] 
+    to 0.0 and 2.0 respectively. This also allows for setting to a different 
+    value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
+    the original y[0] value is negative.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables
+    @type y0: list
+    @param step: step size on the x-axis (also known as step in calculus)
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param nonODEfunc: a function to modify the variable list (y0)
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number) during integration. 
+    Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity, during 
+    integration. Default = 1e100.
+    @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
+    '''
+    if stats is not None and not stats.running:
+        yield from stats.run(ABM2, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    yield from _adams_solver(2, funcs, x0, y0, step, xmax, nonODEfunc, 
+                             lower_bound, upper_bound, 
+                             overflow, zerodivision, 
+                             output)
+
+def ABM3(funcs, x0, y0, step, xmax, nonODEfunc=None,
+         lower_bound=None, upper_bound=None,
+         overflow=1e100, zerodivision=1e100,
+         output_times=None, every=None, events=None,
+         stats=None):
+    '''
+    Generator to integrate a system of ODEs, y' = f(x, y), using third 
+    order Adams-Bashforth-Moulton predictor-corrector method.
+    
+    As a linear multistep method, each step reuses the derivatives of the 
+    previous 3 steps: the variables are predicted by Adams-Bashforth 
+    formula, the derivatives are evaluated at the prediction, and the 
+    prediction is corrected by Adams-Moulton formula, before the 
+    derivatives are evaluated at the corrected variables for the next 
+    step. Hence, each step costs 2 evaluations of the system of ODEs 
+    regardless of the order. The first 2 steps are started by fourth order 
+    Runge-Kutta method (please see RK4).
+    
+    A function (as nonODEfunc parameter) can be included to modify one or 
+    more variables (y0 list). This function will not be an ODE (not a 
+    dy/dt). This can be used to consolidate the modification of one or 
+    more variables at each ODE solving step. For example, y[0] = y[1] / y[2] 
+    can be written as 
+    
+    >>> def modifying_function(y, step):
+            y[0] = y[1] / y[2]
+            return y
+    
+    This function must take 'y' (variable list) and 'step' (time step) as 
+    parameters and must return 'y' (the modified variable list). This 
+    function will execute before boundary checking at each time step.
+    
+    Upper and lower boundaries of one or more variable can be set using 
+    upper_bound and lower_bound parameters respectively. These parameters 
+    takes the form of a dictionary with variable number as key and a list 
+    of [<boundary value>, <value to set if boundary is exceeded>]. For 
+    example, the following dictionary for lower boundary {'1': [0.0, 0.0], 
+    '5': [2.0, 2.0]} will set the lower boundary of variable y[0] and y[5] 
+    to 0.0 and 2.0 respectively. This also allows for setting to a different 
+    value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
+    the original y[0] value is negative.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables
+    @type y0: list
+    @param step: step size on the x-axis (also known as step in calculus)
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param nonODEfunc: a function to modify the variable list (y0)
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number) during integration. 
+    Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity, during 
+    integration. Default = 1e100.
+    @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
+    '''
+    if stats is not None and not stats.running:
+        yield from stats.run(ABM3, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    yield from _adams_solver(3, funcs, x0, y0, step, xmax, nonODEfunc, 
+                             lower_bound, upper_bound, 
+                             overflow, zerodivision, 
+                             output)
+
+def ABM4(funcs, x0, y0, step, xmax, nonODEfunc=None,
+         lower_bound=None, upper_bound=None,
+         overflow=1e100, zerodivision=1e100,
+         output_times=None, every=None, events=None,
+         stats=None):
+    '''
+    Generator to integrate a system of ODEs, y' = f(x, y), using fourth 
+    order Adams-Bashforth-Moulton predictor-corrector method.
+    
+    As a linear multistep method, each step reuses the derivatives of the 
+    previous 4 steps: the variables are predicted by Adams-Bashforth 
+    formula, the derivatives are evaluated at the prediction, and the 
+    prediction is corrected by Adams-Moulton formula, before the 
+    derivatives are evaluated at the corrected variables for the next 
+    step. Hence, each step costs 2 evaluations of the system of ODEs 
+    regardless of the order. The first 3 steps are started by fourth order 
+    Runge-Kutta method (please see RK4).
+    
+    A function (as nonODEfunc parameter) can be included to modify one or 
+    more variables (y0 list). This function will not be an ODE (not a 
+    dy/dt). This can be used to consolidate the modification of one or 
+    more variables at each ODE solving step. For example, y[0] = y[1] / y[2] 
+    can be written as 
+    
+    >>> def modifying_function(y, step):
+            y[0] = y[1] / y[2]
+            return y
+    
+    This function must take 'y' (variable list) and 'step' (time step) as 
+    parameters and must return 'y' (the modified variable list). This 
+    function will execute before boundary checking at each time step.
+    
+    Upper and lower boundaries of one or more variable can be set using 
+    upper_bound and lower_bound parameters respectively. These parameters 
+    takes the form of a dictionary with variable number as key and a list 
+    of [<boundary value>, <value to set if boundary is exceeded>]. For 
+    example, the following dictionary for lower boundary {'1': [0.0, 0.0], 
+    '5': [2.0, 2.0]} will set the lower boundary of variable y[0] and y[5] 
+    to 0.0 and 2.0 respectively. This also allows for setting to a different 
+    value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
+    the original y[0] value is negative.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables
+    @type y0: list
+    @param step: step size on the x-axis (also known as step in calculus)
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param nonODEfunc: a function to modify the variable list (y0)
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number) during integration. 
+    Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity, during 
+    integration. Default = 1e100.
+    @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
+    '''
+    if stats is not None and not stats.running:
+        yield from stats.run(ABM4, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    yield from _adams_solver(4, funcs, x0, y0, step, xmax, nonODEfunc, 
+                             lower_bound, upper_bound, 
+                             overflow, zerodivision, 
+                             output)
+
+def ABM5(funcs, x0, y0, step, xmax, nonODEfunc=None,
+         lower_bound=None, upper_bound=None,
+         overflow=1e100, zerodivision=1e100,
+         output_times=None, every=None, events=None,
+         stats=None):
+    '''
+    Generator to integrate a system of ODEs, y' = f(x, y), using fifth 
+    order Adams-Bashforth-Moulton predictor-corrector method.
+    
+    As a linear multistep method, each step reuses the derivatives of the 
+    previous 5 steps: the variables are predicted by Adams-Bashforth 
+    formula, the derivatives are evaluated at the prediction, and the 
+    prediction is corrected by Adams-Moulton formula, before the 
+    derivatives are evaluated at the corrected variables for the next 
+    step. Hence, each step costs 2 evaluations of the system of ODEs 
+    regardless of the order. The first 4 steps are started by fourth order 
+    Runge-Kutta method (please see RK4).
+    
+    A function (as nonODEfunc parameter) can be included to modify one or 
+    more variables (y0 list). This function will not be an ODE (not a 
+    dy/dt). This can be used to consolidate the modification of one or 
+    more variables at each ODE solving step. For example, y[0] = y[1] / y[2] 
+    can be written as 
+    
+    >>> def modifying_function(y, step):
+            y[0] = y[1] / y[2]
+            return y
+    
+    This function must take 'y' (variable list) and 'step' (time step) as 
+    parameters and must return 'y' (the modified variable list). This 
+    function will execute before boundary checking at each time step.
+    
+    Upper and lower boundaries of one or more variable can be set using 
+    upper_bound and lower_bound parameters respectively. These parameters 
+    takes the form of a dictionary with variable number as key and a list 
+    of [<boundary value>, <value to set if boundary is exceeded>]. For 
+    example, the following dictionary for lower boundary {'1': [0.0, 0.0], 
+    '5': [2.0, 2.0]} will set the lower boundary of variable y[0] and y[5] 
+    to 0.0 and 2.0 respectively. This also allows for setting to a different 
+    value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
+    the original y[0] value is negative.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables
+    @type y0: list
+    @param step: step size on the x-axis (also known as step in calculus)
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param nonODEfunc: a function to modify the variable list (y0)
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number) during integration. 
+    Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity, during 
+    integration. Default = 1e100.
+    @type zerodivision: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
+    '''
+    if stats is not None and not stats.running:
+        yield from stats.run(ABM5, funcs, x0, y0, step, xmax, nonODEfunc,
+                             lower_bound, upper_bound, overflow,
+                             zerodivision, output_times=output_times,
+                             every=every, events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    yield from _adams_solver(5, funcs, x0, y0, step, xmax, nonODEfunc, 
+                             lower_bound, upper_bound, 
+                             overflow, zerodivision, 
+                             output)
+
+_bulirsch_stoer_sequence = [2, 4, 6, 8, 10, 12, 14, 16, 18]
+
+def _modified_midpoint(f, x, y, f0, H, n):
+    '''
+    Private function - called by Bulirsch-Stoer solver to integrate a 
+    system of ODEs over a step (H) by modified midpoint method, using n 
+    substeps, with smoothing of the final value (Gragg's smoothing).
+    
+    @param f: system of ODEs, returning a NumPy array of derivatives
+    @param x: value of x-axis at the start of the step
+    @param y: values for variables at the start of the step
+    @param f0: derivatives at the start of the step
+    @param H: step size
+    @param n: number of substeps
+    @return: values for variables at the end of the step
+    '''
+    h = H / n
+    z0 = y
+    z1 = y + h * f0
+    for m in range(1, n):
+        (z0, z1) = (z1, z0 + (2.0 * h) * f(x + m * h, z1))
+    return 0.5 * (z0 + z1 + h * f(x + H, z1))
+
+def BulirschStoer(funcs, x0, y0, step, xmax, nonODEfunc=None,
+                  lower_bound=None, upper_bound=None,
+                  overflow=1e100, zerodivision=1e100,
+                  rtol=1e-6, atol=1e-8,
+                  output_times=None, every=None, events=None,
+                  stats=None):
+    '''
+    Generator to integrate a smooth system of ODEs, y' = f(x, y), using 
+    Bulirsch-Stoer method (modified midpoint method with polynomial 
+    Richardson extrapolation) with adaptive step size and order control. 
+    
+    Each step is integrated by modified midpoint method with increasing 
+    numbers of substeps (2, 4, 6, 8, ...), and the results are extrapolated 
+    to zero substep size. The difference between the 2 highest orders of 
+    extrapolation is the local error estimate. The order of extrapolation 
+    (number of substep sequences) and the next step size are chosen to 
+    minimize the evaluations of the system of ODEs per unit of x-axis; a 
+    step is rejected and retried with a smaller step size if the estimate 
+    fails the tolerance set by rtol and atol. For smooth systems of ODEs 
+    at tight tolerances, the steps are far larger than that of fixed step 
+    Runge-Kutta methods. Hence, step is only used as the initial step size 
+    and results are generated at every accepted step.
+    
+    A function (as nonODEfunc parameter) can be included to modify one or 
+    more variables (y0 list). This function will not be an ODE (not a 
+    dy/dt). This can be used to consolidate the modification of one or 
+    more variables at each ODE solving step. For example, y[0] = y[1] / y[2] 
+    can be written as 
+    
+    >>> def modifying_function(y, step):
+            y[0] = y[1] / y[2]
+            return y
+    
+    This function must take 'y' (variable list) and 'step' (time step) as 
+    parameters and must return 'y' (the modified variable list). This 
+    function will execute before boundary checking at each time step.
+    
+    Upper and lower boundaries of one or more variable can be set using 
+    upper_bound and lower_bound parameters respectively. These parameters 
+    takes the form of a dictionary with variable number as key and a list 
+    of [<boundary value>, <value to set if boundary is exceeded>]. For 
+    example, the following dictionary for lower boundary {'1': [0.0, 0.0], 
+    '5': [2.0, 2.0]} will set the lower boundary of variable y[0] and y[5] 
+    to 0.0 and 2.0 respectively. This also allows for setting to a different 
+    value - for example, {'1': [0.0, 1.0]} will set variable y[0] to 2.0 if 
+    the original y[0] value is negative.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables
+    @type y0: list
+    @param step: initial step size on the x-axis
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param nonODEfunc: a function to modify the variable list (y0)
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number) during integration. 
+    Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity, during 
+    integration. Default = 1e100.
+    @type zerodivision: float
+    @param rtol: relative tolerance of the local error estimate. 
+    Default = 1e-6.
+    @type rtol: float
+    @param atol: absolute tolerance of the local error estimate. 
+    Default = 1e-8.
+    @type atol: float
+    @param output_times: values of x-axis to generate results at, which 
+    are interpolated between steps. Default = None (results at every step)
+    @type output_times: list
+    @param every: generate results at every N-th step only; ignored if 
+    output_times is given. Default = None (results at every step)
+    @type every: integer
+    @param events: events to locate during integration, which can be 
+    recorded or stop the integration. Please see Event class. 
+    Default = None (integrate to xmax)
+    @type events: list of Event objects
+    @param stats: statistics object to collect statistics of integration 
+    into. Please see Statistics class. Default = None (no statistics)
+    @type stats: Statistics object
+    '''
+    if stats is not None and not stats.running:
+        yield from stats.run(BulirschStoer, funcs, x0, y0, step, xmax,
+                             nonODEfunc, lower_bound, upper_bound, overflow,
+                             zerodivision, rtol=rtol, atol=atol,
+                             output_times=output_times, every=every,
+                             events=events)
+        return
+    output = _output(funcs, output_times, every, events, overflow, 
+                     zerodivision, stats)
+    sequence = _bulirsch_stoer_sequence
+    kmax = len(sequence) - 1
+    # Work (evaluations of the system of ODEs) to compute each column
+    work = [1 + sum(sequence[:j+1]) for j in range(kmax + 1)]
+    # Target column of extrapolation, from the tolerance
+    k = int(-math.log10(rtol + 1e-40) * 0.6 + 0.5)
+    k = max(1, min(kmax - 1, k))
+    y = np.array(y0, dtype=float)
+    n = len(y)
+    (f, modify, row) = _array_functions(funcs, n, nonODEfunc, 
+                                        lower_bound, upper_bound, 
+                                        overflow, zerodivision)
+    if output is None: yield row(x0, y)
+    else:
+        yield from output.first(x0, y)
+        if output.done: return
+    H = abs(step)
+    f0 = f(x0, y)
+    hopt = [0.0] * (kmax + 1)
+    rejected = False
+    while x0 < xmax:
+        hmin = 16 * 2.2e-16 * max(abs(x0), 1.0)
+        last = (x0 + H) >= xmax
+        if last: H = xmax - x0
+        T = []
+        accepted = None
+        for j in range(k + 2):
+            # Extrapolation tableau, one row per substep sequence
+            Tj = [_modified_midpoint(f, x0, y, f0, H, sequence[j])]
+            for l in range(1, j + 1):
+                ratio = (float(sequence[j]) / sequence[j-l]) ** 2 - 1.0
+                Tj.append(Tj[l-1] + (Tj[l-1] - T[j-1][l-1]) / ratio)
+            T.append(Tj)
+            if j == 0: continue
+            scale = atol + rtol * np.maximum(np.abs(y), np.abs(Tj[j]))
+            with np.errstate(all='ignore'):
+                err = float(np.sqrt(np.mean(((Tj[j] - Tj[j-1]) / 
+                                             scale) ** 2)))
+            if err != err: err = float('inf')
+            if err == 0.0: factor = 4.0
+            else: 
+                factor = 0.94 * (0.65 / err) ** (1.0 / (2 * j + 1))
+                factor = min(4.0, max(0.02, factor))
+            hopt[j] = H * factor
+            if j >= k - 1 and (err <= 1.0 or H <= hmin):
+                accepted = j
+                break
+        if accepted is None:
+            # Step rejected - retry with a smaller step and lower order
+            k = max(1, min(k, j - 1))
+            H = max(min(hopt[k], 0.5 * H), hmin)
+            rejected = True
+            if stats is not None:
+                stats.rejected_steps = stats.rejected_steps + 1
+            continue
+        # Step accepted
+        j = accepted
+        (xp, yp) = (x0, y)
+        if last: x0 = xmax
+        else: x0 = x0 + H
+        y = modify(T[j][j], H)
+        f0 = f(x0, y)
+        if output is None: yield row(x0, y)
+        else:
+            yield from output.step(xp, yp, x0, y)
+            if output.done: return
+        # Choose the column minimizing work per unit step for next step
+        hdone = H
+        if j > 1 and work[j-1] / hopt[j-1] < 0.8 * work[j] / hopt[j]:
+            k = j - 1
+            H = hopt[k]
+        elif j < kmax - 1 and not rejected and \
+            ((j == 1 and hopt[j] < 4.0 * H) or
+             (j > 1 and work[j] / hopt[j] < 0.9 * work[j-1] / hopt[j-1])):
+            k = j + 1
+            H = hopt[j] * work[k] / work[j]
+        else:
+            # Convergence before the target column keeps the target
+            k = max(1, min(max(j, k), kmax - 1))
+            H = hopt[j]
+        # No increase of step size right after a rejected step
+        if rejected: H = min(H, hdone)
+        rejected = False
+        H = max(H, hmin)
+    if output is not None: yield from output.last(x0, y)
+
+class Integrator(object):
+    '''
+    Class for a checkpointable integration of a system of ODEs, where the 
+    entire state of integration (value of x-axis, variables, step size, 
+    derivatives reused by FSAL methods, and derivative history of 
+    multistep methods) is kept as attributes instead of local variables of 
+    a generator. Hence, the state can be saved into a binary file 
+    (checkpoint) and integration can be resumed from the file, giving the 
+    same results (bit-for-bit) as an uninterrupted integration. For 
+    example,
+    
+    >>> integrator = ode.Integrator(ODE, 0.0, y, 0.1, 1e6, 'RK4', 
+                                    checkpoint='run.npz',
+                                    checkpoint_seconds=600)
+    >>> if os.path.exists('run.npz'): integrator.load('run.npz')
+    >>> for x in integrator: 
+            sink.write(x)
+    
+    Supported methods are fixed step Runge-Kutta methods (Euler, Heun, 
+    RK3, RK4, RK38, CK4, CK5, RKF4, RKF5, DP4, DP5), adaptive Runge-Kutta 
+    methods (RKF45, CK45, DP54), and Adams-Bashforth-Moulton methods 
+    (ABM2, ABM3, ABM4, ABM5). All integrations are performed on NumPy 
+    arrays, for systems of ODEs in both list and vectorized modes.
+    '''
+    def __init__(self, funcs, x0, y0, step, xmax, method='RK4', 
+                 nonODEfunc=None, lower_bound=None, upper_bound=None,
+                 overflow=1e100, zerodivision=1e100, 
+                 rtol=1e-6, atol=1e-8, checkpoint=None, 
+                 checkpoint_steps=None, checkpoint_seconds=None):
+        '''
+        Constructor method.
+        
+        @param funcs: system of differential equations, either as a list 
+        of functions (one per ODE) or as a single function returning a 
+        NumPy array of derivatives (vectorized mode)
+        @type funcs: list or function
+        @param x0: initial value of x-axis, which is usually starting time
+        @type x0: float
+        @param y0: initial values for variables
+        @type y0: list
+        @param step: step size on the x-axis, or initial step size for 
+        adaptive methods
+        @type step: float
+        @param xmax: maximum value of x-axis, which is usually ending time
+        @type xmax: float
+        @param method: name of ODE solver. Default = 'RK4'.
+        @type method: string
+        @param nonODEfunc: a function to modify the variable list (y0). 
+        Please see ODE solvers.
+        @type nonODEfunc: function
+        @param lower_bound: set of values for lower boundary of variables
+        @type lower_bound: dictionary
+        @param upper_bound: set of values for upper boundary of variables
+        @type upper_bound: dictionary
+        @param overflow: value to assign in event of over flow error. 
+        Default = 1e100.
+        @type overflow: float
+        @param zerodivision: value to assign in event of zero division 
+        error. Default = 1e100.
+        @type zerodivision: float
+        @param rtol: relative tolerance of adaptive methods. 
+        Default = 1e-6.
+        @type rtol: float
+        @param atol: absolute tolerance of adaptive methods. 
+        Default = 1e-8.
+        @type atol: float
+        @param checkpoint: name of file to save checkpoints into. 
+        Default = None (no checkpoint).
+        @type checkpoint: string
+        @param checkpoint_steps: save a checkpoint every N steps. 
+        Default = None.
+        @type checkpoint_steps: integer
+        @param checkpoint_seconds: save a checkpoint every T seconds. 
+        Default = None.
+        @type checkpoint_seconds: float
+        '''
+        self.method = str(method)
+        if self.method in _fixed_tableau:
+            self.kind = 'fixed'
+            tableau = _fixed_tableau[self.method]
+        elif self.method in _embedded_tableau:
+            self.kind = 'embedded'
+            tableau = _embedded_tableau[self.method]
+            self.error_weights = np.array(tableau['b'], dtype=float) - \
+                np.array(tableau['bhat'], dtype=float)
+            self.exponent = 1.0 / (tableau['order'] + 1)
+            self.fsal = tableau['fsal']
+        elif self.method in ['ABM%s' % str(k) for k in _adams_bashforth]:
+            self.kind = 'multistep'
+            self.order = int(self.method[3:])
+            tableau = _fixed_tableau['RK4']
+            self.predictor = np.array(_adams_bashforth[self.order], 
+                                      dtype=float)
+            self.corrector = np.array(_adams_moulton[self.order], 
+                                      dtype=float)
+        else:
+            raise FunctionParameterValueError('Unsupported method: %s' % 
+                                              self.method)
+        (self.c, self.a, self.b) = _tableau_arrays(tableau)
+        self.funcs = funcs
+        self.x = float(x0)
+        self.y = np.array(y0, dtype=float)
+        self.xmax = float(xmax)
+        self.rtol = rtol
+        self.atol = atol
+        (self.f, self.modify, self.row) = \
+            _array_functions(funcs, len(self.y), nonODEfunc, 
+                             lower_bound, upper_bound, 
+                             overflow, zerodivision)
+        self.checkpoint = checkpoint
+        self.checkpoint_steps = checkpoint_steps
+        self.checkpoint_seconds = checkpoint_seconds
+        # State of integration, other than x and y
+        if self.kind == 'embedded': self.h = abs(float(step))
+        else: self.h = float(step)
+        self.steps = 0
+        self.rejected = False
+        self.derivative = None
+        if self.kind == 'multistep':
+            self.history = np.zeros((self.order, len(self.y)))
+        else:
+            self.history = np.zeros((0, len(self.y)))
+        self.history_count = 0
+    def stages(self, x, y, h, f0):
+        '''
+        Evaluates the stages of Runge-Kutta method for a step.
+        
+        @param x: value of x-axis at the start of the step
+        @param y: values for variables at the start of the step
+        @param h: step size
+        @param f0: derivatives at the start of the step
+        @return: array of stages, one stage per row
+        '''
+        s = len(self.c)
+        k = np.empty((s, len(y)))
+        k[0] = f0
+        for st in range(1, s):
+            ytemp = np.dot(self.a[st, :st], k[:st])
+            ytemp *= h
+            ytemp += y
+            k[st] = self.f(x + self.c[st]*h, ytemp)
+        return k
+    def fixed_step(self, h):
+        '''
+        Performs a step of fixed step Runge-Kutta method.
+        '''
+        k = self.stages(self.x, self.y, h, self.f(self.x, self.y))
+        y1 = np.dot(self.b, k)
+        y1 *= h
+        y1 += self.y
+        self.x = self.x + h
+        self.y = self.modify(y1, h)
+    def embedded_step(self):
+        '''
+        Performs an accepted step of adaptive Runge-Kutta method, with 
+        rejection and retrial of steps failing the tolerance.
+        '''
+        if self.derivative is None:
+            self.derivative = self.f(self.x, self.y)
+        while True:
+            h = self.h
+            hmin = 16 * 2.2e-16 * max(abs(self.x), 1.0)
+            last = (self.x + h) >= self.xmax
+            if last: h = self.xmax - self.x
+            k = self.stages(self.x, self.y, h, self.derivative)
+            y1 = np.dot(self.b, k)
+            y1 *= h
+            y1 += self.y
+            error = np.dot(self.error_weights, k)
+            error *= h
+            scale = np.maximum(np.abs(self.y), np.abs(y1))
+            scale *= self.rtol
+            scale += self.atol
+            with np.errstate(all='ignore'):
+                error /= scale
+                err = float(np.sqrt(np.mean(error * error)))
+            if err != err: err = float('inf')
+            if err <= 1.0 or h <= hmin:
+                # Step accepted
+                if last: self.x = self.xmax
+                else: self.x = self.x + h
+                ynew = self.modify(y1.copy(), h)
+                if self.fsal and np.array_equal(ynew, y1):
+                    self.derivative = k[-1]
+                else:
+                    self.derivative = self.f(self.x, ynew)
+                self.y = ynew
+                if err == 0.0: factor = 5.0
+                else: 
+                    factor = min(5.0, max(0.2, 0.9 * err ** -self.exponent))
+                if self.rejected: factor = min(1.0, factor)
+                self.rejected = False
+                self.h = max(h * factor, hmin)
+                return
+            # Step rejected - retry with a smaller step
+            if err == float('inf'): factor = 0.2
+            else: factor = max(0.2, 0.9 * err ** -self.exponent)
+            self.rejected = True
+            self.h = max(h * factor, hmin)
+    def push_history(self):
+        '''
+        Adds the derivatives at the current step into the derivative 
+        history of multistep method, from the most recent.
+        '''
+        self.history[1:] = self.history[:-1]
+        self.history[0] = self.f(self.x, self.y)
+        self.history_count = min(self.history_count + 1, self.order)
+    def multistep_step(self):
+        '''
+        Performs a step of Adams-Bashforth-Moulton method, which is started 
+        by fourth order Runge-Kutta method.
+        '''
+        h = self.h
+        if self.history_count == 0: 
+            self.push_history()
+        if self.history_count < self.order:
+            self.fixed_step(h)
+        else:
+            yp = self.y + np.dot(h * self.predictor, self.history)
+            fp = self.f(self.x + h, yp)
+            y1 = self.y + (h * self.corrector[0]) * fp + \
+                np.dot(h * self.corrector[1:], self.history[:-1])
+            self.x = self.x + h
+            self.y = self.modify(y1, h)
+        self.push_history()
+    def step(self):
+        '''
+        Performs a step of integration.
+        
+        @return: [x] + y after the step
+        '''
+        if self.kind == 'fixed': self.fixed_step(self.h)
+        elif self.kind == 'embedded': self.embedded_step()
+        else: self.multistep_step()
+        self.steps = self.steps + 1
+        return self.row(self.x, self.y)
+    def __iter__(self):
+        '''
+        Generates the results ([x] + y) of integration from the current 
+        state until the maximum value of x-axis, where the initial values 
+        are generated only if no step has been performed. Checkpoints are 
+        saved, if requested, after the steps and before generating the 
+        results of the steps.
+        '''
+        if self.steps == 0: 
+            yield self.row(self.x, self.y)
+        saved = time.time()
+        while self.x < self.xmax:
+            result = self.step()
+            if self.checkpoint:
+                if self.checkpoint_steps is not None and \
+                    self.steps % int(self.checkpoint_steps) == 0:
+                    self.save(self.checkpoint)
+                    saved = time.time()
+                elif self.checkpoint_seconds is not None and \
+                    time.time() - saved >= self.checkpoint_seconds:
+                    self.save(self.checkpoint)
+                    saved = time.time()
+            yield result
+    def state(self):
+        '''
+        Gives the state of integration.
+        
+        @return: dictionary of state of integration
+        '''
+        if self.derivative is None: derivative = np.zeros(0)
+        else: derivative = np.array(self.derivative, dtype=float)
+        return {'method': np.array(self.method),
+                'x': np.array(self.x),
+                'y': self.y.copy(),
+                'h': np.array(self.h),
+                'steps': np.array(self.steps),
+                'rejected': np.array(self.rejected),
+                'derivative': derivative,
+                'history': self.history.copy(),
+                'history_count': np.array(self.history_count)}
+    def save(self, filename):
+        '''
+        Saves the state of integration into a binary (NumPy .npz) file. 
+        The state is first written into a temporary file, which then 
+        replaces the file, so that an interrupted save does not corrupt 
+        the previous checkpoint.
+        
+        @param filename: name of checkpoint file
+        @type filename: string
+        '''
+        temporary = str(filename) + '.tmp'
+        f = open(temporary, 'wb')
+        np.savez(f, **self.state())
+        f.close()
+        os.replace(temporary, filename)
+    def load(self, filename):
+        '''
+        Resumes the state of integration from a binary file saved by save 
+        method. The integrator must be constructed with the same system of 
+        ODEs and method as the saved integration.
+        
+        @param filename: name of checkpoint file
+        @type filename: string
+        '''
+        data = np.load(filename, allow_pickle=False)
+        if str(data['method']) != self.method:
+            raise FunctionParameterValueError(
+                'Checkpoint of method %s cannot be resumed by method %s' % 
+                (str(data['method']), self.method))
+        if len(data['y']) != len(self.y):
+            raise FunctionParameterValueError(
+                'Checkpoint of %s variables cannot be resumed with %s '
+                'variables' % (str(len(data['y'])), str(len(self.y))))
+        self.x = float(data['x'])
+        self.y = np.array(data['y'], dtype=float)
+        self.h = float(data['h'])
+        self.steps = int(data['steps'])
+        self.rejected = bool(data['rejected'])
+        if len(data['derivative']) == 0: self.derivative = None
+        else: self.derivative = np.array(data['derivative'], dtype=float)
+        self.history = np.array(data['history'], dtype=float)
+        self.history_count = int(data['history_count'])
+        data.close()
+
+def steady_state(funcs, x0, y0, step=0.1, transient=0.0, method='RK4',
+                 nonODEfunc=None, lower_bound=None, upper_bound=None,
+                 overflow=1e100, zerodivision=1e100,
+                 jacobian=None, tolerance=1e-10, maxiter=50):
+    '''
+    Finds a steady state of a system of ODEs, which is a root of f(x, y) 
+    = 0 for the variables, y, directly by Newton iteration, instead of 
+    integrating to a large value of x-axis.
+    
+    The initial guess of the steady state is obtained by integrating from 
+    the initial values for a short transient (transient parameter, on the 
+    x-axis) using an ODE solver (please see Integrator class for the 
+    supported methods), to move into the basin of attraction of the 
+    steady state. Each Newton step solves J dy = -f, where J is the 
+    Jacobian matrix of the system of ODEs (given as jacobian parameter, 
+    or approximated by finite differences using the sparsity pattern of 
+    the system of ODEs - please see jacobian_matrix function), by LU 
+    decomposition; or by least squares if J is singular, such as in 
+    systems of ODEs with conserved quantities (where the steady state 
+    found may not keep the conserved quantities of the initial values). 
+    The Newton step is then shortened by backtracking line search 
+    (halving the step) until the norm of f(x, y) decreases sufficiently 
+    (Armijo condition). The system of ODEs is taken as autonomous, at the 
+    value of x-axis at the end of the transient integration.
+    
+    nonODEfunc and boundaries (please see ODE solvers) are only applied 
+    during the transient integration.
+    
+    @param funcs: system of differential equations, either as a list 
+    of functions (one per ODE) or as a single function returning a NumPy 
+    array of derivatives (vectorized mode)
+    @type funcs: list or function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables
+    @type y0: list
+    @param step: step size of the transient integration. Default = 0.1
+    @type step: float
+    @param transient: length of transient integration on the x-axis. 
+    Default = 0.0 (no transient integration)
+    @type transient: float
+    @param method: name of ODE solver for the transient integration. 
+    Default = RK4
+    @type method: string
+    @param nonODEfunc: a function to modify the variable list (y0)
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param overflow: value (usually a large value) to assign in event of 
+    over flow error (usually caused by a large number). Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign in event 
+    of zero division error, which results in positive infinity. 
+    Default = 1e100.
+    @type zerodivision: float
+    @param jacobian: a function to calculate the Jacobian matrix (please 
+    see Rosenbrock). Default = None (finite difference approximation)
+    @type jacobian: function
+    @param tolerance: tolerance of the largest absolute derivative of 
+    variables at the steady state. Default = 1e-10.
+    @type tolerance: float
+    @param maxiter: maximum number of Newton iterations. Default = 50.
+    @type maxiter: integer
+    @return: [x] + y at the steady state, where x is the value of x-axis 
+    at the end of the transient integration
+    '''
+    x = x0
+    y = np.array(y0, dtype=float)
+    n = len(y)
+    if transient > 0.0:
+        for result in Integrator(funcs, x0, y0, step, x0 + transient,
+                                 method, nonODEfunc, lower_bound,
+                                 upper_bound, overflow, zerodivision):
+            pass
+        x = result[0]
+        y = np.array(result[1:], dtype=float)
+    (f, modify, row) = _array_functions(funcs, n, None, None, None,
+                                        overflow, zerodivision)
+    groups = None
+    if jacobian is None: groups = _jacobian_groups(funcs, f, x, y)
+    fy = f(x, y)
+    norm = float(np.sqrt(np.dot(fy, fy)))
+    for iteration in range(int(maxiter)):
+        if float(np.max(np.abs(fy))) <= tolerance:
+            return row(x, y)
+        if jacobian is None: J = _jacobian_fd(f, x, y, fy, groups)
+        else: J = np.array(jacobian(x, y), dtype=float)
+        with np.errstate(all='ignore'):
+            dy = _lu_solve(_lu_factor(J), -fy)
+        if not np.isfinite(dy).all():
+            dy = np.linalg.lstsq(J, -fy, rcond=None)[0]
+        # Backtracking line search on the norm of f(x, y)
+        fraction = 1.0
+        while True:
+            yn = y + fraction * dy
+            fn = f(x, yn)
+            normn = float(np.sqrt(np.dot(fn, fn)))
+            if normn <= (1.0 - 1e-4 * fraction) * norm or \
+                fraction < 1e-3:
+                break
+            fraction = 0.5 * fraction
+        (y, fy, norm) = (yn, fn, normn)
+    if float(np.max(np.abs(fy))) <= tolerance:
+        return row(x, y)
+    raise MaxIterationsException('Steady state not found in %s Newton '
+                                 'iterations: max(|dy/dt|) = %s' %
+                                 (str(maxiter),
+                                  str(float(np.max(np.abs(fy))))))
+
+def _compile_ensemble_boundary(boundary, runs):
+    '''
+    Private function - converts a boundary dictionary (please see 
+    boundary_checker) into NumPy arrays for ensemble integration. Boundary 
+    values and values to set can either be a single value for all runs or 
+    a list of values, one per run.
+    
+    @param boundary: set of values for boundary of variables
+    @type boundary: dictionary
+    @param runs: number of runs in the ensemble
+    @type runs: integer
+    @return: tuple of (indices, boundary values, values to set), where 
+    boundary values and values to set are arrays of (runs x number of 
+    bounded variables), or None if there is no boundary
+    '''
+    if not boundary: return None
+    keys = list(boundary.keys())
+    index = np.array([int(k) for k in keys], dtype=int)
+    limit = np.empty((runs, len(keys)))
+    value = np.empty((runs, len(keys)))
+    for j in range(len(keys)):
+        limit[:, j] = boundary[keys[j]][0]
+        value[:, j] = boundary[keys[j]][1]
+    return (index, limit, value)
+
+def ensemble(funcs, x0, y0, step, xmax, parameters=None, ODE_solver='RK4',
+             nonODEfunc=None, lower_bound=None, upper_bound=None,
+             terminate=None, overflow=1e100, zerodivision=1e100):
+    '''
+    Generator to integrate a system of ODEs for many runs (sets of initial 
+    conditions and/or parameters) in lockstep, using a fixed step solver. 
+    The states of all runs are kept as a matrix of (number of runs x 
+    number of variables) and every stage is a single evaluation of funcs 
+    over all active runs.
+    
+    The system of ODEs (funcs) is a single function taking x, the matrix 
+    of variables (Y) and, if parameters is given, the matrix of parameters 
+    (P) of (number of runs x number of parameters); and returns the matrix 
+    of derivatives. For example, the decay of many radioactive samples, 
+    each with its own decay constant, can be written as
+    
+    >>> def decay(t, Y, P):
+            return -P[:, 0:1] * Y
+    
+    A function (as nonODEfunc parameter) can be included to modify the 
+    matrix of variables at each step; it takes the matrix of variables 
+    and step, and returns the modified matrix of variables.
+    
+    Upper and lower boundaries of one or more variable can be set using 
+    upper_bound and lower_bound parameters respectively, as in 
+    boundary_checker, which will be applied to each run. The boundary value 
+    and the value to set can also be a list of values, one per run; for 
+    example, {'0': [[0.0, 1.0, 2.0], 0.0]} sets different lower boundaries 
+    for variable y[0] in each of 3 runs.
+    
+    Runs can be terminated individually using terminate parameter, which 
+    is a function taking x, the matrix of variables and the matrix of 
+    parameters (None if parameters is not given), and returns a boolean 
+    array with True for runs to be terminated. Terminated runs are no 
+    longer integrated and their variables remain at the values at 
+    termination. Integration ends when x reaches xmax or when all runs are 
+    terminated.
+    
+    @param funcs: system of differential equations
+    @type funcs: function
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param y0: initial values for variables of each run
+    @type y0: list of lists or numpy.ndarray
+    @param step: step size on the x-axis (also known as step in calculus)
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param parameters: parameter values of each run. Default = None
+    @type parameters: list of lists or numpy.ndarray
+    @param ODE_solver: name of fixed step ODE solver to use; such as 
+    Euler, Heun, RK3, RK4, RK38, CK4, CK5, RKF4, RKF5, DP4 or DP5. 
+    Default = RK4
+    @type ODE_solver: string
+    @param nonODEfunc: a function to modify the matrix of variables
+    @type nonODEfunc: function
+    @param lower_bound: set of values for lower boundary of variables
+    @type lower_bound: dictionary
+    @param upper_bound: set of values for upper boundary of variables
+    @type upper_bound: dictionary
+    @param terminate: a function to select runs for termination
+    @type terminate: function
+    @param overflow: value (usually a large value) to assign to positive 
+    infinity (usually caused by over flow) during integration. 
+    Default = 1e100.
+    @type overflow: float
+    @param zerodivision: value (usually a large value) to assign to 
+    undefined results (NaN, such as 0/0) during integration. 
+    Default = 1e100.
+    @type zerodivision: float
+    @return: generator of (x, matrix of variables, boolean array of 
+    active runs) at every step
+    '''
+    if ODE_solver not in _fixed_tableau:
+        raise FunctionParameterValueError('Unknown fixed step ODE '
+                                          'solver: %s' % str(ODE_solver))
+    (c, a, b) = _tableau_arrays(_fixed_tableau[ODE_solver])
+    s = len(c)
+    Y = np.array(y0, dtype=float)
+    if Y.ndim == 1: Y = Y.reshape(1, -1)
+    (runs, n) = Y.shape
+    if parameters is not None:
+        P = np.array(parameters, dtype=float)
+        if P.ndim == 1: P = P.reshape(runs, -1)
+    else:
+        P = None
+    lower = _compile_ensemble_boundary(lower_bound, runs)
+    upper = _compile_ensemble_boundary(upper_bound, runs)
+    active = np.ones(runs, dtype=bool)
+    division = _ZeroDivision()
+    def evaluate(x, Ya, Pa, out):
+        with division.errstate():
+            if Pa is None: out[:] = funcs(x, Ya)
+            else: out[:] = funcs(x, Ya, Pa)
+        if not np.isfinite(out).all():
+            _replace_nonfinite(out, overflow, zerodivision, 
+                               division.occurred)
+    def bound(Ya, rows, boundary, type):
+        (index, limit, value) = boundary
+        current = Ya[:, index]
+        if type == 'lower': exceeded = current < limit[rows]
+        else: exceeded = current > limit[rows]
+        if exceeded.any():
+            Ya[:, index] = np.where(exceeded, value[rows], current)
+    if terminate is not None:
+        active = active & ~np.asarray(terminate(x0, Y, P), dtype=bool)
+    yield (x0, Y.copy(), active.copy())
+    size = None
+    while x0 < xmax and active.any():
+        if active.all():
+            rows = slice(None)
+            Ya = Y
+            Pa = P
+        else:
+            rows = np.flatnonzero(active)
+            Ya = Y[rows]
+            if P is None: Pa = None
+            else: Pa = P[rows]
+        # Buffers are reallocated only when the number of active runs 
+        # changes
+        if size != Ya.shape[0]:
+            size = Ya.shape[0]
+            k = np.empty((s, size, n))
+            kflat = k.reshape(s, size * n)
+            Ytemp = np.empty((size, n))
+            Yflat = Ytemp.reshape(size * n)
+        evaluate(x0, Ya, Pa, k[0])
+        for st in range(1, s):
+            np.dot(a[st, :st], kflat[:st], out=Yflat)
+            Ytemp *= step
+            Ytemp += Ya
+            evaluate(x0 + c[st]*step, Ytemp, Pa, k[st])
+        Y1 = np.dot(b, kflat).reshape(size, n)
+        Y1 *= step
+        Y1 += Ya
+        if nonODEfunc:
+            Y1 = np.asarray(nonODEfunc(Y1, step), dtype=float)
+        if lower is not None: bound(Y1, rows, lower, 'lower')
+        if upper is not None: bound(Y1, rows, upper, 'upper')
+        Y[rows] = Y1
+        x0 = x0 + step
+        if terminate is not None:
+            stop = np.asarray(terminate(x0, Y, P), dtype=bool)
+            active = active & ~stop
+        yield (x0, Y.copy(), active.copy())
+
+class ResultSink(abc.ABC):
+    '''
+    Abstract base class for result sinks, which collect the results 
+    ([x] + y) generated by ODE solvers, so that results are written in 
+    blocks of rows instead of one row at a time. Results are buffered in a 
+    NumPy array of block_size rows, which is written out (write_block 
+    method, to be implemented by sub-classes) when full and when the sink 
+    is flushed or closed. For example,
+    
+    >>> sink = ode.NPYSink('results.npy')
+    >>> sink.extend(ode.RK4(ODE, 0.0, y, 0.1, 100.0))
+    >>> sink.close()
+    
+    Result sinks can also be used as context managers, which close the 
+    sink on exit.
+    '''
+    def __init__(self, block_size=1024):
+        '''
+        Constructor method.
+        
+        @param block_size: number of rows (results) per block. 
+        Default = 1024.
+        @type block_size: integer
+        '''
+        self.block_size = max(int(block_size), 1)
+        self.block = None
+        self.count = 0
+        self.rows = 0
+        self.columns = None
+    def write(self, row):
+        '''
+        Adds a result ([x] + y) into the sink.
+        
+        @param row: result from ODE solver
+        @type row: list or numpy.ndarray
+        '''
+        if self.block is None:
+            self.columns = len(row)
+            self.block = np.empty((self.block_size, self.columns))
+        self.block[self.count] = row
+        self.count = self.count + 1
+        if self.count == self.block_size: 
+            self.flush()
+    def extend(self, rows):
+        '''
+        Adds all results from an ODE solver into the sink.
+        
+        @param rows: generator of results from ODE solver
+        @return: the sink
+        '''
+        for row in rows: 
+            self.write(row)
+        return self
+    def flush(self):
+        '''
+        Writes out buffered results as a block.
+        '''
+        if self.count:
+            self.write_block(self.block[:self.count])
+            self.rows = self.rows + self.count
+            self.count = 0
+    @abc.abstractmethod
+    def write_block(self, block):
+        '''
+        Writes out a block of results. To be implemented by sub-classes.
+        
+        @param block: block of results, one result per row
+        @type block: numpy.ndarray
+        '''
+    def close(self):
+        '''
+        Writes out buffered results and closes the sink.
+        '''
+        self.flush()
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class CSVSink(ResultSink):
+    '''
+    Result sink to write results into a comma-delimited (CSV) file, in 
+    blocks of rows with one file write per block.
+    '''
+    def __init__(self, filename, header=None, block_size=1024):
+        '''
+        Constructor method.
+        
+        @param filename: name of CSV file to write into
+        @type filename: string
+        @param header: list of column names to be written as the first 
+        line. Default = None (no header)
+        @type header: list
+        @param block_size: number of rows (results) per block. 
+        Default = 1024.
+        @type block_size: integer
+        '''
+        ResultSink.__init__(self, block_size)
+        self.file = open(filename, 'w')
+        if header:
+            self.file.write(','.join([str(h) for h in header]) + '\n')
+    def write_block(self, block):
+        lines = [','.join([repr(item) for item in row]) 
+                 for row in block.tolist()]
+        self.file.write('\n'.join(lines) + '\n')
+    def close(self):
+        self.flush()
+        self.file.close()
+
+class NPYSink(ResultSink):
+    '''
+    Result sink to write results into a NumPy (.npy) binary file of 64-bit 
+    floats, with one result per row. Blocks of results are appended to the 
+    file as raw binary, and the array shape in the header of the file is 
+    updated when the sink is closed. Hence, the file can be loaded by 
+    numpy.load, or memory-mapped (please see load method) without reading 
+    the whole file into memory.
+    '''
+    # Total length of the header of .npy file (format version 1.0), which 
+    # is fixed so that the header can be rewritten in place
+    header_length = 128
+    def __init__(self, filename, block_size=1024):
+        '''
+        Constructor method.
+        
+        @param filename: name of .npy file to write into
+        @type filename: string
+        @param block_size: number of rows (results) per block. 
+        Default = 1024.
+        @type block_size: integer
+        '''
+        ResultSink.__init__(self, block_size)
+        self.filename = filename
+        self.file = open(filename, 'wb')
+        self.file.write(self.header())
+    def header(self):
+        '''
+        Generates the header of .npy file for the results written.
+        
+        @return: header of .npy file
+        @rtype: bytes
+        '''
+        header = "{'descr': '<f8', 'fortran_order': False, " + \
+            "'shape': (%d, %d), }" % (self.rows, self.columns or 0)
+        header = header + ' ' * (self.header_length - 11 - len(header))
+        header = header + '\n'
+        return b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + \
+            header.encode('latin1')
+    def write_block(self, block):
+        self.file.write(np.asarray(block, dtype='<f8').tobytes())
+    def close(self):
+        self.flush()
+        self.file.seek(0)
+        self.file.write(self.header())
+        self.file.close()
+    def load(self, mmap_mode='r'):
+        '''
+        Loads the results written (after the sink is closed).
+        
+        @param mmap_mode: memory-map mode (please see numpy.load). 
+        Default = 'r' (read-only memory map).
+        @return: results, one result per row
+        @rtype: numpy.ndarray
+        '''
+        return np.load(self.filename, mmap_mode=mmap_mode)
+
+class ArraySink(ResultSink):
+    '''
+    Result sink to collect results into a preallocated NumPy array in 
+    memory, with one result per row. The array is doubled in size when 
+    full; hence, capacity should be given as the expected number of 
+    results (such as (xmax - x0) / step + 1 for fixed step solvers).
+    '''
+    def __init__(self, capacity=1024):
+        '''
+        Constructor method.
+        
+        @param capacity: initial number of rows (results) to allocate. 
+        Default = 1024.
+        @type capacity: integer
+        '''
+        ResultSink.__init__(self, capacity)
+        self.data = None
+    def write(self, row):
+        if self.data is None:
+            self.columns = len(row)
+            self.data = np.empty((self.block_size, self.columns))
+        elif self.rows == len(self.data):
+            data = np.empty((2 * len(self.data), self.columns))
+            data[:self.rows] = self.data
+            self.data = data
+        self.data[self.rows] = row
+        self.rows = self.rows + 1
+    def write_block(self, block):
+        '''
+        Adds a block of results into the array.
+        
+        @param block: block of results, one result per row
+        @type block: numpy.ndarray
+        '''
+        for row in block:
+            self.write(row)
+    def array(self):
+        '''
+        Gives the results collected.
+        
+        @return: results, one result per row
+        @rtype: numpy.ndarray
+        '''
+        if self.data is None: return np.empty((0, 0))
+        return self.data[:self.rows]
+
+class _ResultProducer(threading.Thread):
+    '''
+    Private class - background thread to consume a generator of results 
+    from an ODE solver into a bounded queue, for threaded_results and 
+    async_results. Results are queued in blocks of up to block_size 
+    results; a smaller block is queued whenever the queue is empty, so 
+    that an idle consumer is not kept waiting. The end of results is 
+    queued as None, and an exception from the ODE solver is queued to be 
+    raised by the consumer.
+    '''
+    def __init__(self, rows, maxsize, block_size):
+        '''
+        Constructor method.
+        
+        @param rows: generator of results from ODE solver
+        @param maxsize: maximum number of blocks in the queue
+        @type maxsize: integer
+        @param block_size: maximum number of results per block
+        @type block_size: integer
+        '''
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.rows = rows
+        self.queue = queue.Queue(max(int(maxsize), 1))
+        self.block_size = max(int(block_size), 1)
+        self.stopped = threading.Event()
+    def put(self, item):
+        '''
+        Puts an item into the queue, waiting while the queue is full, 
+        unless the consumer has stopped.
+        
+        @return: True if the item is queued; False if the consumer has 
+        stopped
+        '''
+        while not self.stopped.is_set():
+            try: 
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full: 
+                pass
+        return False
+    def get(self):
+        '''
+        Gets an item from the queue, waiting while the queue is empty, 
+        unless the consumer has stopped.
+        
+        @return: block of results, None (end of results or stopped), or 
+        exception
+        '''
+        while not self.stopped.is_set():
+            try: 
+                return self.queue.get(timeout=0.1)
+            except queue.Empty: 
+                pass
+        return None
+    def run(self):
+        try:
+            block = []
+            for row in self.rows:
+                block.append(row)
+                if len(block) >= self.block_size or self.queue.empty():
+                    if not self.put(block): break
+                    block = []
+            else:
+                if block: self.put(block)
+                self.put(None)
+        except Exception as e:
+            self.put(e)
+        if self.stopped.is_set() and hasattr(self.rows, 'close'):
+            self.rows.close()
+    def stop(self):
+        '''
+        Stops the thread, when the consumer stops.
+        '''
+        self.stopped.set()
+
+def threaded_results(rows, maxsize=16, block_size=256):
+    '''
+    Generator to run an ODE solver (generator of results) in a background 
+    thread and generate its results in the calling thread, where results 
+    are passed through a bounded queue. Hence, processing of results (such 
+    as writing into a file or result sink) overlaps with the integration 
+    of ODEs, and the integration waits (backpressure) when maxsize blocks 
+    of results are waiting to be processed. For example,
+    
+    >>> sink = ode.CSVSink('results.csv')
+    >>> sink.extend(ode.threaded_results(ode.RK4(ODE, 0.0, y, 0.1, 100.0)))
+    >>> sink.close()
+    
+    The ODE solver is stopped when this generator is closed. Exception 
+    raised by the ODE solver is raised in the calling thread.
+    
+    @param rows: generator of results from ODE solver
+    @param maxsize: maximum number of blocks of results in the queue. 
+    Default = 16.
+    @type maxsize: integer
+    @param block_size: maximum number of results per block. Default = 256.
+    @type block_size: integer
+    @return: generator of results
+    '''
+    producer = _ResultProducer(rows, maxsize, block_size)
+    producer.start()
+    try:
+        while True:
+            item = producer.get()
+            if item is None: return
+            if isinstance(item, Exception): raise item
+            for row in item: 
+                yield row
+    finally:
+        producer.stop()
+
+async def async_results(rows, maxsize=16, block_size=256):
+    '''
+    Asynchronous generator to run an ODE solver (generator of results) in 
+    a background thread, for consumers on an asyncio event loop. Waiting 
+    for results is done in the default executor of the event loop; hence, 
+    the event loop is not blocked by the integration of ODEs. For example,
+    
+    >>> async def dashboard():
+            async for x in ode.async_results(ode.RK4(ODE, 0.0, y, 0.1, 
+                                                     100.0)):
+                await send(x)
+    
+    Please see threaded_results for the queue of results.
+    
+    @param rows: generator of results from ODE solver
+    @param maxsize: maximum number of blocks of results in the queue. 
+    Default = 16.
+    @type maxsize: integer
+    @param block_size: maximum number of results per block. Default = 256.
+    @type block_size: integer
+    @return: asynchronous generator of results
+    '''
+    loop = asyncio.get_running_loop()
+    producer = _ResultProducer(rows, maxsize, block_size)
+    producer.start()
+    try:
+        while True:
+            item = await loop.run_in_executor(None, producer.get)
+            if item is None: return
+            if isinstance(item, Exception): raise item
+            for row in item: 
+                yield row
+    finally:
+        producer.stop()
+
+class _NameSubstitution(ast.NodeTransformer):
+    '''
+    Private class - AST transformer to replace names (such as parameters 
+    and variables) in expressions by other expressions. Only whole names 
+    are replaced; hence, a name within another name (such as 'rate' in 
+    'death_rate') or an attribute (such as 'exp' in 'math.exp') is not 
+    replaced.
+    '''
+    def __init__(self, replacements):
+        '''
+        Constructor method.
+        
+        @param replacements: dictionary of names to be replaced as keys 
+        and source codes of replacing expressions as values
+        @type replacements: dictionary
+        '''
+        self.replacements = dict([(str(k), ast.parse(str(v), 
+                                                     mode='eval').body)
+                                  for (k, v) in replacements.items()])
+    def visit_Name(self, node):
+        if node.id not in self.replacements:
+            return node
+        new = copy.deepcopy(self.replacements[node.id])
+        if isinstance(new, (ast.Name, ast.Subscript)):
+            new.ctx = node.ctx
+        return ast.copy_location(new, node)
+
+def _substitute(source, replacements, mode='eval'):
+    '''
+    Private function - replaces names in source codes of an expression 
+    (mode = 'eval') or statements (mode = 'exec') using the abstract 
+    syntax tree (please see _NameSubstitution).
+    
+    @param source: source codes of expression or statements
+    @type source: string
+    @param replacements: dictionary of names to be replaced as keys 
+    and source codes of replacing expressions as values
+    @type replacements: dictionary
+    @param mode: type of source codes; either 'eval' (expression) or 
+    'exec' (statements). Default = 'eval'
+    @type mode: string
+    @return: source codes after replacement
+    @rtype: string
+    '''
+    tree = ast.parse(str(source).strip(), mode=mode)
+    tree = _NameSubstitution(replacements).visit(tree)
+    tree = ast.fix_missing_locations(tree)
+    return ast.unparse(tree)
+
+def _equation_constructor(expressions={},
+                          parameters={},
+                          variables={}):
+    '''
+    Private function to support ODE_constructor to generate ODE function 
+    for each ODE.
+    
+    @param expressions: dictionary of expressions for ODE(s). Please see 
+    above documentation. 
+    @param parameters: dictionary of parameter values to be substituted 
+    into the ODE equations
+    @param variables: dictionary of variables to be substituted as keys 
+    and their positions in the variable list as values
+    @return: tuple of (<list of generated ODE functions>, <list of 
+    variables>) 
+    '''
+    statements = []
+    replacements = dict([(str(k), str(parameters[k])) 
+                         for k in parameters.keys()])
+    for v in variables.keys():
+        replacements[str(v)] = 'y[%s]' % str(variables[v])
+    # Generate ODE function, one at a time
+    for name in expressions.keys():
+        # Generate ODE function definition
+        stmt = '\ndef %s(t, y):' % str(name)
+        expression = expressions[name]
+        if type(expression) == type(''): expression = [expression]
+        count = 1
+        # Generate list of expression(s) for current ODE function
+        exp_list = []
+        for exp in expression:
+            # Substitute parameter/variable values 
+            exp = _substitute(exp, replacements)
+            # Generate expression codes
+            stmt = stmt + '\n    exp_%s = %s' % (str(count), str(exp))
+            exp_list.append('exp_%s' % str(count))
+            count = count + 1
+        # Compile generated expressions into return value
+        return_stmt = '\n    return ' + ' + '.join(exp_list)
+        stmt = stmt + return_stmt
+        statements.append(stmt)
+    return (statements, list(variables.keys()))
+
+class _SubexpressionReplacement(ast.NodeTransformer):
+    '''
+    Private class - AST transformer to replace every occurrence of a 
+    subexpression by a name.
+    '''
+    def __init__(self, key, name):
+        '''
+        Constructor method.
+        
+        @param key: dump (ast.dump) of the subexpression to be replaced
+        @type key: string
+        @param name: name to replace the subexpression with
+        @type name: string
+        '''
+        self.key = key
+        self.name = name
+    def visit(self, node):
+        if isinstance(node, _guarded_nodes): return node
+        if isinstance(node, ast.expr) and ast.dump(node) == self.key:
+            return ast.copy_location(ast.Name(id=self.name, ctx=ast.Load()),
+                                     node)
+        return self.generic_visit(node)
+
+# Nodes of expressions where common subexpressions are not searched or 
+# replaced - branches which may not be evaluated (conditional expressions 
+# and boolean operations), and local names (lambda and comprehensions)
+_guarded_nodes = (ast.IfExp, ast.BoolOp, ast.Lambda, ast.ListComp, 
+                  ast.SetComp, ast.DictComp, ast.GeneratorExp)
+# Nodes of pure arithmetic subexpressions over names and constants, which 
+# can be computed once in place of every occurrence
+_pure_nodes = (ast.BinOp, ast.UnaryOp, ast.Name, ast.Constant, 
+               ast.Subscript, ast.operator, ast.unaryop, ast.expr_context)
+
+def _subexpression_candidates(tree):
+    '''
+    Private generator - gives the candidate subexpressions of an 
+    expression for common subexpression elimination (please see 
+    _fused_constructor), which are arithmetic operations (ast.BinOp and 
+    ast.UnaryOp) of names and constants only. Function calls are not 
+    candidates as they may not be pure (such as random numbers), and 
+    subexpressions under conditional expressions, boolean operations, 
+    lambda and comprehensions are not candidates as they may not be 
+    evaluated, or be evaluated a different number of times.
+    
+    @param tree: abstract syntax tree of the expression
+    @return: generator of candidate nodes
+    '''
+    nodes = [tree]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, _guarded_nodes): continue
+        nodes.extend(ast.iter_child_nodes(node))
+        if not isinstance(node, (ast.BinOp, ast.UnaryOp)): continue
+        if isinstance(node, ast.UnaryOp) and \
+            isinstance(node.operand, ast.Constant): continue
+        if all([isinstance(n, _pure_nodes) for n in ast.walk(node)]):
+            yield node
+
+def _fused_constructor(expressions, variables, replacements):
+    '''
+    Private function to support ODE_constructor and ODE_compiler to 
+    generate the body of a single (fused) ODE function for all ODEs, where 
+    common subexpressions across all expressions are computed once. 
+    
+    After substitution of names, the largest subexpression (such as 
+    'transmission_rate * human * zombie') occurring more than once is 
+    repeatedly assigned to a temporary variable (_cse0, _cse1, ...) and 
+    replaced by the temporary variable in all expressions, until no 
+    subexpression occurs more than once. Only arithmetic subexpressions of 
+    names and constants, which are not within conditional expressions, 
+    boolean operations, lambda or comprehensions, are eliminated (please 
+    see _subexpression_candidates); hence, the temporary variables are 
+    only computed where the original expressions are always computed.
+    
+    @param expressions: dictionary of expressions for ODE(s). Please see 
+    ODE_constructor. 
+    @param variables: list of variables in the order of the variable array
+    @param replacements: dictionary of names to be replaced as keys and 
+    source codes of replacing expressions as values
+    @return: tuple of (<list of statements for temporary variables, in 
+    order of execution>, <list of expressions of derivatives, in the order 
+    of variables>)
+    '''
+    trees = []
+    for v in variables:
+        if v not in expressions:
+            trees.append(ast.Constant(value=0.0))
+            continue
+        expression = expressions[v]
+        if type(expression) == type(''): expression = [expression]
+        terms = [ast.parse(_substitute(exp, replacements), mode='eval').body
+                 for exp in expression]
+        tree = terms[0]
+        for term in terms[1:]:
+            tree = ast.BinOp(left=tree, op=ast.Add(), right=term)
+        trees.append(tree)
+    definitions = []
+    while True:
+        counts = {}
+        sizes = {}
+        nodes = {}
+        for tree in trees + [d[1] for d in definitions]:
+            for node in _subexpression_candidates(tree):
+                key = ast.dump(node)
+                if key in counts:
+                    counts[key] = counts[key] + 1
+                else:
+                    counts[key] = 1
+                    sizes[key] = len(list(ast.walk(node)))
+                    nodes[key] = node
+        shared = [key for key in counts.keys() if counts[key] > 1]
+        if not shared: break
+        key = max(shared, key=lambda k: (sizes[k], counts[k]))
+        name = '_cse%s' % str(len(definitions))
+        definition = copy.deepcopy(nodes[key])
+        transformer = _SubexpressionReplacement(key, name)
+        trees = [transformer.visit(tree) for tree in trees]
+        definitions = [(d[0], transformer.visit(d[1])) 
+                       for d in definitions]
+        definitions.append((name, definition))
+    # Smaller subexpressions are found later but may be used by larger 
+    # subexpressions found earlier; hence, the reverse order
+    definitions.reverse()
+    statements = ['%s = %s' % (d[0], 
+                               ast.unparse(ast.fix_missing_locations(d[1])))
+                  for d in definitions]
+    derivatives = [ast.unparse(ast.fix_missing_locations(tree)) 
+                   for tree in trees]
+    return (statements, derivatives)
+
+def _modifying_constructor(modifying_expressions):
+    '''
+    Private function to support ODE_constructor to generate function code 
+    for modifying expressions.
+    
+    @param modifying_expressions: list of expressions to modify the 
+    variables
+    @return: generated function code
+    '''
+    stmt = '\ndef modifying_expression(y, step):'
+    for exp in modifying_expressions:
+        stmt = stmt + '\n    %s' % str(exp)
+    stmt = stmt + '\n    return y'
+    return stmt
+
+def ODE_constructor(scriptfile,
+                    resultsfile,
+                    time=(0.0, 0.1, 100.0),
+                    ODE_solver='RK4',
+                    expressions={},
+                    parameters={},
+                    initial_conditions={},
+                    modifying_expressions=[],
+                    lower_bound=None, 
+                    upper_bound=None,
+                    overflow=1e100, 
+                    zerodivision=1e100,
+                    fused=False,
+                    resultsink='CSV'):
+    '''
+    Function to construct an ODE simulation script file from given 
+    definitions.
+    
+    For example, the following system of ODEs::
+    
+        d(human)/dt = birth - zombied - death
+        d(zombie)/dt = zombied + resurrected - destroyed
+        d(dead)/dt = death + destroyed - resurrected
+        
+        birth = 0
+        zombied = 0.0095 * human * zombie
+        death = 0.0001 * human
+        resurrected = 0.0002 * dead
+        destroyed = 0.0003 * human * zombie
+         
+        where initially (t0), 
+         
+        number of humans = 500
+        number of zombies = 0
+        number of dead = 0
+         
+        and with the following boundaries
+         
+        number of humans > 0
+        number of zombies < 10000
+        number of dead < 10000
+         
+        and there is an influx of 5 humans per day into the infected village
+    
+    can be specified as 
+    
+    >>> scriptfile = 'zombie_attack.py'
+        resultsfile = 'zombie_data.csv'
+        time = (0.0, 0.1, 100.0)
+        ODE_solver = 'RK4'
+        expressions = {'human': ['birth_rate',
+                                 '- (transmission_rate * human * zombie)',
+                                 '- (death_rate * human)'],
+                       'zombie': ['(transmission_rate * human * zombie)',
+                                  '(resurrection_rate * dead)',
+                                  '- (destroy_rate * human * zombie)'],
+                       'dead': ['(death_rate * human)',
+                                '(destroy_rate * human * zombie)',
+                                '- (resurrection_rate * dead)']}
+        parameters = {'birth_rate': 0.0,           # birth rate
+                      'transmission_rate': 0.0095, # transmission percent   
+                      'death_rate': 0.0001,        # natural death percent  
+                      'resurrection_rate': 0.0002, # resurect percent  
+                      'destroy_rate':0.0003        # destroy percent   
+                      }
+        initial_conditions = {'human': 500.0,
+                              'zombie': 0.0, 
+                              'dead': 0.0}
+        modifying_expression = ['human = human + (5 * step)']
+        lower_bound = {'human': [0.0, 0.0]}
+        upper_bound = {'zombie': [10000.0, 10000.0],
+                       'dead': [10000.0, 10000.0]}
+        overflow = 1e100
+        zerodivision = 1e100
+    
+    @param scriptfile: name of Python file for the generated ODE script 
+    file
+    @type scriptfile: string
+    @param resultsfile: name of ODE simulation results file (CSV or .npy 
+    file, please see resultsink), which will be included into the 
+    generated simulation script file
+    @type resultsfile: string    
+    @param time: tuple of time parameters for simulation in the format of 
+    (<start time>, <time step>, <end time>). Default = (0.0, 0.1, 100.0)
+    @param ODE_solver: name of ODE solver to use. Default = RK4
+    @param expressions: dictionary of expressions for ODE(s). Please see 
     above documentation. 
     @param parameters: dictionary of parameter values to be substituted 
     into the ODE equations
@@ -1456,66 +5787,90 @@ def ODE_constructor(scriptfile,
     of zero division error, which results in positive infinity, during 
     integration. Default = 1e100.
     @type zerodivision: float
+    @param fused: flag to generate a single vectorized ODE function for 
+    all ODEs (please see vectorized mode of ODE solvers) instead of one 
+    function per ODE, where common subexpressions across all expressions 
+    (such as 'transmission_rate * human * zombie' above) are computed 
+    once per evaluation. Default = False.
+    @type fused: boolean
+    @param resultsink: type of result sink to write the results with, 
+    either 'CSV' (CSVSink) or 'NPY' (NPYSink, for a binary NumPy file), 
+    where results are written in blocks of rows. Default = 'CSV'.
+    @type resultsink: string
     @return: generated ODE codes for the entire script
     @rtype: list
     '''
     statements = [] 
-    initial_conditions_list = initial_conditions.keys()
-    # Construct ODE functions
-    (ODE_functions,
-     variables) = _equation_constructor(expressions,
-                                        parameters,
-                                        initial_conditions_list)
-    # Construct modifying expression
-    mexpression = _modifying_constructor(modifying_expressions)
+    initial_conditions_list = list(initial_conditions.keys())
     # Generate ODE functions/equations table
     table = {}
     count = 0
     for v in initial_conditions_list:
-        table[str(v)] = str(count)
+        table[str(v)] = count
         count = count + 1
+    # Construct ODE functions
+    (ODE_functions,
+     variables) = _equation_constructor(expressions,
+                                        parameters,
+                                        table)
+    replacements = dict([(str(k), str(parameters[k])) 
+                         for k in parameters.keys()])
+    for v in table.keys():
+        replacements[v] = 'y[%s]' % str(table[v])
+    if fused:
+        (temporaries, derivatives) = _fused_constructor(expressions, 
+                                                        variables, 
+                                                        replacements)
+        stmt = '\ndef ODE(t, y):'
+        for temporary in temporaries:
+            stmt = stmt + '\n    %s' % temporary
+        stmt = stmt + '\n    return np.array([%s])' % ', '.join(derivatives)
+        ODE_functions = [stmt]
+    # Construct modifying expression
+    mexpression = _modifying_constructor([_substitute(exp, replacements, 
+                                                      'exec')
+                                          for exp in modifying_expressions])
     # Generate lower boundary table
     if lower_bound != None:
         lbound = {}
         for k in lower_bound.keys():
-            lbound[table[k]] = lower_bound[k]
+            lbound[str(table[k])] = lower_bound[k]
     else:
         lbound = None
     # Generate upper boundary table
     if upper_bound != None:
         ubound = {}
         for k in upper_bound.keys():
-            ubound[table[k]] = upper_bound[k]
+            ubound[str(table[k])] = upper_bound[k]
     else:
         ubound = None
     # Write ode module import
-    statements.append('import ode\n\n')  
+    if fused:
+        statements.append('import numpy as np\n')
+    statements.append('from copads import ode\n\n')  
     # Generate variable array and statements
-    statements.append('y = range(%s)\n' % str(len(variables)))
+    statements.append('y = [0.0] * %s\n' % str(len(variables)))
     count = 0
     for k in initial_conditions_list:
         statements.append('y[%s] = %s\n' % \
                           (str(count), str(initial_conditions[k])))
         count = count + 1
     statements.append('\n')
-    # Perform variable replacements in ODE functions, and write functions
+    # Write ODE functions
     for funct in ODE_functions:
-        for v in table.keys():
-            funct = funct.replace('v@'+v, 'y[%s]' % table[v])
         statements.append(funct)
     statements.append('\n\n')
-    # Perform variable replacements in modifying expression, and write out
-    for v in table.keys():
-        mexpression = mexpression.replace(v, 'y[%s]' % table[v])
+    # Write modifying expression
     statements.append(mexpression)
     statements.append('\n\n')
     # Generate ODE assignment array and statements
-    statements.append('ODE = range(%s)\n' % str(len(variables)))
-    count = 0
-    for k in initial_conditions_list:
-        statements.append('ODE[%s] = %s\n' % (str(count), str(k)))
-        count = count + 1
-    statements.append('\n')
+    if not fused:
+        statements.append('ODE = [None] * %s\n' % str(len(variables)))
+        count = 0
+        for k in initial_conditions_list:
+            statements.append('ODE[%s] = %s\n' % (str(count), str(k)))
+            count = count + 1
+        statements.append('\n')
     # Generate ODE execution codes
     statements.append('stime = %s \n' % str(time[0]))
     statements.append('step = %s \n' % str(time[1]))
@@ -1525,23 +5880,408 @@ def ODE_constructor(scriptfile,
     statements.append('overflow = %s \n' % str(overflow))
     statements.append('zerodivision = %s \n' % str(zerodivision))
     statements.append('\n')
-    statements.append("f = open('%s', 'w')\n" % str(resultsfile))
     headers = ['time'] + [str(k)for k in initial_conditions.keys()]
-    headers = ','.join(headers)
-    statements.append("f.write('%s' + '\\n') \n" % headers)
+    if str(resultsink).upper() == 'NPY':
+        statements.append("sink = ode.NPYSink('%s')\n" % str(resultsfile))
+    else:
+        statements.append("sink = ode.CSVSink('%s', %s)\n" % 
+                          (str(resultsfile), str(headers)))
     statements.append('\n')
     statements.append('for x in ode.%s(ODE, stime, y, step, etime, \n' % \
                       str(ODE_solver))
     statements.append('        modifying_expression, \n') 
     statements.append('        lower_bound, upper_bound, \n') 
     statements.append('        overflow, zerodivision): \n')
-                      
-    statements.append("    f.write(','.join([str(item) for item in x]) + '\\n')")
-    statements.append('\n')
-    statements.append('f.close()')
+    statements.append('    sink.write(x)\n')
+    statements.append('sink.close()')
     # Write generated codes into script file
     sfile = open(scriptfile, 'w')
     sfile.writelines(statements)
     sfile.close()
     return statements
-    
\ No newline at end of file
+    
+# Cache of compiled model factories from ODE_compiler, keyed by the 
+# structure of the model (expressions, modifying expressions, variables 
+# and parameter names) so that parameter variants are not recompiled. 
+# The least recently used factories are discarded when there are more 
+# than _compiled_models_size factories.
+_compiled_models = collections.OrderedDict()
+_compiled_models_size = 128
+
+def _model_factory(expressions, modifying_expressions, variables, 
+                   parameter_names):
+    '''
+    Private function to support ODE_compiler to generate and compile a 
+    factory function, which takes the parameter values (in the order of 
+    parameter_names) and returns a tuple of (<vectorized ODE function>, 
+    <modifying function or None>). 
+    
+    Compiled factories are cached by the structure of the model, where 
+    only the 128 most recently used factories are kept.
+    
+    @param expressions: dictionary of expressions for ODE(s)
+    @param modifying_expressions: list of expressions to modify the 
+    variables
+    @param variables: list of variables in the order of the variable array
+    @param parameter_names: list of parameter names
+    @return: factory function
+    '''
+    key = (tuple([(str(k), str(expressions[k])) 
+                  for k in expressions.keys()]),
+           tuple([str(exp) for exp in modifying_expressions]),
+           tuple([str(v) for v in variables]),
+           tuple([str(p) for p in parameter_names]))
+    if key in _compiled_models: 
+        _compiled_models.move_to_end(key)
+        return _compiled_models[key]
+    replacements = {}
+    for i in range(len(parameter_names)):
+        replacements[str(parameter_names[i])] = '_p%s' % str(i)
+    for i in range(len(variables)):
+        replacements[str(variables[i])] = 'y[%s]' % str(i)
+    # Generate a single (fused) vectorized ODE function for all variables
+    (temporaries, derivatives) = _fused_constructor(expressions, variables, 
+                                                    replacements)
+    arguments = ['_p%s' % str(i) for i in range(len(parameter_names))]
+    codes = ['def _factory(%s):' % ', '.join(arguments),
+             '    def ODE(t, y):']
+    for stmt in temporaries:
+        codes.append('        %s' % stmt)
+    codes.append('        return np.array([%s], dtype=float)' % \
+                 ', '.join(derivatives))
+    if modifying_expressions:
+        codes.append('    def modifying_expression(y, step):')
+        for exp in modifying_expressions:
+            for line in _substitute(exp, replacements, 'exec').split('\n'):
+                codes.append('        %s' % line)
+        codes.append('        return y')
+    else:
+        codes.append('    modifying_expression = None')
+    codes.append('    return (ODE, modifying_expression)')
+    namespace = dict(vars(math))
+    namespace['np'] = np
+    exec(compile('\n'.join(codes), '<ODE_compiler>', 'exec'), namespace)
+    _compiled_models[key] = namespace['_factory']
+    while len(_compiled_models) > _compiled_models_size:
+        _compiled_models.popitem(last=False)
+    return namespace['_factory']
+
+def ODE_compiler(expressions={},
+                 parameters={},
+                 initial_conditions={},
+                 modifying_expressions=[]):
+    '''
+    Function to construct an ODE model from given definitions (please see 
+    ODE_constructor) as compiled functions in memory, which can be given 
+    directly to ODE solvers without generating a script file.
+    
+    The ODE model is compiled into a single vectorized ODE function, f(t, 
+    y), returning a NumPy array of derivatives (please see vectorized mode 
+    of ODE solvers), and a modifying function (as nonODEfunc parameter of 
+    ODE solvers). Parameters and variables are substituted by names in the 
+    abstract syntax tree of the expressions; hence, a name within another 
+    name is never substituted. Functions from math module (such as exp and 
+    log) can be used in the expressions.
+    
+    The compiled model is cached by its structure (expressions, modifying 
+    expressions, variables and parameter names), so constructing models 
+    with different parameter values, such as in a parameter sweep, does 
+    not recompile the model. For example, using the definitions in 
+    ODE_constructor,
+    
+    >>> (ODE, modifying_expression, y0, variables) = \\
+            ODE_compiler(expressions, parameters, 
+                         initial_conditions, modifying_expressions)
+        for x in RK4(ODE, 0.0, y0, 0.1, 100.0, modifying_expression):
+            print(x)
+    
+    @param expressions: dictionary of expressions for ODE(s). Please see 
+    ODE_constructor. 
+    @param parameters: dictionary of parameter values to be substituted 
+    into the ODE equations
+    @param initial_conditions: dictionary of initial conditions for each 
+    ODE
+    @param modifying_expressions: list of expressions to modify the 
+    variables
+    @return: tuple of (<vectorized ODE function>, <modifying function, or 
+    None if there is no modifying expression>, <NumPy array of initial 
+    conditions>, <list of variables in the order of the variable array>)
+    @rtype: tuple
+    '''
+    variables = [str(v) for v in initial_conditions.keys()]
+    parameter_names = list(parameters.keys())
+    factory = _model_factory(expressions, modifying_expressions, 
+                             variables, parameter_names)
+    (ODE, modifying_expression) = \
+        factory(*[parameters[k] for k in parameter_names])
+    y0 = np.array([initial_conditions[v] for v in initial_conditions.keys()],
+                  dtype=float)
+    return (ODE, modifying_expression, y0, variables)
+
+def ODE_sensitivity(expressions={},
+                    parameters={},
+                    initial_conditions={},
+                    sensitivity_parameters=None):
+    '''
+    Function to construct an ODE model from given definitions (please see 
+    ODE_constructor and ODE_compiler) together with its forward 
+    sensitivity equations, as a single vectorized ODE function which can 
+    be given to any ODE solver. 
+    
+    The sensitivity of variable i to parameter k, S[i][k] = dy[i]/dp[k], 
+    follows the ODE, dS[i][k]/dt = sum_j (df[i]/dy[j] * S[j][k]) + 
+    df[i]/dp[k], with S[i][k] = 0 at the start (initial conditions do not 
+    depend on the parameters). The right-hand side of each column of 
+    sensitivities is the directional derivative of the ODE model along 
+    (S[:, k], p[k]), which is approximated by forward difference. The ODE 
+    model and all its perturbed copies (one per parameter) are evaluated 
+    in one vectorized pass by giving the compiled ODE model a 2-dimensional 
+    array of variables (one column per copy) and arrays of parameter 
+    values; if an expression does not broadcast over arrays (such as 
+    functions from math module), each copy is evaluated in turn. 
+    
+    Hence, sensitivities (gradients of the results) to all parameters are 
+    obtained in a single integration, instead of one integration per 
+    parameter. The variables of the augmented ODE model are the variables 
+    of the ODE model, followed by the sensitivities of each variable to 
+    each parameter (S[0][0], S[0][1], ..., S[1][0], ...). For example, 
+    using the definitions in ODE_constructor,
+    
+    >>> (ODE, y0, variables, names) = \\
+            ODE_sensitivity(expressions, parameters, initial_conditions)
+        for row in RK4(ODE, 0.0, y0, 0.1, 100.0):
+            (t, y, S) = split_sensitivity(row, len(variables))
+    
+    Modifying expressions are not supported as they are not 
+    differentiable.
+    
+    @param expressions: dictionary of expressions for ODE(s). Please see 
+    ODE_constructor. 
+    @param parameters: dictionary of parameter values to be substituted 
+    into the ODE equations
+    @param initial_conditions: dictionary of initial conditions for each 
+    ODE
+    @param sensitivity_parameters: list of names of parameters to 
+    calculate sensitivities to. Default = None (all parameters)
+    @return: tuple of (<vectorized augmented ODE function>, <NumPy array of 
+    initial conditions of augmented ODE model>, <list of variables in the 
+    order of the variable array>, <list of parameter names in the order of 
+    sensitivity columns>)
+    @rtype: tuple
+    '''
+    variables = [str(v) for v in initial_conditions.keys()]
+    parameter_names = list(parameters.keys())
+    if sensitivity_parameters is None:
+        sensitivity_parameters = parameter_names
+    names = [str(k) for k in sensitivity_parameters]
+    for name in names:
+        if name not in parameters:
+            raise FunctionParameterValueError(
+                'Unknown sensitivity parameter: %s' % name)
+    factory = _model_factory(expressions, [], variables, parameter_names)
+    n = len(variables)
+    m = len(names)
+    values = np.array([float(parameters[k]) for k in parameter_names])
+    columns = [parameter_names.index(name) for name in names]
+    # Perturbation of parameter k, applied to copy k + 1 of the ODE model
+    delta = 1.5e-8 * np.maximum(np.abs(values[columns]), 1.0)
+    copies = np.tile(values[:, None], (1, m + 1))
+    for k in range(m):
+        copies[columns[k], k + 1] = copies[columns[k], k + 1] + delta[k]
+    broadcast = factory(*[copies[i] for i in range(len(values))])[0]
+    models = [factory(*copies[:, c].tolist())[0] for c in range(m + 1)]
+    def loop(t, Y):
+        F = np.empty((n, m + 1))
+        for c in range(m + 1):
+            F[:, c] = models[c](t, Y[:, c])
+        return F
+    evaluate = [broadcast]
+    def ODE(t, z):
+        y = z[:n]
+        S = z[n:].reshape((n, m))
+        Y = np.empty((n, m + 1))
+        Y[:, 0] = y
+        Y[:, 1:] = y[:, None] + S * delta
+        F = evaluate[0](t, Y)
+        result = np.empty(n + n * m)
+        result[:n] = F[:, 0]
+        result[n:] = ((F[:, 1:] - F[:, :1]) / delta).ravel()
+        return result
+    # Use the vectorized pass only if the model broadcasts over copies
+    y0 = np.zeros(n + n * m)
+    y0[:n] = [initial_conditions[v] for v in initial_conditions.keys()]
+    probe = y0[:n, None] + np.arange(1.0, m + 2.0)
+    try:
+        with np.errstate(all='ignore'):
+            F = np.array(broadcast(0.0, probe), dtype=float)
+        if F.shape != (n, m + 1) or \
+            not np.array_equal(F, loop(0.0, probe), equal_nan=True):
+            evaluate[0] = loop
+    except (TypeError, ValueError):
+        evaluate[0] = loop
+    return (ODE, y0, variables, names)
+
+def split_sensitivity(row, n):
+    '''
+    Splits a result generated by ODE solvers from an augmented ODE model 
+    (please see ODE_sensitivity) into x-axis, variables and sensitivities.
+    
+    @param row: result of [x] + augmented variables
+    @type row: list or numpy.ndarray
+    @param n: number of variables of the ODE model
+    @type n: integer
+    @return: tuple of (x, NumPy array of variables, NumPy array of 
+    sensitivities where element [i, k] is the derivative of variable i 
+    with respect to parameter k)
+    '''
+    row = np.asarray(row, dtype=float)
+    return (float(row[0]), row[1:n+1], 
+            row[n+1:].reshape((n, (len(row) - n - 1) // n)))
+
+_sweep_solvers = ['Euler', 'Heun', 'RK3', 'RK4', 'RK38', 'CK4', 'CK5',
+                  'RKF4', 'RKF5', 'DP4', 'DP5', 'RKF45', 'CK45', 'DP54',
+                  'Rosenbrock', 'ABM2', 'ABM3', 'ABM4', 'ABM5',
+                  'BulirschStoer']
+
+def parameter_grid(grid):
+    '''
+    Generates the samples of a full factorial parameter grid, for 
+    parameter_sweep function. For example,
+    
+    >>> parameter_grid({'rate': [0.1, 0.2], 'death': [0.0, 0.5]})
+    [{'rate': 0.1, 'death': 0.0}, {'rate': 0.1, 'death': 0.5}, 
+     {'rate': 0.2, 'death': 0.0}, {'rate': 0.2, 'death': 0.5}]
+    
+    @param grid: dictionary of parameter name to list of values
+    @type grid: dictionary
+    @return: list of samples, where each sample is a dictionary of 
+    parameter name to value
+    '''
+    names = list(grid.keys())
+    return [dict(zip(names, values))
+            for values in itertools.product(*[grid[k] for k in names])]
+
+def _sweep_run(model, sample):
+    '''
+    Private function - called by parameter_sweep (in worker processes) to 
+    integrate an ODE model with a sample of parameter values and/or 
+    initial conditions. The model is compiled by ODE_compiler, which 
+    caches the compiled model in each worker process; hence, the model is 
+    only compiled once per worker process.
+    
+    @param model: tuple of (expressions, parameters, initial conditions, 
+    modifying expressions, x0, step, xmax, method, reducer, keywords)
+    @type model: tuple
+    @param sample: dictionary of parameter name or variable name to value
+    @type sample: dictionary
+    @return: results of integration as a 2-dimensional NumPy array of 
+    [x] + y rows, or its reduction by reducer
+    '''
+    (expressions, parameters, initial_conditions, modifying_expressions,
+     x0, step, xmax, method, reducer, keywords) = model
+    parameters = dict(parameters)
+    initial_conditions = dict(initial_conditions)
+    for name in sample:
+        if name in initial_conditions:
+            initial_conditions[name] = sample[name]
+        else:
+            parameters[name] = sample[name]
+    (ODE, modifying_expression, y0, variables) = \
+        ODE_compiler(expressions, parameters, initial_conditions,
+                     modifying_expressions)
+    solver = globals()[method]
+    result = np.array(list(solver(ODE, x0, y0, step, xmax,
+                                  modifying_expression, **keywords)))
+    if reducer is None: return result
+    return reducer(result)
+
+def parameter_sweep(expressions, parameters, initial_conditions, samples,
+                    x0, step, xmax, method='RK4', modifying_expressions=[],
+                    reducer=None, workers=None, chunksize=None,
+                    **keywords):
+    '''
+    Generator to integrate an ODE model (please see ODE_constructor and 
+    ODE_compiler) for each sample of parameter values, where the 
+    integrations are distributed across worker processes 
+    (concurrent.futures.ProcessPoolExecutor). Results are generated in the 
+    order of samples, as soon as they are available. For example, using 
+    the definitions in ODE_constructor,
+    
+    >>> samples = parameter_grid({'birth_rate': [0.0, 0.1],
+                                  'destroy_rate': [0.0001, 0.0003]})
+    >>> def final(result): return result[-1]
+    >>> summary = np.array(list(parameter_sweep(expressions, parameters,
+                                                initial_conditions,
+                                                samples, 0.0, 0.1, 100.0,
+                                                reducer=final)))
+    
+    Each sample is a dictionary of parameter values, which replaces the 
+    values in parameters; a name of a variable in a sample replaces its 
+    initial condition instead. Samples are sent to worker processes in 
+    chunks (chunksize parameter) to reduce the overhead of communication 
+    between processes, and each worker process compiles the model once 
+    (please see ODE_compiler). Only the model definitions and samples are 
+    sent to the worker processes; hence, no function of the model has to be 
+    pickled, other than the reducer.
+    
+    The results of each integration are a 2-dimensional NumPy array of 
+    [x] + y rows. A reducer function (reducer parameter), which must be 
+    a function defined at the top level of a module to be sent to worker 
+    processes, can be given to reduce the results of each integration in 
+    the worker process (such as to the final values of variables), so that 
+    only the reduced summaries are sent back.
+    
+    @param expressions: dictionary of expressions for ODE(s). Please see 
+    ODE_constructor.
+    @param parameters: dictionary of parameter values to be substituted 
+    into the ODE equations
+    @param initial_conditions: dictionary of initial conditions for each 
+    ODE
+    @param samples: list of samples, where each sample is a dictionary of 
+    parameter name (or variable name) to value. Please see parameter_grid 
+    function.
+    @type samples: list
+    @param x0: initial value of x-axis, which is usually starting time
+    @type x0: float
+    @param step: step size on the x-axis (initial step size for adaptive 
+    ODE solvers)
+    @type step: float
+    @param xmax: maximum value of x-axis, which is usually ending time
+    @type xmax: float
+    @param method: name of ODE solver. Default = RK4
+    @type method: string
+    @param modifying_expressions: list of expressions to modify the 
+    variables
+    @param reducer: function to reduce the results of each integration, 
+    taking a 2-dimensional NumPy array of results. Default = None (no 
+    reduction)
+    @type reducer: function
+    @param workers: number of worker processes, where 0 integrates in the 
+    current process without worker processes. Default = None (number of 
+    processors)
+    @type workers: integer
+    @param chunksize: number of samples sent to a worker process at a 
+    time. Default = None (about 4 chunks per worker process)
+    @type chunksize: integer
+    @param keywords: other parameters of ODE solver, such as lower_bound, 
+    upper_bound, rtol, atol and output_times
+    @return: generator of results (or reduced results) of each sample
+    '''
+    if method not in _sweep_solvers:
+        raise FunctionParameterValueError('Unknown ODE solver: %s' % \
+                                          str(method))
+    model = (expressions, parameters, initial_conditions,
+             modifying_expressions, x0, step, xmax, method, reducer,
+             keywords)
+    samples = list(samples)
+    if workers == 0:
+        for sample in samples:
+            yield _sweep_run(model, sample)
+        return
+    if workers is None: workers = os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(samples) // (4 * workers))
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        for result in executor.map(functools.partial(_sweep_run, model),
+                                   samples, chunksize=chunksize):
+            yield result
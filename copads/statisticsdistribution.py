@@ -79,14 +79,219 @@ Copyright (c) Maurice H.T. Ling <mauriceling@acm.org>
 Date created: 17th August 2005
 """
 
+import functools
 import math
-import random
+
+import numpy as np
 
 from .copadsexceptions import DistributionParameterError
 from .copadsexceptions import DistributionFunctionError
 from .copadsexceptions import NormalDistributionTypeError
 from .constants import *
 from . import nrpy
+from . import randomize
+
+def _evaluateElements(function, x, discrete=False):
+    """
+    Evaluates a function of scalar x-value (such as CDF() or PDF() of a
+    distribution) on every element of a NumPy array of x-values, giving a
+    NumPy array of float numbers. Elements which cannot be evaluated (the
+    function fails, such as outside the support of the distribution) are
+    not-a-number (nan). If discrete is True, whole number elements are
+    given to the function as integers.
+    """
+    x = np.asarray(x)
+    result = np.empty(x.shape)
+    for (index, value) in np.ndenumerate(x):
+        value = value.item()
+        if discrete and isinstance(value, float) and value.is_integer():
+            value = int(value)
+        try:
+            result[index] = function(value)
+        except (ArithmeticError, ValueError, TypeError, AttributeError,
+                DistributionFunctionError):
+            result[index] = np.nan
+    return result
+
+# Types of x-values (and probabilities) which are always scalars, which are
+# checked before np.ndim() as np.ndim() of a scalar takes a few microseconds
+_scalarTypes = (float, int)
+
+def _isArray(x):
+    """
+    True if x is a NumPy array or list (of 1 or more dimensions) instead of
+    a scalar x-value or probability.
+    """
+    return type(x) not in _scalarTypes and np.ndim(x) > 0
+
+def _arrayMethod(method, kernel):
+    """
+    Wraps CDF() or PDF() method of a distribution, such that a NumPy array
+    (or list) of x-values is evaluated by the kernel method of the
+    distribution (vectorized calculation over the array), if it is defined,
+    or element by element otherwise. A scalar x-value is evaluated by the
+    method, where float and int x-values are passed to the method without
+    checking for arrays.
+    """
+    @functools.wraps(method)
+    def evaluate(self, x):
+        if type(x) in _scalarTypes or np.ndim(x) == 0:
+            return method(self, x)
+        if hasattr(self, kernel):
+            with np.errstate(all='ignore'):
+                return getattr(self, kernel)(np.asarray(x, dtype=float))
+        return _evaluateElements(lambda value: method(self, value), x,
+                                 self.discrete)
+    return evaluate
+
+def _log(value):
+    """
+    Natural logarithm of a probability or density (float or NumPy array),
+    which is -infinity for 0.
+    """
+    if _isArray(value):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.log(value)
+    if value == 0: return -math.inf
+    return math.log(value)
+
+def _xlogy(a, y):
+    """
+    a * log(y) for float y, which is 0 if a is 0 (such as a power of 0 in
+    a density), or -infinity (or infinity) if y is 0.
+    """
+    if a == 0: return 0.0
+    if y == 0: return -math.copysign(math.inf, a)
+    return a * math.log(y)
+
+def _xlogyArray(a, y):
+    """
+    a * log(y), element by element, where a or y is a NumPy array (please
+    see _xlogy function).
+    """
+    return np.where(np.asarray(a) == 0, 0.0, a * np.log(y))
+
+def _twistArray(block):
+    """
+    Twist of the 624 integers of Mersenne twister state (please see
+    randomize.MersenneTwister), vectorized in segments of the state which
+    only depend on the integers twisted in the previous segments.
+    """
+    (one, upper) = (np.uint64(1), np.uint64(0x80000000))
+    (lower, matrix) = (np.uint64(0x7fffffff), np.uint64(0x9908b0df))
+    for (start, stop, offset) in ((0, 227, 397), (227, 454, -227),
+                                  (454, 623, -227)):
+        y = (block[start:stop] & upper) + (block[start+1:stop+1] & lower)
+        block[start:stop] = block[start+offset:stop+offset] ^ \
+            (y >> one) ^ ((y & one) * matrix)
+    y = (block[623] & upper) + (block[0] & lower)
+    block[623] = block[396] ^ (y >> one) ^ ((y & one) * matrix)
+    return block
+
+def _mersenneTwisterArray(generator, n):
+    """
+    Generates n random integers by a randomize.MersenneTwister generator
+    in blocks of 624 integers, which are the same integers as (and
+    continue the sequence of) random() method of the generator.
+    """
+    block = np.array(generator.block, dtype=np.uint64)
+    index = generator.index
+    integers = []
+    count = 0
+    while count < n:
+        if index >= 624:
+            block = _twistArray(block)
+            index = 0
+        integers.append(block[index:index + n - count].copy())
+        count = count + integers[-1].size
+        index = index + integers[-1].size
+    generator.block = [int(y) for y in block]
+    generator.index = index
+    y = np.concatenate(integers) if integers else np.zeros(0, np.uint64)
+    y = y ^ (y >> np.uint64(11))
+    y = y ^ ((y << np.uint64(7)) & np.uint64(2636928640))
+    y = y ^ ((y << np.uint64(15)) & np.uint64(4022730752))
+    y = y ^ (y >> np.uint64(18))
+    return y & np.uint64(0xFFFFFFFF)
+
+def _uniformArray(n, rng=None):
+    """
+    Generates a NumPy array of n random numbers from the uniform
+    distribution between 0 and 1, by a random number generator (RNG):
+        - None: NumPy global RNG
+        - NumPy random Generator or RandomState
+        - randomize.MersenneTwister, randomize.LCG or randomize.CLCG, where
+        the random integers are scaled (at the middle of each integer) by
+        the range of the generator, 2^32 or modulus; as CLCG.random()
+        gives the combined integer multiplied by modulus, the combined
+        integer is recovered by integer division before scaling
+        - any other object with random() method giving a random number
+        between 0 and 1, such as random module or random.Random
+    """
+    if rng is None:
+        return np.random.random_sample(n)
+    if isinstance(rng, np.random.Generator):
+        return rng.random(n)
+    if isinstance(rng, np.random.RandomState):
+        return rng.random_sample(n)
+    if isinstance(rng, randomize.MersenneTwister):
+        return (_mersenneTwisterArray(rng, n) + 0.5) / 4294967296.0
+    if isinstance(rng, randomize.CLCG):
+        return np.array([((rng.random() // rng.modulus) + 0.5) / rng.modulus
+                         for i in range(n)], dtype=float)
+    if isinstance(rng, randomize.Randomizer) and hasattr(rng, 'modulus'):
+        return np.array([(rng.random() + 0.5) / rng.modulus
+                         for i in range(n)], dtype=float)
+    return np.array([rng.random() for i in range(n)], dtype=float)
+
+def _normalArray(n, rng=None):
+    """
+    Generates a NumPy array of n random numbers from the standard normal
+    distribution by Box-Muller transform of uniform random numbers.
+    """
+    m = (n + 1) // 2
+    u = _uniformArray(2 * m, rng)
+    r = np.sqrt(-2.0 * np.log(1.0 - u[:m]))
+    theta = PI2 * u[m:]
+    return np.concatenate((r * np.cos(theta), r * np.sin(theta)))[:n]
+
+def _gammaArray(shape, n, rng=None):
+    """
+    Generates a NumPy array of n random numbers from the standard gamma
+    distribution (scale = 1) by Marsaglia and Tsang's method, where the
+    rejected numbers are generated again until all n numbers are accepted.
+
+    @see: Marsaglia, G, Tsang, WW. 2000. A Simple Method for Generating Gamma
+    Variables. ACM Transactions on Mathematical Software 26(3): 363-372.
+    """
+    a = shape + 1.0 if shape < 1.0 else shape
+    d = a - 1.0 / 3.0
+    c = 1.0 / math.sqrt(9.0 * d)
+    result = np.empty(n)
+    pending = np.arange(n)
+    with np.errstate(all='ignore'):
+        while pending.size > 0:
+            z = _normalArray(pending.size, rng)
+            u = _uniformArray(pending.size, rng)
+            v = (1.0 + c * z) ** 3
+            accept = (v > 0.0) & \
+                (np.log(u) < 0.5 * z * z + d - d * v + d * np.log(v))
+            result[pending[accept]] = d * v[accept]
+            pending = pending[~accept]
+    if shape < 1.0:
+        result = result * _uniformArray(n, rng) ** (1.0 / shape)
+    return result
+
+def _tableArray(cprob, n, rng=None):
+    """
+    Generates a NumPy array of n random integers from a discrete
+    distribution, by inverse transform (search of uniform random numbers)
+    on the table of cumulative probabilities of 0, 1, 2 ... k.
+    """
+    cprob = np.asarray(cprob, dtype=float)
+    u = _uniformArray(n, rng) * cprob[-1]
+    k = np.searchsorted(cprob, u, side='right')
+    return np.minimum(k, len(cprob) - 1).astype(float)
 
 class Distribution:
     """
@@ -99,7 +304,29 @@ class Distribution:
     @see: Ling, MHT. 2009. Compendium of Distributions, I: Beta, Binomial, Chi-
     Square, F, Gamma, Geometric, Poisson, Student's t, and Uniform. The Python
     Papers Source Codes 1:4
+
+    CDF(), PDF(), logCDF(), logPDF() and inverseCDF() of every distribution
+    accept a NumPy array (or list) of x-values or probabilities, and give
+    NumPy arrays.
+    Distributions with closed-form or special-function CDF() and PDF()
+    evaluate arrays in vectorized calculations (_arrayCDF() and _arrayPDF()
+    methods); other distributions evaluate arrays element by element.
+    Elements which cannot be evaluated, such as outside the support of the
+    distribution, are not-a-number (nan).
     """
+    # True for distributions of integer-valued (counting) random variables
+    discrete = False
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Allows CDF(), PDF(), logCDF() and logPDF() of every distribution to
+        take NumPy arrays of x-values (please see _arrayMethod function).
+        """
+        super().__init_subclass__(**kwargs)
+        for name in ('CDF', 'PDF', 'logCDF', 'logPDF'):
+            if name in cls.__dict__:
+                kernel = '_array' + name[0].upper() + name[1:]
+                setattr(cls, name, _arrayMethod(cls.__dict__[name], kernel))
 
     def __init__(self, **parameters):
         """
@@ -125,12 +352,325 @@ class Distribution:
         """
         raise NotImplementedError
 
+    def logCDF(self, x):
+        """
+        Natural logarithm of CDF(), which is -infinity where CDF() is 0.
+        Distributions which can calculate it in log-space, without underflow
+        of CDF() in the tail, override this method.
+        """
+        return _log(self.CDF(x))
+
+    def logPDF(self, x):
+        """
+        Natural logarithm of PDF(), which is -infinity where PDF() is 0.
+        Distributions which can calculate it in log-space, from normalising
+        constants precomputed in the constructor, override this method; such
+        as for likelihood calculations, where PDF() may underflow.
+        """
+        return _log(self.PDF(x))
+
     def inverseCDF(self, probability, start=0.0, step=0.01):
         """
         It does the reverse of CDF() method, it takes a probability value and
         returns the corresponding value on the x-axis.
-        """
-        raise NotImplementedError
+
+        The value is searched upwards from start: the search interval is
+        widened (doubling its width from step) until it brackets the value,
+        which is then refined by Newton's method using PDF() as the
+        derivative of CDF(), safeguarded by bisection, or by Brent's method
+        where PDF() is not available. For discrete
+        distributions (discrete attribute is True), the value is the
+        smallest value of start + (k * step), for integer k, where CDF() is
+        not less than the probability, found by bisection on k.
+
+        @param probability: probability under the curve
+        @param start: lower boundary of calculation (default = 0.0). start
+        is returned if CDF(start) is not less than the probability.
+        @param step: initial width of the search interval, or spacing of
+        the values for discrete distributions (default = 0.01)
+        @return: Returns a tuple (x, cprob) where 'x' is the value on the
+        x-axis and 'cprob' is the calculated area under the curve to 'x'.
+        If probability is a NumPy array (or list), 'x' and 'cprob' are NumPy
+        arrays (please see _arrayInverseCDF method).
+        """
+        if _isArray(probability):
+            return self._arrayInverseCDF(probability, start, step)
+        cprob = self.CDF(start)
+        if probability <= cprob: return (start, cprob)
+        (lower, upper) = self._bracketCDF(probability, start, step)
+        return self._solveCDF(probability, lower, upper, step)
+
+    def _arrayInverseCDF(self, probability, start, step, error=0.0,
+                         downwards=False, tolerance=1e-10, maxiter=2100):
+        """
+        inverseCDF() of a NumPy array of probabilities, which gives a tuple
+        of NumPy arrays (x, cprob).
+
+        For distributions with vectorized CDF() (_arrayCDF method), all the
+        probabilities are searched together, in the same way as inverseCDF()
+        of a probability: the search intervals are widened from start until
+        they bracket the values (please see _bracketCDF method), and then
+        refined by bisection on k for discrete distributions, or by Illinois
+        (modified false position) method for continuous distributions to
+        tolerance (relative to the value), as PDF() is not the derivative of
+        CDF() for some distributions. Only the elements which are not yet
+        bracketed or refined are evaluated in each iteration. If downwards is
+        True, probabilities less than CDF(start) are searched downwards from
+        start, and probabilities within error of CDF(start) give start.
+        Other distributions are searched for each probability by
+        inverseCDF(). Probabilities which are not within the cumulative
+        probabilities of the distribution give not-a-number (nan).
+        """
+        p = np.asarray(probability, dtype=float)
+        shape = p.shape
+        p = p.ravel()
+        x = np.full(p.size, np.nan)
+        cprob = np.full(p.size, np.nan)
+        if not hasattr(self, '_arrayCDF'):
+            for i in range(p.size):
+                try:
+                    (x[i], cprob[i]) = Distribution.inverseCDF(self,
+                                                               float(p[i]),
+                                                               start, step)
+                except DistributionFunctionError:
+                    pass
+            return (x.reshape(shape), cprob.reshape(shape))
+        with np.errstate(all='ignore'):
+            near = np.full(p.size, float(start))
+            fnear = self._arrayCDF(near) - p
+            if downwards:
+                down = fnear > 0
+                done = np.abs(fnear) < error
+            else:
+                down = np.zeros(p.size, dtype=bool)
+                done = fnear >= 0
+            (x[done], cprob[done]) = (near[done], fnear[done] + p[done])
+            searching = ~done & ~np.isnan(p)
+            # bracket by moving near end in steps of doubling widths
+            far = np.full(p.size, np.nan)
+            ffar = np.full(p.size, np.nan)
+            width = np.full(p.size, float(step))
+            for iteration in range(maxiter):
+                i = np.flatnonzero(searching)
+                if i.size == 0: break
+                y = np.where(down[i], near[i] - width[i], near[i] + width[i])
+                fy = self._arrayCDF(y) - p[i]
+                stuck = (y == near[i]) | np.isinf(y)
+                valid = ~stuck & ~np.isnan(fy)
+                hit = valid & np.where(down[i], fy < 0, fy >= 0)
+                move = valid & ~hit
+                (far[i[hit]], ffar[i[hit]]) = (y[hit], fy[hit])
+                (near[i[move]], fnear[i[move]]) = (y[move], fy[move])
+                width[i[move]] = 2 * width[i[move]]
+                searching[i[hit | stuck]] = False
+                i = i[~valid & ~stuck]
+                if not self.discrete:
+                    width[i] = width[i] / 2.0
+                else:
+                    wide = width[i] > step
+                    width[i[wide]] = step * np.floor(width[i[wide]] /
+                                                     step / 2)
+                    searching[i[~wide]] = False
+            active = ~np.isnan(far)
+            lower = np.where(down, far, near)
+            flower = np.where(down, ffar, fnear)
+            upper = np.where(down, near, far)
+            fupper = np.where(down, fnear, ffar)
+            if self.discrete:
+                klower = np.zeros(p.size)
+                kupper = np.where(active, np.round((upper - lower) / step),
+                                  0)
+                active = active & (kupper - klower > 1)
+                while active.any():
+                    i = np.flatnonzero(active)
+                    k = np.floor((klower[i] + kupper[i]) / 2)
+                    below = self._arrayCDF(lower[i] + k * step) < p[i]
+                    klower[i[below]] = k[below]
+                    kupper[i[~below]] = k[~below]
+                    active[i] = kupper[i] - klower[i] > 1
+                i = np.flatnonzero(~np.isnan(far))
+                x[i] = lower[i] + kupper[i] * step
+                cprob[i] = self._arrayCDF(x[i])
+                return (x.reshape(shape), cprob.reshape(shape))
+            # side of the interval which was last replaced (-1 for lower)
+            side = np.zeros(p.size)
+            (x[active], cprob[active]) = (upper[active],
+                                          fupper[active] + p[active])
+            for iteration in range(maxiter):
+                i = np.flatnonzero(active)
+                if i.size == 0: break
+                (l, u) = (lower[i], upper[i])
+                y = u - fupper[i] * (u - l) / (fupper[i] - flower[i])
+                y = np.where((y > l) & (y < u), y, 0.5 * (l + u))
+                fy = self._arrayCDF(y) - p[i]
+                (x[i], cprob[i]) = (y, fy + p[i])
+                below = fy < 0
+                # halve the function value at the end which is retained
+                # twice, to move both ends towards the value
+                fupper[i[below & (side[i] < 0)]] *= 0.5
+                flower[i[~below & (side[i] > 0)]] *= 0.5
+                (lower[i[below]], flower[i[below]]) = (y[below], fy[below])
+                (upper[i[~below]], fupper[i[~below]]) = (y[~below],
+                                                         fy[~below])
+                side[i] = np.where(below, -1, 1)
+                tol = tolerance * np.maximum(1.0, np.abs(y))
+                active[i] = ~((np.abs(fy) <= error) |
+                              (upper[i] - lower[i] <= tol) |
+                              np.isnan(fy))
+        return (x.reshape(shape), cprob.reshape(shape))
+
+    def _evaluateCDF(self, x):
+        """
+        Evaluates CDF() at x for quantile searches, giving None if x is
+        outside the support of the distribution (CDF() fails or is not a
+        number).
+        """
+        try:
+            cprob = float(self.CDF(x))
+        except (ArithmeticError, ValueError, TypeError, AttributeError,
+                DistributionFunctionError):
+            return None
+        if cprob != cprob: return None
+        return cprob
+
+    def _bracketCDF(self, probability, x, step, downwards=False):
+        """
+        Finds an interval (lower, upper) where CDF(lower) < probability <=
+        CDF(upper), by moving from x (x is lower, or upper if downwards is
+        True) in steps of doubling widths, starting from step. A step which
+        leaves the support of the distribution is halved instead.
+        """
+        width = step
+        for iteration in range(2100):
+            if downwards: y = x - width
+            else: y = x + width
+            if y == x or math.isinf(y): break
+            cprob = self._evaluateCDF(y)
+            if cprob is None:
+                if not self.discrete: width = width / 2.0
+                elif width > step: width = step * int(width / step // 2)
+                else: break
+            elif downwards and cprob < probability:
+                return (y, x)
+            elif not downwards and cprob >= probability:
+                return (x, y)
+            else:
+                x = y
+                width = 2 * width
+        raise DistributionFunctionError('Probability of %s is not within \
+        the cumulative probabilities of the distribution' % str(probability))
+
+    def _evaluatePDF(self, x):
+        """
+        Evaluates PDF() at x as the derivative of CDF() for quantile
+        searches, giving None if PDF() fails or is not positive.
+        """
+        try:
+            density = float(self.PDF(x))
+        except (ArithmeticError, ValueError, TypeError, AttributeError,
+                NotImplementedError, DistributionFunctionError):
+            return None
+        if not density > 0.0: return None
+        return density
+
+    def _solveCDF(self, probability, lower, upper, step=1,
+                  tolerance=1e-10, error=0.0, maxiter=100):
+        """
+        Refines an interval (lower, upper), where CDF(lower) < probability
+        <= CDF(upper), to the value on the x-axis corresponding to the
+        probability.
+
+        For continuous distributions, Newton's method using PDF() as the
+        derivative is used, and a bisection step is taken whenever the Newton
+        step leaves the interval. The refinement stops when the interval is
+        narrower than tolerance (relative to the value), or the calculated
+        probability is within error of the given probability. Brent's method
+        (nrpy.zbrent) takes over the refinement if PDF() is not available, or
+        a Newton step does not halve the difference between the calculated
+        and given probabilities (PDF() is not the derivative of CDF()). For
+        discrete distributions, the
+        smallest value of lower + (k * step), for integer k, where CDF() is
+        not less than the probability is found by bisection.
+
+        @return: Returns a tuple (x, cprob) where 'x' is the value on the
+        x-axis and 'cprob' is the calculated area under the curve to 'x'.
+        """
+        if self.discrete:
+            (klower, kupper) = (0, int(round((upper - lower) / step)))
+            while kupper - klower > 1:
+                k = (klower + kupper) // 2
+                if self.CDF(lower + k * step) < probability: klower = k
+                else: kupper = k
+            x = lower + kupper * step
+            return (x, self.CDF(x))
+        x = 0.5 * (lower + upper)
+        cprob = self.CDF(x)
+        residual = cprob - probability
+        slope = self._evaluatePDF(x)
+        previous = None
+        for iteration in range(maxiter):
+            if abs(residual) <= error: return (x, cprob)
+            if residual < 0: lower = x
+            else: upper = x
+            tol = tolerance * max(1.0, abs(x))
+            if upper - lower <= tol: return (x, cprob)
+            # PDF() is not available, or is not the derivative of CDF() as
+            # the previous Newton step did not halve the residual
+            if slope is None or \
+                (previous is not None and abs(residual) > 0.5 * previous):
+                break
+            # Newton step of at least tol, to close the interval
+            dx = residual / slope
+            if abs(dx) < tol: dx = math.copysign(tol, dx)
+            if lower < x - dx < upper:
+                previous = abs(residual)
+                x = x - dx
+            else:
+                previous = None
+                x = 0.5 * (lower + upper)
+            cprob = self.CDF(x)
+            residual = cprob - probability
+            slope = self._evaluatePDF(x)
+        tol = tolerance * max(1.0, abs(lower), abs(upper))
+        x = nrpy.zbrent(lambda x: self.CDF(x) - probability,
+                        lower, upper, tol)
+        return (x, self.CDF(x))
+
+    def random(self, size=None, rng=None):
+        """
+        Generates random numbers from the distribution. Distributions with a
+        direct method of generating random numbers (_arrayRandom method)
+        use it; other distributions generate random numbers by inverse
+        transform of uniform random numbers by the vectorized inverseCDF(),
+        where continuous distributions are searched from 0 in both
+        directions.
+
+        @param size: number (integer) or shape (tuple) of random numbers
+        to generate. Default = None, a single random number.
+        @param rng: random number generator - None (NumPy global random
+        number generator, default), NumPy random Generator or RandomState,
+        randomize.MersenneTwister, randomize.LCG or randomize.CLCG (for
+        reproducible sequences), or an object with random() method, such as
+        random.Random.
+        @return: a random number (float) if size is None, or a NumPy array
+        of random numbers of the given size.
+        """
+        if size is None: n = 1
+        else: n = int(np.prod(size))
+        with np.errstate(all='ignore'):
+            if hasattr(self, '_arrayRandom'):
+                x = self._arrayRandom(n, rng)
+            elif self.discrete:
+                x = self.inverseCDF(_uniformArray(n, rng))[0]
+            else:
+                x = self._arrayInverseCDF(_uniformArray(n, rng), 0.0, 0.01,
+                                          downwards=True)[0]
+        x = np.asarray(x, dtype=float)
+        if np.isnan(x).any():
+            raise DistributionFunctionError('Random numbers cannot be \
+            generated from the cumulative probabilities of the distribution')
+        if size is None: return float(x[0])
+        return x.reshape(size)
 
     def mean(self):
         """
@@ -162,6 +702,109 @@ class Distribution:
         """
         raise NotImplementedError
 
+
+class QuantileTable:
+    """
+    Dense table of quantiles of a continuous distribution, which gives the
+    value on the x-axis for a probability by interpolation instead of
+    solving inverseCDF() of the distribution. For example,
+
+    >>> table = QuantileTable(TDistribution(shape=10))
+    >>> table.quantile(0.975)
+    2.2281388...
+
+    The quantiles are calculated once by the (vectorized) inverseCDF() of
+    the distribution, refined by a Newton step, at probabilities which are
+    evenly spaced in the logit of the probability, ln(p / (1 - p)), and are
+    interpolated in the logit by cubic Hermite interpolation, using
+    p (1 - p) / PDF(x) as the derivative of the quantile with respect to
+    the logit. As the probabilities are closer together towards both ends
+    of the table, the tails of heavy-tailed distributions (where the
+    quantile grows as a power of 1 / (1 - p)) are interpolated as well as
+    the middle of the distribution - with the default table, the error of
+    the quantiles (x) is about 1e-7 of the larger of |x| and 1, or less,
+    for standard normal, t (1 or more degrees of freedom), chi-square and
+    F (1 or more degrees of freedom) distributions, which is within the
+    tolerance of inverseCDF().
+    Probabilities outside the table are solved by inverseCDF() of the
+    distribution.
+    """
+
+    def __init__(self, distribution, lower=0.0005, upper=0.9995, size=2001):
+        """
+        Constructor method. The quantiles of the distribution are
+        calculated.
+
+        @param distribution: continuous distribution with PDF() method
+        @type distribution: instance of a statistics distribution
+        @param lower: smallest probability of the table (default = 0.0005)
+        @param upper: largest probability of the table (default = 0.9995)
+        @param size: number of quantiles in the table (default = 2001)
+        """
+        self.distribution = distribution
+        self.lower = float(lower)
+        self.upper = float(upper)
+        if not 0.0 < self.lower < self.upper < 1.0:
+            raise DistributionFunctionError('Probabilities of quantile \
+            table (%s and %s) are not between 0 and 1' %
+                                            (str(lower), str(upper)))
+        self.logit = np.linspace(math.log(self.lower / (1.0 - self.lower)),
+                                 math.log(self.upper / (1.0 - self.upper)),
+                                 int(size))
+        self.step = self.logit[1] - self.logit[0]
+        self.probability = 1.0 / (1.0 + np.exp(-self.logit))
+        self.x = np.asarray(distribution.inverseCDF(self.probability)[0],
+                            dtype=float)
+        with np.errstate(all='ignore'):
+            # a Newton step refines the quantiles to the precision of CDF()
+            self.x = self.x - (distribution.CDF(self.x) - self.probability) / \
+                np.asarray(distribution.PDF(self.x), dtype=float)
+            self.slope = self.probability * (1.0 - self.probability) / \
+                np.asarray(distribution.PDF(self.x), dtype=float)
+        if not (np.isfinite(self.x).all() and np.isfinite(self.slope).all()):
+            raise DistributionFunctionError('Quantiles between %s and %s \
+            are not within the support of the distribution' %
+                                            (str(lower), str(upper)))
+
+    def quantile(self, probability):
+        """
+        Gives the value on the x-axis corresponding to a probability.
+
+        @param probability: probability (float), or NumPy array (or list)
+        of probabilities
+        @return: value on the x-axis (float), or NumPy array of values
+        """
+        last = len(self.logit) - 2
+        if np.ndim(probability) == 0:
+            p = float(probability)
+            if p < self.lower or p > self.upper:
+                return self.distribution.inverseCDF(p)[0]
+            u = math.log(p / (1.0 - p))
+            i = min(max(int((u - self.logit[0]) / self.step), 0), last)
+            return float(self._interpolate(u, i))
+        p = np.asarray(probability, dtype=float)
+        outside = (p < self.lower) | (p > self.upper)
+        with np.errstate(all='ignore'):
+            u = np.log(p / (1.0 - p))
+            i = np.clip(np.nan_to_num((u - self.logit[0]) / self.step),
+                        0, last).astype(int)
+        x = self._interpolate(u, i)
+        if outside.any():
+            x[outside] = self.distribution.inverseCDF(p[outside])[0]
+        return x
+
+    def _interpolate(self, u, i):
+        """
+        Cubic Hermite interpolation of the quantile of logit u between the
+        i-th and (i+1)-th quantiles of the table.
+        """
+        t = (u - self.logit[i]) / self.step
+        (t2, t3) = (t * t, t * t * t)
+        return (2 * t3 - 3 * t2 + 1) * self.x[i] + \
+            (t3 - 2 * t2 + t) * self.step * self.slope[i] + \
+            (3 * t2 - 2 * t3) * self.x[i + 1] + \
+            (t3 - t2) * self.step * self.slope[i + 1]
+
 # ----------------------------------------------------------
 # Tested Distributions
 # ----------------------------------------------------------
@@ -192,6 +835,9 @@ class BetaDistribution(Distribution):
         self.scale = float(scale)
         self.p = float(p)
         self.q = float(q)
+        self._logNormaliser = nrpy.gammln(self.p + self.q) - \
+            nrpy.gammln(self.p) - nrpy.gammln(self.q) - \
+            (self.p + self.q - 1) * math.log(self.scale - self.location)
 
     def CDF(self, x):
         """
@@ -208,25 +854,35 @@ class BetaDistribution(Distribution):
         for particular value of x, or the area under probability
         distribution from x-h to x+h for continuous distribution.
         """
-        n = (self.scale - self.location) ** (self.p + self.q - 1)
-        n = nrpy.gammln(self.p) * nrpy.gammln(self.q) * n
-        n = nrpy.gammln(self.p + self.q) / n
-        p = (x - self.location) ** (self.p - 1)
-        q = (self.scale - x) ** (self.q - 1)
-        return n * p * q
+        return math.exp(self.logPDF(x))
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
+    def logPDF(self, x):
         """
-        It does the reverse of CDF() method, it takes a probability
-        value and returns the corresponding value on the x-axis.
+        Natural logarithm of PDF(), from the logarithm of the normalising
+        constant, ln(1 / (Beta(p, q) (scale-location)^(p+q-1))), which is
+        calculated in the constructor.
         """
-        cprob = self.CDF(start)
-        if probability < cprob:
-            return (start, cprob)
-        while probability > cprob:
-            start = start + step
-            cprob = self.CDF(start)
-        return (start, cprob)
+        if x < self.location or x > self.scale: return -math.inf
+        return self._logNormaliser + \
+            _xlogy(self.p - 1, x - self.location) + \
+            _xlogy(self.q - 1, self.scale - x)
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return nrpy.betai_array(self.p, self.q, (x - self.location)/
+                                (self.scale - self.location))
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.exp(self._arrayLogPDF(x))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        logp = self._logNormaliser + \
+            _xlogyArray(self.p - 1, x - self.location) + \
+            _xlogyArray(self.q - 1, self.scale - x)
+        return np.where((x < self.location) | (x > self.scale), -np.inf,
+                        logp)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -269,9 +925,13 @@ class BetaDistribution(Distribution):
         return nrpy.beta(self.p + r,
             self.q)/nrpy.beta(self.p, self.q)
 
-    def random(self):
-        """Gives a random number based on the distribution."""
-        return random.betavariate(self.p, self.q)
+    def _arrayRandom(self, n, rng=None):
+        """
+        Generates n random numbers as the ratio of gamma random numbers.
+        """
+        g = _gammaArray(self.p, n, rng)
+        g = g / (g + _gammaArray(self.q, n, rng))
+        return self.location + (self.scale - self.location) * g
 
 
 class BinomialDistribution(Distribution):
@@ -285,6 +945,7 @@ class BinomialDistribution(Distribution):
     @status: Tested method
     @since: version 0.2
     """
+    discrete = True
 
     def __init__(self, success=0.5, trial=1000):
         """
@@ -296,6 +957,9 @@ class BinomialDistribution(Distribution):
         """
         self.success = float(success)
         self.trial = int(trial)
+        self._logSuccess = _log(self.success)
+        self._logFailure = _log(1 - self.success)
+        self._logTrialFactorial = nrpy.factln(self.trial)
 
     def CDF(self, x):
         """
@@ -316,18 +980,55 @@ class BinomialDistribution(Distribution):
             (self.success ** x) * \
             ((1 - self.success) ** (self.trial - x))
 
+    def logPDF(self, x):
+        """
+        Natural logarithm of PDF(), calculated in log-space from the
+        logarithms of success, (1 - success) and trial factorial, which are
+        calculated in the constructor.
+        """
+        x = int(x)
+        if x < 0 or x > self.trial: return -math.inf
+        logp = self._logTrialFactorial - nrpy.factln(x) - \
+            nrpy.factln(self.trial - x)
+        if x > 0: logp = logp + x * self._logSuccess
+        if x < self.trial: logp = logp + (self.trial - x) * self._logFailure
+        return logp
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return nrpy.betai_array(x, self.trial - x + 1, self.success)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        x = np.trunc(x)
+        return nrpy.bico_array(self.trial, x) * \
+            (self.success ** x) * \
+            ((1 - self.success) ** (self.trial - x))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        x = np.trunc(x)
+        logp = self._logTrialFactorial - nrpy.gammln_array(x + 1.0) - \
+            nrpy.gammln_array(self.trial - x + 1.0) + \
+            np.where(x > 0, x * self._logSuccess, 0.0) + \
+            np.where(x < self.trial,
+                     (self.trial - x) * self._logFailure, 0.0)
+        return np.where((x < 0) | (x > self.trial), -np.inf, logp)
+
+    def _arrayRandom(self, n, rng=None):
+        """
+        Generates n random numbers by inverse transform on the table of
+        cumulative sum of PDF() from 0 to trial.
+        """
+        pdf = self._arrayPDF(np.arange(self.trial + 1.0))
+        return _tableArray(np.cumsum(pdf), n, rng)
+
     def inverseCDF(self, probability, start=0, step=1):
         """
         It does the reverse of CDF() method, it takes a probability
         value and returns the corresponding value on the x-axis.
         """
-        cprob = self.CDF(start)
-        if probability < cprob:
-            return (start, cprob)
-        while probability > cprob:
-            start = start + step
-            cprob = self.CDF(start)
-        return (start, cprob)
+        return Distribution.inverseCDF(self, probability, start, step)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -375,6 +1076,8 @@ class CauchyDistribution(Distribution):
         """
         self.location = location
         self.scale = scale
+        self._normaliser = 1 / (PI * self.scale)
+        self._logNormaliser = math.log(self._normaliser)
 
     def CDF(self, x):
         """
@@ -388,20 +1091,27 @@ class CauchyDistribution(Distribution):
         Partial Distribution Function, which gives the probability for the
         particular value of x, or the area under probability distribution from
         x-h to x+h for continuous distribution."""
-        return 1 / (PI * self.scale * \
-            (1 + (((x - self.location) / self.scale) ** 2)))
+        return self._normaliser / \
+            (1 + (((x - self.location) / self.scale) ** 2))
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value and
-        returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self._logNormaliser - \
+            math.log1p(((x - self.location) / self.scale) ** 2)
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return 0.5 + 1 / PI * np.arctan((x - self.location) / self.scale)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self._normaliser / \
+            (1 + (((x - self.location) / self.scale) ** 2))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self._logNormaliser - \
+            np.log1p(((x - self.location) / self.scale) ** 2)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -428,11 +1138,10 @@ class CauchyDistribution(Distribution):
         """Gives the quantile of the mode of the sample."""
         return 0.5
 
-    def random(self, seed):
-        """Gives a random number based on the distribution."""
-        while 1:
-            seed = self.loaction + (self.scale * math.tan(PI * (seed - 0.5)))
-            yield seed
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by inverse transform."""
+        u = _uniformArray(n, rng)
+        return self.location + (self.scale * np.tan(PI * (u - 0.5)))
 
 
 class CosineDistribution(Distribution):
@@ -459,6 +1168,8 @@ class CosineDistribution(Distribution):
         """
         self.location = location
         self.scale = scale
+        self._normaliser = 1 / (PI2 * self.scale)
+        self._logNormaliser = math.log(self._normaliser)
 
     def CDF(self, x):
         """
@@ -474,20 +1185,29 @@ class CosineDistribution(Distribution):
         Partial Distribution Function, which gives the probability for the
         particular value of x, or the area under probability distribution from
         x-h to x+h for continuous distribution."""
-        return (1 / (PI2 * self.scale)) * \
+        return self._normaliser * \
                 (1 + math.cos((x - self.location) / self.scale))
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value and
-        returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self._logNormaliser + \
+            _log(1 + math.cos((x - self.location) / self.scale))
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        n = PI + (x - self.location) / self.scale + \
+            np.sin((x - self.location) / self.scale)
+        return n / PI2
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self._normaliser * \
+                (1 + np.cos((x - self.location) / self.scale))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self._logNormaliser + \
+            np.log(1 + np.cos((x - self.location) / self.scale))
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -558,6 +1278,7 @@ class ExponentialDistribution(Distribution):
         @param scale: spread of the distribution, S{lambda}; default = 1.0"""
         self.location = location
         self.scale = scale
+        self._logScale = math.log(self.scale)
 
     def CDF(self, x):
         """
@@ -573,17 +1294,29 @@ class ExponentialDistribution(Distribution):
         x-h to x+h for continuous distribution."""
         return (1/self.scale) * math.exp((self.location - x)/self.scale)
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value and
-        returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return (self.location - x) / self.scale - self._logScale
+
+    def logCDF(self, x):
+        """Natural logarithm of CDF()."""
+        return _log(-math.expm1((self.location - x) / self.scale))
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return 1 - np.exp((self.location - x) / self.scale)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return (1/self.scale) * np.exp((self.location - x)/self.scale)
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return (self.location - x) / self.scale - self._logScale
+
+    def _arrayLogCDF(self, x):
+        """logCDF() of a NumPy array of x-values."""
+        return np.log(-np.expm1((self.location - x) / self.scale))
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -625,9 +1358,10 @@ class ExponentialDistribution(Distribution):
         """Gives the quantile of the mode of the sample."""
         return 0.0
 
-    def random(self):
-        """Gives a random number based on the distribution."""
-        return random.expovariate(1/self.location)
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by inverse transform."""
+        u = _uniformArray(n, rng)
+        return self.location - self.scale * np.log(1 - u)
 
 
 class FDistribution(Distribution):
@@ -652,6 +1386,10 @@ class FDistribution(Distribution):
         """
         self.df1 = float(df1)
         self.df2 = float(df2)
+        self._logNormaliser = (self.df1 / 2.0) * \
+            math.log(self.df1 / self.df2) - \
+            nrpy.gammln(self.df1 / 2.0) - nrpy.gammln(self.df2 / 2.0) + \
+            nrpy.gammln((self.df1 + self.df2) / 2.0)
 
     def CDF(self, x):
         """
@@ -668,24 +1406,42 @@ class FDistribution(Distribution):
         for particular value of x, or the area under probability
         distribution from x-h to x+h for continuous distribution.
         """
+        return math.exp(self.logPDF(x))
+
+    def logPDF(self, x):
+        """
+        Natural logarithm of PDF(), from the logarithm of the normalising
+        constant, ln((df1/df2)^(df1/2) / Beta(df1/2, df2/2)), which is
+        calculated in the constructor.
+        """
         x = float(x)
-        n1 = ((x * self.df1) ** self.df1) * (self.df2 ** self.df2)
-        n2 = (x * self.df1 + self.df2) ** (self.df1 + self.df2)
-        d = x * nrpy.beta(self.df1 / 2.0, self.df2 / 2.0)
-        return math.sqrt(n1 / n2) / d
+        if x < 0: return -math.inf
+        return self._logNormaliser + _xlogy(self.df1 / 2.0 - 1, x) - \
+            ((self.df1 + self.df2) / 2.0) * \
+            math.log1p(self.df1 * x / self.df2)
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        sub_x = (self.df1 * x) / (self.df1 * x + self.df2)
+        return nrpy.betai_array(self.df1 / 2.0, self.df2 / 2.0, sub_x)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.exp(self._arrayLogPDF(x))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        logp = self._logNormaliser + _xlogyArray(self.df1 / 2.0 - 1, x) - \
+            ((self.df1 + self.df2) / 2.0) * np.log1p(self.df1 * x / self.df2)
+        return np.where(x < 0, -np.inf, logp)
+
+    def _arrayRandom(self, n, rng=None):
         """
-        It does the reverse of CDF() method, it takes a probability value and
-        the corresponding value on the x-axis.
+        Generates n random numbers as the ratio of chi-square random numbers.
         """
-        cprob = self.CDF(start)
-        if probability < cprob:
-            return (start, cprob)
-        while probability > cprob:
-            start = start + step
-            cprob = self.CDF(start)
-        return (start, cprob)
+        x1 = 2 * _gammaArray(self.df1 / 2.0, n, rng) / self.df1
+        x2 = 2 * _gammaArray(self.df2 / 2.0, n, rng) / self.df2
+        return x1 / x2
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -715,6 +1471,7 @@ class GammaDistribution(Distribution):
         self.location = float(location)
         self.scale = float(scale)
         self.shape = float(shape)
+        self._logNormaliser = -nrpy.gammln(self.shape) - math.log(self.scale)
 
     def CDF(self, x):
         """
@@ -724,18 +1481,41 @@ class GammaDistribution(Distribution):
         """
         return nrpy.gammp(self.shape, (x - self.location) / self.scale)
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
+    def PDF(self, x):
         """
-        It does the reverse of CDF() method, it takes a probability value and
-        the corresponding value on the x-axis.
+        Partial Distribution Function, which gives the probability
+        for particular value of x, or the area under probability
+        distribution from x-h to x+h for continuous distribution.
         """
-        cprob = self.CDF(start)
-        if probability < cprob:
-            return (start, cprob)
-        while probability > cprob:
-            start = start + step
-            cprob = self.CDF(start)
-        return (start, cprob)
+        return math.exp(self.logPDF(x))
+
+    def logPDF(self, x):
+        """
+        Natural logarithm of PDF(), from the logarithm of the normalising
+        constant, ln(1 / (Gamma(shape) scale)), which is calculated in the
+        constructor.
+        """
+        z = (x - self.location) / self.scale
+        if z < 0: return -math.inf
+        return self._logNormaliser + _xlogy(self.shape - 1, z) - z
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return nrpy.gammp_array(self.shape, (x - self.location) / self.scale)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.exp(self._arrayLogPDF(x))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        z = (x - self.location) / self.scale
+        logp = self._logNormaliser + _xlogyArray(self.shape - 1, z) - z
+        return np.where(z < 0, -np.inf, logp)
+
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by Marsaglia and Tsang's method."""
+        return self.location + self.scale * _gammaArray(self.shape, n, rng)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -829,6 +1609,7 @@ class GeometricDistribution(Distribution):
     @status: Tested method
     @since: version 0.2
     """
+    discrete = True
 
     def __init__(self, success=0.5):
         """
@@ -839,6 +1620,8 @@ class GeometricDistribution(Distribution):
             default = 0.5
         """
         self.prob = float(success)
+        self._logProb = _log(self.prob)
+        self._logFailure = _log(1 - self.prob)
 
     def CDF(self, x):
         """
@@ -859,18 +1642,37 @@ class GeometricDistribution(Distribution):
         """
         return self.prob * ((1 - self.prob) ** (x - 1))
 
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self._logProb + _xlogy(x - 1, 1 - self.prob)
+
+    def _arrayCDF(self, x):
+        """
+        CDF() of a NumPy array of x-values, by the sum of geometric series.
+        """
+        n = np.floor(x)
+        return np.where(n > 1, 1 - (1 - self.prob) ** n, self.prob)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self.prob * ((1 - self.prob) ** (x - 1))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self._logProb + _xlogyArray(x - 1, 1 - self.prob)
+
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by inverse transform."""
+        u = _uniformArray(n, rng)
+        return np.maximum(np.ceil(np.log(1 - u) / math.log(1 - self.prob)),
+                          1.0)
+
     def inverseCDF(self, probability, start=1, step=1):
         """
         It does the reverse of CDF() method, it takes a probability value and
         the corresponding value on the x-axis.
         """
-        cprob = self.CDF(start)
-        if probability < cprob:
-            return (start, cprob)
-        while probability > cprob:
-            start = start + step
-            cprob = self.CDF(start)
-        return (start, cprob)
+        return Distribution.inverseCDF(self, probability, start, step)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -897,6 +1699,7 @@ class HypergeometricDistribution(Distribution):
     @status: Tested method
     @since: version 0.4
     """
+    discrete = True
 
     def __init__(self, sample_size,
                  population_size=100,
@@ -956,13 +1759,17 @@ class HypergeometricDistribution(Distribution):
         """
         It does the reverse of CDF() method, it takes a probability value
         and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (int(start), cprob)
+        (x, cprob) = Distribution.inverseCDF(self, probability, start, step)
+        if _isArray(probability): return (x, cprob)
+        return (int(x), cprob)
+
+    def _arrayRandom(self, n, rng=None):
+        """
+        Generates n random numbers by inverse transform on the table of
+        cumulative sum of PDF() from 0 to sample_size.
+        """
+        pdf = self.PDF(np.arange(self.ssize + 1))
+        return _tableArray(np.cumsum(pdf), n, rng)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -1041,17 +1848,10 @@ class LogarithmicDistribution(Distribution):
         x-h to x+h for continuous distribution."""
         return (-1 * (self.shape ** x)) / (math.log10(1 - self.shape) * x)
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value and
-        returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.where(x != 0, (-1 * (self.shape ** x)) /
+                        (math.log10(1 - self.shape) * x), np.nan)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -1086,6 +1886,8 @@ class NormalDistribution(Distribution):
     def __init__(self):
         self.mean = 0.0
         self.stdev = 1.0
+        self._normaliser = 1 / (math.sqrt(PI2) * self.stdev)
+        self._logNormaliser = math.log(self._normaliser)
 
     def CDF(self, x):
         """
@@ -1104,9 +1906,40 @@ class NormalDistribution(Distribution):
 
         @param x: probability at x
         """
-        return (1/(math.sqrt(PI2) * self.stdev)) * \
+        return self._normaliser * \
             math.exp(-(x ** 2/(2 * self.stdev**2)))
 
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self._logNormaliser - (x ** 2/(2 * self.stdev**2))
+
+    def logCDF(self, x):
+        """
+        Natural logarithm of CDF(), which is calculated from the logarithm
+        of the complementary error function in the lower tail, where CDF()
+        underflows.
+        """
+        if x < 0: return nrpy.erfccln(-x/SQRT2) - LN2
+        return math.log1p(-0.5 * nrpy.erfcc(x/SQRT2))
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return 1.0 - 0.5 * nrpy.erfcc_array(x/SQRT2)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self._normaliser * \
+            np.exp(-(x ** 2/(2 * self.stdev**2)))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self._logNormaliser - (x ** 2/(2 * self.stdev**2))
+
+    def _arrayLogCDF(self, x):
+        """logCDF() of a NumPy array of x-values."""
+        return np.where(x < 0, nrpy.erfccln_array(-x/SQRT2) - LN2,
+                        np.log1p(-0.5 * nrpy.erfcc_array(x/SQRT2)))
+
     def inverseCDF(self, probability, start = -10.0,
                    end = 10.0, error = 10e-8):
         """
@@ -1121,25 +1954,24 @@ class NormalDistribution(Distribution):
         (default = 10e-8)
         @return: Returns a tuple (start, cprob) where 'start' is the standard
         deviation for the area under the curve from -infinity to the given
-        'probability' (+/- step). 'cprob' is the calculated area under the
-        curve from -infinity to the returned 'start'.
-        """
-        # check for tolerance
-        if abs(self.CDF(start)-probability) < error:
-            return (start, self.CDF(start))
-        # case 1: lower than -10 standard deviations
-        if probability < self.CDF(start):
-            return self.inverseCDF(probability, start-5, start, error)
-        # case 2: between -10 to 10 standard deviations (bisection method)
-        if probability > self.CDF(start) and \
-        probability < self.CDF((start+end)/2):
-            return self.inverseCDF(probability, start, (start+end)/2, error)
-        if probability > self.CDF((start+end)/2) and \
-        probability < self.CDF(end):
-            return self.inverseCDF(probability, (start+end)/2, end, error)
-        # case 3: higher than 10 standard deviations
-        if probability > self.CDF(end):
-            return self.inverseCDF(probability, end, end+5, error)
+        'probability' (within error). 'cprob' is the calculated area under
+        the curve from -infinity to the returned 'start'. If probability is
+        a NumPy array (or list), 'start' and 'cprob' are NumPy arrays.
+        """
+        if _isArray(probability):
+            return self._arrayInverseCDF(probability, start, end - start,
+                                         error, downwards=True)
+        cprob = self.CDF(start)
+        if abs(cprob - probability) < error:
+            return (start, cprob)
+        # bracket from start outwards, then refine by Newton's method
+        if probability < cprob:
+            (lower, upper) = self._bracketCDF(probability, start,
+                                              end - start, downwards=True)
+        else:
+            (lower, upper) = self._bracketCDF(probability, start,
+                                              end - start)
+        return self._solveCDF(probability, lower, upper, error=error)
 
     def mean(self):
         return self.mean
@@ -1156,9 +1988,9 @@ class NormalDistribution(Distribution):
     def variance(self):
         return self.stdev * self.stdev
 
-    def random(self):
-        """Gives a random number based on the distribution."""
-        return random.gauss(self.mean, self.stdev)
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by Box-Muller transform."""
+        return self.mean + self.stdev * _normalArray(n, rng)
 
 
 class PoissonDistribution(Distribution):
@@ -1173,6 +2005,7 @@ class PoissonDistribution(Distribution):
     @status: Tested method
     @since: version 0.2
     """
+    discrete = True
 
     def __init__(self, expectation=0.001):
         """
@@ -1197,21 +2030,46 @@ class PoissonDistribution(Distribution):
         for particular value of x, or the area under probability
         distribution from x-h to x+h for continuous distribution.
         """
-        return (math.exp(-1 ** self._mean) *
-                (self._mean ** x)) / nrpy.factrl(x)
+        return math.exp(self.logPDF(x))
+
+    def logPDF(self, x):
+        """
+        Natural logarithm of PDF(), calculated in log-space, where the
+        factorial of x is calculated from the logarithm of the gamma
+        function.
+        """
+        if x < 0: return -math.inf
+        return _xlogy(x, self._mean) - self._mean - nrpy.gammln(x + 1)
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return nrpy.gammq_array(x + 1, self._mean)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.exp(self._arrayLogPDF(x))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        logp = _xlogyArray(x, self._mean) - self._mean - \
+            nrpy.gammln_array(np.maximum(x, 0.0) + 1)
+        return np.where(x < 0, -np.inf, logp)
+
+    def _arrayRandom(self, n, rng=None):
+        """
+        Generates n random numbers by inverse transform on the table of
+        cumulative probabilities, up to 12 standard deviations above the
+        mean.
+        """
+        k = np.arange(math.ceil(self._mean + 12 * math.sqrt(self._mean)) + 2)
+        return _tableArray(self._arrayCDF(k), n, rng)
 
     def inverseCDF(self, probability, start=0.001, step=1):
         """
         It does the reverse of CDF() method, it takes a probability value and
         the corresponding value on the x-axis.
         """
-        cprob = self.CDF(start)
-        if probability < cprob:
-            return (start, cprob)
-        while probability > cprob:
-            start = start + step
-            cprob = self.CDF(start)
-        return (start, cprob)
+        return Distribution.inverseCDF(self, probability, start, step)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -1248,6 +2106,8 @@ class SemicircularDistribution(Distribution):
         @param scale: spread of the distribution, default = 1.0"""
         self.location = location
         self.scale = scale
+        self._normaliser = 2 / (self.scale * PI)
+        self._logNormaliser = math.log(self._normaliser)
 
     def CDF(self, x):
         """
@@ -1262,22 +2122,36 @@ class SemicircularDistribution(Distribution):
         Partial Distribution Function, which gives the probability for the
         particular value of x, or the area under probability distribution from
         x-h to x+h for continuous distribution."""
-        return (2 / (self.scale * PI)) * \
+        return self._normaliser * \
                 math.sqrt(1 - ((x - self.location) / self.scale) ** 2)
 
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self._logNormaliser + \
+            0.5 * _log(1 - ((x - self.location) / self.scale) ** 2)
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        t = (x - self.location) / self.scale
+        return 0.5 + (1 / PI) * (t * np.sqrt(1 - (t ** 2)) + np.arcsin(t))
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self._normaliser * \
+                np.sqrt(1 - ((x - self.location) / self.scale) ** 2)
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self._logNormaliser + \
+            0.5 * np.log(1 - ((x - self.location) / self.scale) ** 2)
+
     def inverseCDF(self, probability, start=-10.0, step=0.01):
         """
         It does the reverse of CDF() method, it takes a probability value and
         returns the corresponding value on the x-axis."""
         if start < -1 * self.scale:
             start = -1 * self.scale
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+        return Distribution.inverseCDF(self, probability, start, step)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -1341,6 +2215,9 @@ class TDistribution(Distribution):
         self._mean = float(location)
         self.stdev = float(scale)
         self.df = float(shape)
+        self._logNormaliser = nrpy.gammln((self.df + 1) / 2) - \
+            nrpy.gammln(self.df / 2) - 0.5 * math.log(math.pi * self.df) - \
+            math.log(self.stdev)
 
     def CDF(self, x):
         """
@@ -1364,11 +2241,43 @@ class TDistribution(Distribution):
 
         for all real x. It has mean 0 (for n > 1) and variance n/(n-2)
         (for n > 2)."""
-        a = nrpy.gammln((self.df + 1) / 2)
-        b = math.sqrt(math.pi * self.df) * nrpy.gammln(self.df / 2) * \
-            self.stdev
-        c = 1 + ((((x - self._mean) / self.stdev) ** 2) / self.df)
-        return (a / b) * (c ** ((-1 - self.df) / 2))
+        return math.exp(self.logPDF(x))
+
+    def logPDF(self, x):
+        """
+        Natural logarithm of PDF(), from the logarithm of the normalising
+        constant, ln(Gamma((df+1)/2) / (Gamma(df/2) sqrt(df pi) scale)), which
+        is calculated in the constructor.
+        """
+        t = (x - self._mean) / self.stdev
+        return self._logNormaliser - \
+            ((self.df + 1) / 2) * math.log1p((t * t) / self.df)
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        t = (x - self._mean) / self.stdev
+        a = nrpy.betai_array(self.df / 2.0, 0.5,
+                             self.df / (self.df + (t * t)))
+        return np.where(t > 0, 1 - 0.5 * a, 0.5 * a)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.exp(self._arrayLogPDF(x))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        t = (x - self._mean) / self.stdev
+        return self._logNormaliser - \
+            ((self.df + 1) / 2) * np.log1p((t * t) / self.df)
+
+    def _arrayRandom(self, n, rng=None):
+        """
+        Generates n random numbers as the ratio of normal random numbers to
+        the square root of chi-square random numbers.
+        """
+        z = _normalArray(n, rng)
+        v = 2 * _gammaArray(self.df / 2.0, n, rng)
+        return self._mean + self.stdev * z / np.sqrt(v / self.df)
 
     def inverseCDF(self, probability, start = -10.0,
                    end = 10.0, error = 10e-8):
@@ -1384,25 +2293,24 @@ class TDistribution(Distribution):
         (default = 10e-8)
         @return: Returns a tuple (start, cprob) where 'start' is the standard
         deviation for the area under the curve from -infinity to the given
-        'probability' (+/- step). 'cprob' is the calculated area under the
-        curve from -infinity to the returned 'start'.
-        """
-        # check for tolerance
-        if abs(self.CDF(start)-probability) < error:
-            return (start, self.CDF(start))
-        # case 1: lower than -10 standard deviations
-        if probability < self.CDF(start):
-            return self.inverseCDF(probability, start-10, start, error)
-        # case 2: between -10 to 10 standard deviations (bisection method)
-        if probability > self.CDF(start) and \
-        probability < self.CDF((start+end)/2):
-            return self.inverseCDF(probability, start, (start+end)/2, error)
-        if probability > self.CDF((start+end)/2) and \
-        probability < self.CDF(end):
-            return self.inverseCDF(probability, (start+end)/2, end, error)
-        # case 3: higher than 10 standard deviations
-        if probability > self.CDF(end):
-            return self.inverseCDF(probability, end, end+10, error)
+        'probability' (within error). 'cprob' is the calculated area under
+        the curve from -infinity to the returned 'start'. If probability is
+        a NumPy array (or list), 'start' and 'cprob' are NumPy arrays.
+        """
+        if _isArray(probability):
+            return self._arrayInverseCDF(probability, start, end - start,
+                                         error, downwards=True)
+        cprob = self.CDF(start)
+        if abs(cprob - probability) < error:
+            return (start, cprob)
+        # bracket from start outwards, then refine by Newton's method
+        if probability < cprob:
+            (lower, upper) = self._bracketCDF(probability, start,
+                                              end - start, downwards=True)
+        else:
+            (lower, upper) = self._bracketCDF(probability, start,
+                                              end - start)
+        return self._solveCDF(probability, lower, upper, error=error)
         # cprob = self.CDF(start)
         # if probability < cprob:
             # return (start, cprob)
@@ -1498,18 +2406,39 @@ class TriangularDistribution(Distribution):
                     ((self.upper_limit - self.lower_limit) * \
                      (self.mode - self.lower_limit)))
 
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        cprob = (( x - self.lower_limit) ** 2) / \
+            ((self.upper_limit - self.lower_limit) * \
+             (self.mode - self.lower_limit))
+        return np.where((x < self.lower_limit) | (x > self.mode), np.nan,
+                        cprob)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        density = ((2 * (x - self.lower_limit)) / \
+                   ((self.upper_limit - self.lower_limit) * \
+                    (self.mode - self.lower_limit)))
+        return np.where((x < self.lower_limit) | (x > self.mode), np.nan,
+                        density)
+
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by inverse transform."""
+        u = _uniformArray(n, rng)
+        width = self.upper_limit - self.lower_limit
+        left = (self.mode - self.lower_limit) / width
+        return np.where(u < left,
+            self.lower_limit + np.sqrt(u * width *
+                                       (self.mode - self.lower_limit)),
+            self.upper_limit - np.sqrt((1 - u) * width *
+                                       (self.upper_limit - self.mode)))
+
     def inverseCDF(self, probability, start=0, step=0.01):
         """
         It does the reverse of CDF() method, it takes a probability value
         and returns the corresponding value on the x-axis."""
         start = self.lower_limit
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+        return Distribution.inverseCDF(self, probability, start, step)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -1612,26 +2541,33 @@ class UniformDistribution(Distribution):
         """
         return (x - self.location) / (self.scale - self.location)
 
-    def PDF(self):
+    def PDF(self, x):
         """
         Partial Distribution Function, which gives the probability
         for particular value of x, or the area under probability
         distribution from x-h to x+h for continuous distribution.
         """
+        if x < self.location or x > self.scale: return 0.0
         return 1.0 / (self.scale - self.location)
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value and
-        the corresponding value on the x-axis.
-        """
-        cprob = self.CDF(start)
-        if probability < cprob:
-            return (start, cprob)
-        while probability > cprob:
-            start = start + step
-            cprob = self.CDF(start)
-        return (start, cprob)
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        if x < self.location or x > self.scale: return -math.inf
+        return -math.log(self.scale - self.location)
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return (x - self.location) / (self.scale - self.location)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.where((x < self.location) | (x > self.scale), 0.0,
+                        1.0 / (self.scale - self.location))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return np.where((x < self.location) | (x > self.scale), -math.inf,
+                        -math.log(self.scale - self.location))
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -1665,9 +2601,10 @@ class UniformDistribution(Distribution):
         """Gives the quantile of the arithmetic mean of the sample."""
         return 0.5
 
-    def random(self, lower, upper):
-        """Gives a random number based on the distribution."""
-        return random.uniform(lower, upper)
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers."""
+        u = _uniformArray(n, rng)
+        return self.location + (self.scale - self.location) * u
 
 
 class WeiBullDistribution(Distribution):
@@ -1690,6 +2627,7 @@ class WeiBullDistribution(Distribution):
         @param scale: shape of the distribution, default = 1.0"""
         self.location = location
         self.scale = scale
+        self._logNormaliser = math.log(self.scale / self.location)
 
     def CDF(self, x):
         """
@@ -1713,22 +2651,46 @@ class WeiBullDistribution(Distribution):
             t1 = self.scale / self.location
             return t1 * t2 * t3
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value and
-        returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
-
     # def mean(self):
         # """Gives the arithmetic mean of the sample."""
         # return self.location * nrpy.gammln(1 + 1/self.scale)
 
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        if x < 0: return -math.inf
+        z = float(x) / self.location
+        return self._logNormaliser + _xlogy(self.scale - 1, z) - \
+            (z ** self.scale)
+
+    def logCDF(self, x):
+        """Natural logarithm of CDF()."""
+        return _log(-math.expm1(-1 * ((float(x) / self.location) **
+                                      self.scale)))
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        power = -1 * ((x / self.location) ** self.scale)
+        return 1 - np.exp(power)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        power = -1 * ((x / self.location) ** self.scale)
+        t3 = np.exp(power)
+        t2 = (x / self.location) ** (self.scale - 1)
+        t1 = self.scale / self.location
+        return np.where(x < 0, 0.0, t1 * t2 * t3)
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        z = np.maximum(x, 0.0) / self.location
+        logp = self._logNormaliser + _xlogyArray(self.scale - 1, z) - \
+            (z ** self.scale)
+        return np.where(x < 0, -np.inf, logp)
+
+    def _arrayLogCDF(self, x):
+        """logCDF() of a NumPy array of x-values."""
+        return np.log(-np.expm1(-1 * ((x / self.location) ** self.scale)))
+
     def median(self):
         """Gives the median of the sample."""
         return self.location * (math.log(2, math.e) ** (1/float(self.scale)))
@@ -1750,9 +2712,10 @@ class WeiBullDistribution(Distribution):
 #    def variance(self):
 #        """Gives the variance of the sample."""
 #        raise DistributionFunctionError
-    def random(self):
-        """Gives a random number based on the distribution."""
-        return random.weibullvariate(self.scale, self.shape)
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by inverse transform."""
+        u = _uniformArray(n, rng)
+        return self.location * ((-1 * np.log(1 - u)) ** (1.0 / self.scale))
 
 
 def FrechetDistribution(**parameters):
@@ -1776,6 +2739,7 @@ class BernoulliDistribution(Distribution):
     Bernoulli distribution is a special case of Binomial distribution where
     where number of trials = 1
     """
+    discrete = True
 
     def __init__(self, success):
         """Constructor method. The parameters are used to construct the
@@ -1796,11 +2760,31 @@ class BernoulliDistribution(Distribution):
         x-h to x+h for continuous distribution."""
         return self.distribution.PDF(x)
 
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return self.distribution.CDF(x)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self.distribution.PDF(x)
+
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self.distribution.logPDF(x)
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self.distribution.logPDF(x)
+
     def inverseCDF(self, probability, start = 0, step = 1):
         """It does the reverse of CDF() method, it takes a probability value and
         returns the corresponding value on the x-axis."""
         return self.distribution.inverseCDF(probability, start, step)
 
+    def random(self, size=None, rng=None):
+        """Gives random numbers based on the distribution."""
+        return self.distribution.random(size, rng)
+
     def mean(self):
         """Gives the arithmetic mean of the sample."""
         return self.distribution.mean()
@@ -1847,6 +2831,7 @@ class BradfordDistribution(Distribution):
         self.scale = scale
         self.shape = shape
         self.k = math.log10(self.shape + 1)
+        self._logNormaliser = math.log(self.shape / self.k)
 
     def CDF(self, x):
         """
@@ -1864,17 +2849,25 @@ class BradfordDistribution(Distribution):
         r = (self.shape * (x - self.location)) + self.scale - self.location
         return self.shape / (self.k * r)
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        r = (self.shape * (x - self.location)) + self.scale - self.location
+        return self._logNormaliser - math.log(r)
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        r = ((self.shape * (x - self.location)) / (self.scale - self.location))
+        return np.log10(1 + r) / self.k
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        r = (self.shape * (x - self.location)) + self.scale - self.location
+        return self.shape / (self.k * r)
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        r = (self.shape * (x - self.location)) + self.scale - self.location
+        return self._logNormaliser - np.log(r)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -1933,13 +2926,11 @@ class BradfordDistribution(Distribution):
         """Gives the quantile of the mode of the sample."""
         return 0.0
 
-    def random(self, seed):
-        """Gives a random number based on the distribution."""
-        while 1:
-            r = self.location * (self.shape + 1) - self.scale
-            r = r + ((self.scale - self.location)*((self.shape + 1) ** seed))
-            seed = r / self.shape
-            yield seed
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by inverse transform."""
+        u = _uniformArray(n, rng)
+        r = ((self.shape + 1) ** u) - 1
+        return self.location + ((self.scale - self.location) * r / self.shape)
 
 
 class BurrDistribution(Distribution):
@@ -1979,17 +2970,14 @@ class BurrDistribution(Distribution):
         r = (1+(((x - self.location)/self.scale)**(-self.C)))**(-self.D - 1)
         r = r * ((self.C * self.D)/self.scale)
         return r * (((x - self.location)/self.scale)**(-self.C - 1))
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return (1+(((x - self.location)/self.scale)**(-self.C)))**(-self.D)
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        r = (1+(((x - self.location)/self.scale)**(-self.C)))**(-self.D - 1)
+        r = r * ((self.C * self.D)/self.scale)
+        return r * (((x - self.location)/self.scale)**(-self.C - 1))
     def mean(self):
         """Gives the arithmetic mean of the sample."""
         r = nrpy.gammln(1 - (1/self.C)) * nrpy.gammln((1/self.C) + self.D)
@@ -2023,12 +3011,11 @@ class BurrDistribution(Distribution):
         if ((self.C * self.D) < 1): return 0.0
         else:
             return (1 + ((self.C+1)/((self.C*self.D) - 1))) ** (-1*self.D)
-    def random(self, seed):
-        """Gives a random number based on the distribution."""
-        while 1:
-            r = ((1/(seed ** (1/self.D))) - 1) ** (-1/self.C)
-            seed = self.location + self.scale * r
-            yield seed
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by inverse transform."""
+        u = _uniformArray(n, rng)
+        r = ((1/(u ** (1/self.D))) - 1) ** (-1/self.C)
+        return self.location + self.scale * r
 
 
 class ChiDistribution(Distribution):
@@ -2053,17 +3040,6 @@ class ChiDistribution(Distribution):
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
 #    def mean(self):
 #        """Gives the arithmetic mean of the sample."""
 #        raise DistributionFunctionError
@@ -2123,6 +3099,8 @@ class DoubleGammaDistribution(Distribution):
         self.location = location
         self.scale = scale
         self.shape = shape
+        self._logNormaliser = -math.log(2 * self.scale) - \
+            nrpy.gammln(self.shape)
 
     def CDF(self, x):
         """
@@ -2138,21 +3116,31 @@ class DoubleGammaDistribution(Distribution):
         Partial Distribution Function, which gives the probability for the
         particular value of x, or the area under probability distribution
         from x-h to x+h for continuous distribution."""
-        r = math.exp(-1 * abs((x - self.location)/self.scale))
-        r = r * (abs((x - self.location)/self.scale) ** (self.shape -1))
-        return r / (2 * self.scale * nrpy.gammln(self.shape))
+        return math.exp(self.logPDF(x))
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
+    def logPDF(self, x):
         """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+        Natural logarithm of PDF(), from the logarithm of the normalising
+        constant, ln(1 / (2 scale Gamma(shape))), which is calculated in the
+        constructor.
+        """
+        z = abs((x - self.location) / self.scale)
+        return self._logNormaliser + _xlogy(self.shape - 1, z) - z
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        r = nrpy.gammp_array(self.shape,
+                             np.abs((x - self.location)/self.scale))
+        return np.where(x > self.location, 0.5 + (0.5 * r), 0.5 - (0.5 * r))
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.exp(self._arrayLogPDF(x))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        z = np.abs((x - self.location) / self.scale)
+        return self._logNormaliser + _xlogyArray(self.shape - 1, z) - z
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -2194,17 +3182,6 @@ class DoubleWeibullDistribution(Distribution):
 #        particular value of x, or the area under probability distribution
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
 #    def mean(self):
 #        """Gives the arithmetic mean of the sample."""
 #        raise DistributionFunctionError
@@ -2255,17 +3232,6 @@ class ExtremeLBDistribution(Distribution):
 #        particular value of x, or the area under probability distribution
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
 #    def mean(self):
 #        """Gives the arithmetic mean of the sample."""
 #        raise DistributionFunctionError
@@ -2316,17 +3282,6 @@ class FiskDistribution(Distribution):
 #        particular value of x, or the area under probability distribution
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
 #    def mean(self):
 #        """Gives the arithmetic mean of the sample."""
 #        raise DistributionFunctionError
@@ -2386,17 +3341,6 @@ class FoldedNormalDistribution(Distribution):
 #        particular value of x, or the area under probability distribution
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
 #    def mean(self):
 #        """Gives the arithmetic mean of the sample."""
 #        raise DistributionFunctionError
@@ -2450,17 +3394,6 @@ class GenLogisticDistribution(Distribution):
 #        particular value of x, or the area under probability distribution
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
 #    def mean(self):
 #        """Gives the arithmetic mean of the sample."""
 #        raise DistributionFunctionError
@@ -2513,6 +3446,7 @@ class GumbelDistribution(Distribution):
         @param scale: S{theta}"""
         self.location = location
         self.scale = scale
+        self._logScale = math.log(self.scale)
 
     def CDF(self, x):
         """
@@ -2529,17 +3463,32 @@ class GumbelDistribution(Distribution):
         return (1/self.scale) * math.exp((self.location - x) / self.scale) * \
             self.CDF(x)
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value and
-        returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        w = (self.location - x) / self.scale
+        return w - math.exp(w) - self._logScale
+
+    def logCDF(self, x):
+        """Natural logarithm of CDF()."""
+        return -1 * math.exp((self.location - x) / self.scale)
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return np.exp(-1 * np.exp((self.location - x) / self.scale))
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return (1/self.scale) * np.exp((self.location - x) / self.scale) * \
+            self._arrayCDF(x)
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        w = (self.location - x) / self.scale
+        return w - np.exp(w) - self._logScale
+
+    def _arrayLogCDF(self, x):
+        """logCDF() of a NumPy array of x-values."""
+        return -1 * np.exp((self.location - x) / self.scale)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -2581,12 +3530,10 @@ class GumbelDistribution(Distribution):
         """Gives the quantile of the mode of the sample."""
         return 0.3679
 
-    def random(self, seed):
-        """Gives a random number based on the distribution."""
-        while 1:
-            seed = self.location - \
-                    (self.scale * math.log10(-1 * math.log10(seed)))
-            yield seed
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by inverse transform."""
+        u = _uniformArray(n, rng)
+        return self.location - (self.scale * np.log(-1 * np.log(u)))
 
 
 class HalfNormalDistribution(Distribution):
@@ -2617,11 +3564,26 @@ class HalfNormalDistribution(Distribution):
         particular value of x, or the area under probability distribution from
         x-h to x+h for continuous distribution."""
         return self.distribution.PDF(x)
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return self.distribution.CDF(x)
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self.distribution.PDF(x)
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self.distribution.logPDF(x)
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self.distribution.logPDF(x)
     def inverseCDF(self, probability, start=0.0, step=0.01):
         """
         It does the reverse of CDF() method, it takes a probability value and
         returns the corresponding value on the x-axis."""
         return self.distribution.inverseCDF(probability, start, step)
+    def random(self, size=None, rng=None):
+        """Gives random numbers based on the distribution."""
+        return self.distribution.random(size, rng)
     def mean(self):
         """Gives the arithmetic mean of the sample."""
         return self.distribution.mean()
@@ -2640,7 +3602,11 @@ class HalfNormalDistribution(Distribution):
 
 
 class HyperbolicSecantDistribution(Distribution):
-    """Class for Hyperbolic Secant Distribution."""
+    """
+    Class for Hyperbolic Secant Distribution, where the standard density,
+    (1/2) sech(pi z / 2) for z = (x - location) / scale, has a variance of
+    1.
+    """
 
     def __init__(self, location, scale):
         """
@@ -2651,6 +3617,7 @@ class HyperbolicSecantDistribution(Distribution):
         @param scale:"""
         self.location = location
         self.scale = scale
+        self._logNormaliser = -math.log(2 * self.scale)
 
     def CDF(self, x):
         """
@@ -2658,27 +3625,43 @@ class HyperbolicSecantDistribution(Distribution):
         probability (area under the probability curve) from -infinity or 0 to
         a give x-value on the x-axis where y-axis is the probability."""
         return (2 / PI) * \
-            (1 / math.tan(math.exp((x - self.location) / self.scale)))
+            math.atan(math.exp(PI * (x - self.location) / (2 * self.scale)))
 
     def PDF(self, x):
         """
         Partial Distribution Function, which gives the probability for the
         particular value of x, or the area under probability distribution
         from x-h to x+h for continuous distribution."""
-        return (1 / math.cosh((x - self.location) / self.scale)) / \
-                (PI * math.scale)
+        return math.exp(self.logPDF(x))
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
+    def logPDF(self, x):
         """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+        Natural logarithm of PDF(), where ln(cosh(w)), w = pi z / 2, is
+        calculated as |w| + ln(1 + exp(-2|w|)) - ln(2), which does not
+        overflow.
+        """
+        w = abs(PI * (x - self.location) / (2 * self.scale))
+        return self._logNormaliser - w - math.log1p(math.exp(-2 * w)) + LN2
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return (2 / PI) * \
+            np.arctan(np.exp(PI * (x - self.location) / (2 * self.scale)))
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.exp(self._arrayLogPDF(x))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        w = np.abs(PI * (x - self.location) / (2 * self.scale))
+        return self._logNormaliser - w - np.log1p(np.exp(-2 * w)) + LN2
+
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by inverse transform."""
+        u = _uniformArray(n, rng)
+        return self.location + \
+            (2 * self.scale / PI) * np.log(np.tan(PI * u / 2))
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -2698,7 +3681,7 @@ class HyperbolicSecantDistribution(Distribution):
 
     def variance(self):
         """Gives the variance of the sample."""
-        return 0.25 * ((PI * self.scale) ** 2)
+        return self.scale ** 2
 #    def quantile1(self):
 #        """Gives the 1st quantile of the sample."""
 #        raise DistributionFunctionError
@@ -2735,17 +3718,7 @@ class LaplaceDistribution(Distribution):
 #        particular value of x, or the area under probability distribution
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    pass
 #    def mean(self):
 #        """Gives the arithmetic mean of the sample."""
 #        raise DistributionFunctionError
@@ -2795,17 +3768,7 @@ class LogisticDistribution(Distribution):
 #        particular value of x, or the area under probability distribution
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    pass
 #    def mean(self):
 #        """Gives the arithmetic mean of the sample."""
 #        raise DistributionFunctionError
@@ -2864,17 +3827,6 @@ class LogNormalDistribution(Distribution):
 #        particular value of x, or the area under probability distribution
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value and
-        returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
     def mean(self):
         """Gives the arithmetic mean of the sample."""
         return math.exp((self.location + (self.scale ** 2) * self.location*(-1)))
@@ -2890,9 +3842,11 @@ class LogNormalDistribution(Distribution):
 #    def variance(self):
 #        """Gives the variance of the sample."""
 #        raise DistributionFunctionError
-    def random(self):
-        """Gives a random number based on the distribution."""
-        return random.lognormalvariate(self.location, self.scale)
+    def _arrayRandom(self, n, rng=None):
+        """
+        Generates n random numbers as exponential of normal random numbers.
+        """
+        return np.exp(self.location + self.scale * _normalArray(n, rng))
 
 
 def LogWeibullDistribution(location, scale):
@@ -2937,12 +3891,32 @@ class MaxwellDistribution(Distribution):
         x-h to x+h for continuous distribution."""
         return self.distribution.PDF(x)
 
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return self.distribution.CDF(x)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self.distribution.PDF(x)
+
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self.distribution.logPDF(x)
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self.distribution.logPDF(x)
+
     def inverseCDF(self, probability, start=0.0, step=0.01):
         """
         It does the reverse of CDF() method, it takes a probability value and
         the corresponding value on the x-axis."""
         return self.distribution.inverseCDF(probability, start, step)
 
+    def random(self, size=None, rng=None):
+        """Gives random numbers based on the distribution."""
+        return self.distribution.random(size, rng)
+
     def mean(self):
         """Gives the arithmetic mean of the sample."""
         return self.distribution.mean()
@@ -2984,17 +3958,7 @@ class NakagamiDistribution(Distribution):
 #        particular value of x, or the area under probability distribution
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    pass
 #    def mean(self):
 #        """Gives the arithmetic mean of the sample."""
 #        raise DistributionFunctionError
@@ -3029,6 +3993,7 @@ class NakagamiDistribution(Distribution):
 
 class NegativeBinomialDistribution(Distribution):
     """Class for Negative Binomial Distribution."""
+    discrete = True
 
     def __init__(self, success, target):
         """Constructor method. The parameters are used to construct the
@@ -3057,17 +4022,17 @@ class NegativeBinomialDistribution(Distribution):
                 (self.success ** self.target) * \
                 ((1 - self.success) ** (x - self.target))
 
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return nrpy.bico_array(x - 1, self.target - 1) * \
+                (self.success ** self.target) * \
+                ((1 - self.success) ** (x - self.target))
+
     def inverseCDF(self, probability, start = 0, step = 1):
         """
         It does the reverse of CDF() method, it takes a probability value and
         returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+        return Distribution.inverseCDF(self, probability, start, step)
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -3098,6 +4063,8 @@ class ParetoDistribution(Distribution):
         @param scale: S{lambda}; default = 1.0"""
         self.location = location
         self.scale = scale
+        self._logNormaliser = math.log(self.scale) + \
+            self.scale * math.log(self.location)
 
     def CDF(self, x):
         """
@@ -3111,20 +4078,45 @@ class ParetoDistribution(Distribution):
         Partial Distribution Function, which gives the probability for the
         particular value of x, or the area under probability distribution from
         x-h to x+h for continuous distribution."""
-        return (self.shape * (self.location ** self.scale)) / \
-                (x ** (self.scale + 1))
+        return math.exp(self.logPDF(x))
 
-    def inverseCDF(self, probability, start=0.0, step=0.01):
+    def logPDF(self, x):
         """
-        It does the reverse of CDF() method, it takes a probability value and
-        returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+        Natural logarithm of PDF(), from the logarithm of the normalising
+        constant, ln(scale * location^scale), which is calculated in the
+        constructor.
+        """
+        if x < self.location: return -math.inf
+        return self._logNormaliser - (self.scale + 1) * math.log(x)
+
+    def logCDF(self, x):
+        """Natural logarithm of CDF(), which is -infinity below location."""
+        if x < self.location: return -math.inf
+        return _log(-math.expm1(self.scale * math.log(self.location / x)))
+
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return 1 - (self.location/x) ** self.scale
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.exp(self._arrayLogPDF(x))
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return np.where(x < self.location, -np.inf,
+                        self._logNormaliser - (self.scale + 1) * np.log(x))
+
+    def _arrayLogCDF(self, x):
+        """logCDF() of a NumPy array of x-values."""
+        return np.where(x < self.location, -np.inf,
+                        np.log(-np.expm1(self.scale *
+                                         np.log(self.location / x))))
+
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers by inverse transform."""
+        u = _uniformArray(n, rng)
+        return self.location * ((1 - u) ** (-1.0 / self.scale))
 
     def mean(self):
         """Gives the arithmetic mean of the sample."""
@@ -3172,10 +4164,6 @@ class ParetoDistribution(Distribution):
         """Gives the quantile of the mode of the sample."""
         return 0.0
 
-    def random(self):
-        """Gives a random number based on the distribution."""
-        return random.paretovariate(self.scale)
-
 
 class PascalDistribution(Distribution):
     """
@@ -3203,12 +4191,32 @@ class PascalDistribution(Distribution):
         x-h to x+h for continuous distribution."""
         return self.distribution.PDF(x)
 
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return self.distribution.CDF(x)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self.distribution.PDF(x)
+
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self.distribution.logPDF(x)
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self.distribution.logPDF(x)
+
     def inverseCDF(self, probability, start = 0.0, step =0.01):
         """
         It does the reverse of CDF() method, it takes a probability value and
         returns the corresponding value on the x-axis."""
         return self.distribution.inverseCDF(probability, start, step)
 
+    def random(self, size=None, rng=None):
+        """Gives random numbers based on the distribution."""
+        return self.distribution.random(size, rng)
+
     def mean(self):
         """Gives the arithmetic mean of the sample."""
         return self.distribution.mean()
@@ -3269,12 +4277,32 @@ class PowerFunctionDistribution(Distribution):
         x-h to x+h for continuous distribution."""
         return self.distribution.PDF(x)
 
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return self.distribution.CDF(x)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self.distribution.PDF(x)
+
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self.distribution.logPDF(x)
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self.distribution.logPDF(x)
+
     def inverseCDF(self, probability, start=0.0, step=0.01):
         """
         It does the reverse of CDF() method, it takes a probability value and
         returns the corresponding value on the x-axis."""
         return self.distribution.inverseCDF(probability, start, step)
 
+    def random(self, size=None, rng=None):
+        """Gives random numbers based on the distribution."""
+        return self.distribution.random(size, rng)
+
     def mean(self):
         """Gives the arithmetic mean of the sample."""
         return self.distribution.mean()
@@ -3325,10 +4353,29 @@ class RademacherDistribution(Distribution):
         if x == -1 or x == 1: return 0.5
         else: return 0.0
 
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return np.where(x < -1, 0.0,
+                        np.where((x > -1) & (x < 1), 0.5, 1.0))
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return np.where((x == -1) | (x == 1), 0.5, 0.0)
+
+    def _arrayRandom(self, n, rng=None):
+        """Generates n random numbers."""
+        return np.where(_uniformArray(n, rng) < 0.5, -1.0, 1.0)
+
     def inverseCDF(self, probability, start=0.0, step=0.01):
         """
         It does the reverse of CDF() method, it takes a probability value
         and returns the corresponding value on the x-axis."""
+        if _isArray(probability):
+            probability = np.asarray(probability, dtype=float)
+            return (np.where(probability == 0.0, -1.0001,
+                             np.where(probability == 1.0, 1.0, 0.999)),
+                    np.where(probability == 0.0, 0.0,
+                             np.where(probability == 1.0, 1.0, 0.5)))
         if probability == 0.0: return (-1.0001, 0.0)
         if probability == 1.0: return (1.0, 1.0)
         else: return (0.999, 0.5)
@@ -3375,12 +4422,32 @@ class RayleighDistribution(Distribution):
         x-h to x+h for continuous distribution."""
         return self.distribution.PDF(x)
 
+    def _arrayCDF(self, x):
+        """CDF() of a NumPy array of x-values."""
+        return self.distribution.CDF(x)
+
+    def _arrayPDF(self, x):
+        """PDF() of a NumPy array of x-values."""
+        return self.distribution.PDF(x)
+
+    def logPDF(self, x):
+        """Natural logarithm of PDF()."""
+        return self.distribution.logPDF(x)
+
+    def _arrayLogPDF(self, x):
+        """logPDF() of a NumPy array of x-values."""
+        return self.distribution.logPDF(x)
+
     def inverseCDF(self, probability, start = 0.0, step =0.01):
         """
         It does the reverse of CDF() method, it takes a probability value and
         returns the corresponding value on the x-axis."""
         return self.distribution.inverseCDF(probability, start, step)
 
+    def random(self, size=None, rng=None):
+        """Gives random numbers based on the distribution."""
+        return self.distribution.random(size, rng)
+
     def mean(self):
         """Gives the arithmetic mean of the sample."""
         return self.distribution.mean()
@@ -3422,17 +4489,7 @@ class ReciprocalDistribution(Distribution):
 #        particular value of x, or the area under probability distribution
 #        from x-h to x+h for continuous distribution."""
 #        raise DistributionFunctionError
-    def inverseCDF(self, probability, start=0.0, step=0.01):
-        """
-        It does the reverse of CDF() method, it takes a probability value
-        and returns the corresponding value on the x-axis."""
-        cprob = self.CDF(start)
-        if probability < cprob: return (start, cprob)
-        while (probability > cprob):
-            start = start + step
-            cprob = self.CDF(start)
-            # print start, cprob
-        return (start, cprob)
+    pass
 #    def mean(self):
 #        """Gives the arithmetic mean of the sample."""
 #        raise DistributionFunctionError
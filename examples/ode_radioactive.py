@@ -63,3 +63,18 @@ print('Solving using DP5 method......')
 for i in [x for x in ode.DP5([decay], 0.0, [initial_nuclei], 0.1, 50.0)]:
     print(','.join([str(x) for x in i]))
 print('')
+
+print('Solving using adaptive RKF45 method......')
+for i in [x for x in ode.RKF45([decay], 0.0, [initial_nuclei], 0.1, 50.0)]:
+    print(','.join([str(x) for x in i]))
+print('')
+
+print('Solving using adaptive CK45 method......')
+for i in [x for x in ode.CK45([decay], 0.0, [initial_nuclei], 0.1, 50.0)]:
+    print(','.join([str(x) for x in i]))
+print('')
+
+print('Solving using adaptive DP54 method......')
+for i in [x for x in ode.DP54([decay], 0.0, [initial_nuclei], 0.1, 50.0)]:
+    print(','.join([str(x) for x in i]))
+print('')
@@ -0,0 +1,35 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
+
+import ode
+
+expressions = {'human': ['birth_rate',
+                         '- (transmission_rate * human * zombie)',
+                         '- (death_rate * human)'],
+               'zombie': ['(transmission_rate * human * zombie)',
+                          '(resurrection_rate * dead)',
+                          '- (destroy_rate * human * zombie)'],
+               'dead': ['(death_rate * human)',
+                        '(destroy_rate * human * zombie)',
+                        '- (resurrection_rate * dead)']}
+parameters = {'birth_rate': 0.0,          # birth rate
+              'transmission_rate': 0.0095,# transmission percent  (per day)
+              'death_rate': 0.0001,       # natural death percent (per day)
+              'resurrection_rate': 0.0002,# resurect percent (per day)
+              'destroy_rate':0.0003       # destroy percent  (per day)
+              }
+initial_conditions = {'human': 500.0,
+                      'zombie': 0.0, 
+                      'dead': 0.0}
+modifying_expressions = ['human = human + (5*step)']
+
+(ODE, modifying_expression, y0, variables) = \
+    ode.ODE_compiler(expressions, parameters, initial_conditions,
+                     modifying_expressions)
+lower_bound = {str(variables.index('human')): [0.0, 0.0]}
+upper_bound = {str(variables.index('zombie')): [700, 700]}
+
+print(','.join(['time'] + variables))
+for x in ode.RK4(ODE, 0.0, y0, 0.1, 100.0, modifying_expression,
+                 lower_bound, upper_bound):
+    print(','.join([str(item) for item in x]))
@@ -1,4 +1,7 @@
-from distutils.core import setup
+try:
+    from setuptools import setup
+except ImportError:
+    from distutils.core import setup
 
 import copads
 
@@ -25,6 +28,7 @@ setup(name='copads',
       package_dir = {'copads' : 'copads',
                      'copads.test' : 'test'},
       packages = ['copads', 'copads.test'],
+      install_requires = ['numpy'],
       classifiers=['Development Status :: 3 - Alpha',
                    'Intended Audience :: Developers',
                    'License :: OSI Approved :: Python Software Foundation License',
@@ -0,0 +1,242 @@
+'''
+Work-precision benchmark of ODE solvers.
+
+Every applicable ODE solver is run on a set of reference problems, at a
+range of step sizes (fixed step solvers) or tolerances (adaptive
+solvers). For each run, wall time, number of evaluations of the system of
+ODEs (RHS evaluations, please see ode.Statistics), number of steps, and
+error against a high-accuracy reference solution at the end of
+integration are measured. The results are written as JSON.
+
+Reference problems:
+    - decay: radioactive decay (please see examples/ode_radioactive.py),
+    with analytical solution
+    - zombie: zombie attack model (please see
+    examples/ode_zombie_construct.py), compiled by ode.ODE_compiler. The
+    influx of humans (a modifying expression in the example) is written
+    as a term of the ODE and the boundaries are not used, so that all
+    solvers integrate the same smooth system of ODEs. The reference is
+    calculated by Bulirsch-Stoer method at tight tolerance.
+    - vanderpol: Van der Pol oscillator (mu = 1), with reference
+    calculated by Bulirsch-Stoer method at tight tolerance
+    - robertson: stiff Robertson chemical kinetics, with reference values
+    from Hairer and Wanner (1996). Solving Ordinary Differential Equations
+    II. Springer. Only the stiff solver (Rosenbrock) is benchmarked, 
+    with absolute tolerance at 1e-4 of relative tolerance as y[1] is in 
+    the order of 1e-5.
+
+Usage:
+    python bench_ode.py [<output JSON file> [<previous JSON file>]]
+
+where regressions (more RHS evaluations or larger error) against a
+previous JSON file are printed.
+
+Date created: 18th October 2026
+'''
+import sys
+import os
+import json
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
+import ode as N
+
+fixed_solvers = ['Euler', 'Heun', 'RK3', 'RK4', 'RK38', 'CK4', 'CK5',
+                 'RKF4', 'RKF5', 'DP4', 'DP5',
+                 'ABM2', 'ABM3', 'ABM4', 'ABM5']
+adaptive_solvers = ['RKF45', 'CK45', 'DP54', 'BulirschStoer', 'Rosenbrock']
+
+# Numbers of steps (powers of 2, so that the step sizes and x-axis are
+# exact in floating point) and tolerances
+fixed_steps = [2**k for k in range(5, 11)]
+tolerances = [1e-3, 1e-5, 1e-7, 1e-9]
+# Rosenbrock method (ROS2) is of order 2 (embedded error estimate of
+# order 1), which makes tight tolerances very costly
+stiff_tolerances = [1e-2, 1e-3, 1e-4, 1e-5]
+
+
+def decay(t, y):
+    return -0.2 * y
+
+def vanderpol(t, y):
+    return np.array([y[1], (1.0 - y[0]*y[0]) * y[1] - y[0]])
+
+def robertson(t, y):
+    return np.array([-0.04*y[0] + 1e4*y[1]*y[2],
+                     0.04*y[0] - 1e4*y[1]*y[2] - 3e7*y[1]*y[1],
+                     3e7*y[1]*y[1]])
+
+def robertson_jacobian(t, y):
+    return [[-0.04, 1e4*y[2], 1e4*y[1]],
+            [0.04, -1e4*y[2] - 6e7*y[1], -1e4*y[1]],
+            [0.0, 6e7*y[1], 0.0]]
+
+def zombie():
+    expressions = {'human': ['birth_rate',
+                             'influx',
+                             '- (transmission_rate * human * zombie)',
+                             '- (death_rate * human)'],
+                   'zombie': ['(transmission_rate * human * zombie)',
+                              '(resurrection_rate * dead)',
+                              '- (destroy_rate * human * zombie)'],
+                   'dead': ['(death_rate * human)',
+                            '(destroy_rate * human * zombie)',
+                            '- (resurrection_rate * dead)']}
+    parameters = {'birth_rate': 0.0,
+                  'influx': 5.0,
+                  'transmission_rate': 0.0095,
+                  'death_rate': 0.0001,
+                  'resurrection_rate': 0.0002,
+                  'destroy_rate': 0.0003}
+    initial_conditions = {'human': 500.0, 'zombie': 0.0, 'dead': 0.0}
+    (ODE, modifying, y0, variables) = N.ODE_compiler(expressions,
+                                                     parameters,
+                                                     initial_conditions)
+    return (ODE, y0)
+
+def reference(funcs, y0, xmax):
+    '''
+    Calculates reference solution at xmax by Bulirsch-Stoer method at
+    tight tolerance.
+    '''
+    result = list(N.BulirschStoer(funcs, 0.0, y0, 1e-3, xmax,
+                                  rtol=1e-13, atol=1e-13))
+    return np.array(result[-1][1:])
+
+def problems():
+    '''
+    Gives the reference problems as a dictionary of problem name to
+    problem definition.
+    '''
+    (zombie_ODE, zombie_y0) = zombie()
+    return {'decay': {'funcs': decay, 'y0': [10000.0], 'xmax': 10.0,
+                      'reference': 10000.0 * np.exp([-0.2 * 10.0]),
+                      'solvers': fixed_solvers + adaptive_solvers},
+            'zombie': {'funcs': zombie_ODE, 'y0': list(zombie_y0),
+                       'xmax': 100.0,
+                       'reference': None,
+                       'solvers': fixed_solvers + adaptive_solvers},
+            'vanderpol': {'funcs': vanderpol, 'y0': [2.0, 0.0],
+                          'xmax': 20.0,
+                          'reference': None,
+                          'solvers': fixed_solvers + adaptive_solvers},
+            'robertson': {'funcs': robertson, 'y0': [1.0, 0.0, 0.0],
+                          'xmax': 40.0,
+                          'reference': np.array([0.7158270687193,
+                                                 9.185534764557e-6,
+                                                 0.2841637457531]),
+                          'jacobian': robertson_jacobian,
+                          'atol': 1e-4,
+                          'solvers': ['Rosenbrock']}}
+
+def error(y, ref):
+    '''
+    Maximum relative error of variables against reference, where the
+    relative error of a variable is taken against a minimum magnitude of
+    1e-6.
+    '''
+    return float(np.max(np.abs(np.array(y) - ref) /
+                        np.maximum(np.abs(ref), 1e-6)))
+
+def run(problem, solver, step=None, tolerance=None):
+    '''
+    Runs an ODE solver on a problem, at a step size (fixed step solvers)
+    or a tolerance (adaptive solvers).
+
+    @return: dictionary of measurements
+    '''
+    stats = N.Statistics()
+    keywords = {'stats': stats}
+    if tolerance is not None:
+        keywords['rtol'] = tolerance
+        keywords['atol'] = tolerance * problem.get('atol', 1.0)
+        step = problem['xmax'] * 1e-3
+    if solver == 'Rosenbrock' and 'jacobian' in problem:
+        keywords['jacobian'] = problem['jacobian']
+    start = time.perf_counter()
+    result = list(getattr(N, solver)(problem['funcs'], 0.0, problem['y0'],
+                                     step, problem['xmax'], **keywords))
+    elapsed = time.perf_counter() - start
+    return {'solver': solver,
+            'step': step if tolerance is None else None,
+            'tolerance': tolerance,
+            'time': elapsed,
+            'rhs_evaluations': stats.rhs_evaluations,
+            'steps': stats.accepted_steps,
+            'rejected_steps': stats.rejected_steps,
+            'error': error(result[-1][1:], problem['reference'])}
+
+def work_precision(names=None, solvers=None):
+    '''
+    Runs the work-precision benchmark.
+
+    @param names: names of problems to run. Default = None (all problems)
+    @param solvers: names of solvers to run. Default = None (all
+    applicable solvers)
+    @return: dictionary of problem name to list of measurements
+    '''
+    results = {}
+    definitions = problems()
+    for name in names or sorted(definitions.keys()):
+        problem = definitions[name]
+        if problem['reference'] is None:
+            problem['reference'] = reference(problem['funcs'],
+                                             problem['y0'],
+                                             problem['xmax'])
+        results[name] = []
+        for solver in problem['solvers']:
+            if solvers and solver not in solvers: continue
+            if solver in fixed_solvers:
+                for n in fixed_steps:
+                    results[name].append(run(problem, solver,
+                                             step=problem['xmax'] / n))
+            elif solver == 'Rosenbrock':
+                for tolerance in stiff_tolerances:
+                    results[name].append(run(problem, solver,
+                                             tolerance=tolerance))
+            else:
+                for tolerance in tolerances:
+                    results[name].append(run(problem, solver,
+                                             tolerance=tolerance))
+    return results
+
+def regressions(previous, current, factor=1.01):
+    '''
+    Compares the results of 2 benchmarks and lists the runs with more
+    RHS evaluations or larger error (by more than factor) than previous
+    benchmark. Wall time is not compared as it depends on the machine.
+
+    @return: list of (problem, solver, step, tolerance, measurement,
+    previous value, current value)
+    '''
+    found = []
+    for name in current:
+        if name not in previous: continue
+        runs = dict([((r['solver'], r['step'], r['tolerance']), r)
+                     for r in previous[name]])
+        for r in current[name]:
+            key = (r['solver'], r['step'], r['tolerance'])
+            if key not in runs: continue
+            for measurement in ['rhs_evaluations', 'error']:
+                if r[measurement] > runs[key][measurement] * factor:
+                    found.append((name,) + key +
+                                 (measurement, runs[key][measurement],
+                                  r[measurement]))
+    return found
+
+
+if __name__ == '__main__':
+    results = work_precision()
+    if len(sys.argv) > 1:
+        f = open(sys.argv[1], 'w')
+        json.dump(results, f, indent=1)
+        f.close()
+    else:
+        print(json.dumps(results, indent=1))
+    if len(sys.argv) > 2:
+        previous = json.load(open(sys.argv[2]))
+        for regression in regressions(previous, results):
+            print('Regression: %s %s (step = %s, tolerance = %s) %s: '
+                  '%s -> %s' % regression)
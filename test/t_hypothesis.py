@@ -285,6 +285,42 @@ class testTDistribution(unittest.TestCase):
             group2 = (80, 43, 63, 39), confidence = 0.95)[2], 1.493, places=3)
         self.assertFalse(N.ZtestLogOddsRatio(group1 = (76, 79, 100, 200), 
             group2 = (80, 43, 63, 39), confidence = 0.95)[4])
+
+class testCriticalValue(unittest.TestCase):
+
+    def tearDown(self):
+        N.clear_quantile_tables()
+        N.critical_value_cache(size=4096, clear=True)
+
+    def testCache(self):
+        N.critical_value_cache(clear=True)
+        d = N.ChiSquareDistribution(df=10)
+        self.assertAlmostEqual(N.critical_value(d, 0.95), 18.307038,
+            places=5)
+        self.assertEqual(N.critical_value_cache(), 1)
+        N.critical_value(N.ChiSquareDistribution(df=10), 0.95)
+        self.assertEqual(N.critical_value_cache(), 1)
+        N.critical_value(N.ChiSquareDistribution(df=11), 0.95)
+        self.assertEqual(N.critical_value_cache(), 2)
+
+    def testCacheSize(self):
+        N.critical_value_cache(size=2, clear=True)
+        for df in [1, 2, 3]:
+            N.critical_value(N.TDistribution(shape=df), 0.975)
+        self.assertEqual(N.critical_value_cache(), 2)
+        self.assertEqual(N.critical_value_cache(size=0), 0)
+
+    def testQuantileTable(self):
+        table = N.add_quantile_table(N.TDistribution(shape=10))
+        self.assertAlmostEqual(table.quantile(0.975), 2.228139, places=5)
+        self.assertAlmostEqual(N.critical_value(N.TDistribution(shape=10),
+            0.975), 2.228139, places=5)
+
+    def testTestCI(self):
+        N.precompute_quantile_tables(df=[11], fdf=[])
+        self.assertAlmostEqual(N.t1Mean(smean=5.2, pmean=5.0, svar=0.5,
+            ssize=12, confidence=0.975, is_testCI=True)[3], 2.200985,
+            places=5)
             
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -315,7 +315,7 @@ class testNR(unittest.TestCase):
 #    def testwwghts(self): self.assertAlmostEqual(N.<something>( ), testdata)
 #    def testzbrac(self): self.assertAlmostEqual(N.<something>( ), testdata)
 #    def testzbrak(self): self.assertAlmostEqual(N.<something>( ), testdata)
-#    def testzbrent(self): self.assertAlmostEqual(N.<something>( ), testdata)
+    def testzbrent(self): self.assertAlmostEqual(N.zbrent(lambda x: x*x - 2.0, 0.0, 2.0), 1.41421356)
 #    def testzrhqr(self): self.assertAlmostEqual(N.<something>( ), testdata)
 #    def testzriddr(self): self.assertAlmostEqual(N.<something>( ), testdata)
 #    def testzroots(self): self.assertAlmostEqual(N.<something>( ), testdata)
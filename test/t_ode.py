@@ -0,0 +1,777 @@
+import sys
+import os
+import asyncio
+import math
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
+import ode as N
+
+decay_constant = 0.2
+
+def decay(t, y):
+    return -decay_constant * y[0]
+
+def decay_vector(t, y):
+    return -decay_constant * y
+
+def oscillator(t, y):
+    return y[1]
+
+def oscillator_prime(t, y):
+    return -y[0]
+
+def oscillator_vector(t, y):
+    return np.array([y[1], -y[0]])
+
+def decay_solution(t):
+    return 10000.0 * math.exp(-decay_constant * t)
+
+
+class testAdaptive(unittest.TestCase):
+    def testRKF45(self):
+        result = list(N.RKF45([decay], 0.0, [10000.0], 0.1, 50.0,
+                              rtol=1e-8, atol=1e-8))
+        self.assertAlmostEqual(result[-1][0], 50.0)
+        self.assertAlmostEqual(result[-1][1], decay_solution(50.0),
+                               places=5)
+    def testCK45(self):
+        result = list(N.CK45([decay], 0.0, [10000.0], 0.1, 50.0,
+                             rtol=1e-8, atol=1e-8))
+        self.assertAlmostEqual(result[-1][0], 50.0)
+        self.assertAlmostEqual(result[-1][1], decay_solution(50.0),
+                               places=5)
+    def testDP54(self):
+        result = list(N.DP54([decay], 0.0, [10000.0], 0.1, 50.0,
+                             rtol=1e-8, atol=1e-8))
+        self.assertAlmostEqual(result[-1][0], 50.0)
+        self.assertAlmostEqual(result[-1][1], decay_solution(50.0),
+                               places=5)
+    def testFewerSteps(self):
+        fixed = list(N.RK4([decay], 0.0, [10000.0], 0.1, 50.0))
+        adaptive = list(N.DP54([decay], 0.0, [10000.0], 0.1, 50.0))
+        self.assertTrue(len(adaptive) < len(fixed))
+    def testRejectLargeStep(self):
+        # an initial step far too large for the tolerance must be rejected
+        result = list(N.DP54([decay], 0.0, [10000.0], 25.0, 50.0,
+                             rtol=1e-6, atol=1e-6))
+        self.assertTrue(result[1][0] < 25.0)
+        self.assertAlmostEqual(result[-1][1], decay_solution(50.0),
+                               places=3)
+    def testLowerBound(self):
+        def drain(t, y): return -1.0
+        result = list(N.DP54([drain], 0.0, [1.0], 0.1, 5.0,
+                             lower_bound={'0': [0.0, 0.0]}))
+        self.assertTrue(min([x[1] for x in result]) >= 0.0)
+
+
+class testVectorized(unittest.TestCase):
+    def compare(self, solver):
+        listed = list(solver([oscillator, oscillator_prime], 0.0, 
+                             [1.0, 0.0], 0.01, 1.0))
+        vectorized = list(solver(oscillator_vector, 0.0, 
+                                 np.array([1.0, 0.0]), 0.01, 1.0))
+        self.assertEqual(len(listed), len(vectorized))
+        for i in range(len(listed)):
+            for j in range(3):
+                self.assertAlmostEqual(listed[i][j], vectorized[i][j], 
+                                       places=8)
+    def testEuler(self): self.compare(N.Euler)
+    def testHeun(self): self.compare(N.Heun)
+    def testRK3(self): self.compare(N.RK3)
+    def testRK4(self): self.compare(N.RK4)
+    def testRK38(self): self.compare(N.RK38)
+    def testCK4(self): self.compare(N.CK4)
+    def testCK5(self): self.compare(N.CK5)
+    def testRKF4(self): self.compare(N.RKF4)
+    def testRKF5(self): self.compare(N.RKF5)
+    def testDP4(self): self.compare(N.DP4)
+    def testDP5(self): self.compare(N.DP5)
+    def testDP54(self): self.compare(N.DP54)
+    def testABM4(self): self.compare(N.ABM4)
+    def testBoundary(self):
+        result = list(N.RK4(decay_vector, 0.0, [1.0, 1.0], 0.1, 5.0,
+                            lower_bound={'0': [0.5, 0.5]}))
+        self.assertAlmostEqual(result[-1][1], 0.5)
+        self.assertTrue(result[-1][2] < 0.5)
+    def testNonFinite(self):
+        def reciprocal(t, y): return 1.0 / y
+        result = list(N.Euler(reciprocal, 0.0, [0.0, 1.0], 0.1, 0.1,
+                              overflow=1e12, zerodivision=1e10))
+        self.assertAlmostEqual(result[-1][1], 1e9)
+    def testOverflow(self):
+        def exponential(t, y): return np.exp(1000.0 + y)
+        result = list(N.Euler(exponential, 0.0, [0.0], 0.1, 0.1,
+                              overflow=1e12, zerodivision=1e10))
+        self.assertAlmostEqual(result[-1][1], 1e11)
+    def testZeroDivision(self):
+        # same as ZeroDivisionError in list mode
+        listed = list(N.RK4([lambda t, y: 1.0 / y[0]], 0.0, [0.0], 0.1, 
+                            1.0, overflow=9.0, zerodivision=7.0))
+        vectorized = list(N.RK4(lambda t, y: np.array([1.0 / y[0]]), 0.0, 
+                                [0.0], 0.1, 1.0, overflow=9.0, 
+                                zerodivision=7.0))
+        self.assertAlmostEqual(listed[-1][1], vectorized[-1][1], places=10)
+
+
+class testEnsemble(unittest.TestCase):
+    def setUp(self):
+        self.parameters = [[0.1], [0.2], [0.3]]
+        def decay(t, Y, P): return -P * Y
+        self.decay = decay
+    def testMatchSingleRun(self):
+        result = list(N.ensemble(self.decay, 0.0, [[100.0]]*3, 0.1, 5.0,
+                                 self.parameters))
+        for i in range(3):
+            def single(t, y): return -self.parameters[i][0] * y[0]
+            expected = list(N.RK4([single], 0.0, [100.0], 0.1, 5.0))
+            self.assertAlmostEqual(result[-1][1][i][0], expected[-1][1])
+    def testTerminate(self):
+        def terminate(t, Y, P): return Y[:, 0] < 50.0
+        result = list(N.ensemble(self.decay, 0.0, [[100.0]]*3, 0.1, 50.0,
+                                 self.parameters, terminate=terminate))
+        (x, Y, active) = result[-1]
+        self.assertFalse(active.any())
+        self.assertTrue(x < 50.0)
+        self.assertTrue((Y[:, 0] < 50.0).all())
+        self.assertTrue((Y[:, 0] > 45.0).all())
+    def testBoundaryPerRun(self):
+        result = list(N.ensemble(self.decay, 0.0, [[100.0]]*3, 0.1, 20.0,
+                                 self.parameters, 
+                                 lower_bound={'0': [[0.0, 30.0, 60.0], 
+                                                    [0.0, 30.0, 60.0]]}))
+        Y = result[-1][1]
+        self.assertTrue(Y[0, 0] < 30.0)
+        self.assertAlmostEqual(Y[1, 0], 30.0)
+        self.assertAlmostEqual(Y[2, 0], 60.0)
+    def testUnknownSolver(self):
+        try:
+            list(N.ensemble(self.decay, 0.0, [[100.0]]*3, 0.1, 5.0,
+                            self.parameters, ODE_solver='RK9'))
+        except N.FunctionParameterValueError as error:
+            self.assertEqual(str(error), 
+                             'Unknown fixed step ODE solver: RK9')
+        else:
+            self.fail('FunctionParameterValueError not raised')
+
+
+def robertson(t, y):
+    return np.array([-0.04*y[0] + 1e4*y[1]*y[2],
+                     0.04*y[0] - 1e4*y[1]*y[2] - 3e7*y[1]*y[1],
+                     3e7*y[1]*y[1]])
+
+def robertson_jacobian(t, y):
+    return [[-0.04, 1e4*y[2], 1e4*y[1]],
+            [0.04, -1e4*y[2] - 6e7*y[1], -1e4*y[1]],
+            [0.0, 6e7*y[1], 0.0]]
+
+class testRosenbrock(unittest.TestCase):
+    def testRobertson(self):
+        result = list(N.Rosenbrock(robertson, 0.0, [1.0, 0.0, 0.0], 1e-6, 
+                                   40.0, jacobian=robertson_jacobian,
+                                   rtol=1e-4, atol=1e-10))
+        self.assertAlmostEqual(result[-1][0], 40.0)
+        self.assertAlmostEqual(result[-1][1], 0.7158, places=3)
+        self.assertAlmostEqual(result[-1][3], 0.2842, places=3)
+        self.assertTrue(len(result) < 2000)
+    def testFiniteDifferenceJacobian(self):
+        funcs = [lambda t, y: robertson(t, y)[0],
+                 lambda t, y: robertson(t, y)[1],
+                 lambda t, y: robertson(t, y)[2]]
+        result = list(N.Rosenbrock(funcs, 0.0, [1.0, 0.0, 0.0], 1e-6, 
+                                   40.0, rtol=1e-4, atol=1e-10))
+        self.assertAlmostEqual(result[-1][1], 0.7158, places=3)
+        self.assertAlmostEqual(result[-1][3], 0.2842, places=3)
+    def testDecay(self):
+        result = list(N.Rosenbrock([decay], 0.0, [10000.0], 0.1, 50.0,
+                                   rtol=1e-4, atol=1e-4))
+        self.assertAlmostEqual(result[-1][1], decay_solution(50.0),
+                               places=2)
+
+
+class testOutput(unittest.TestCase):
+    def testOutputTimes(self):
+        times = [0.0, 1.05, 2.5, 10.03, 20.0]
+        result = list(N.RK4([decay], 0.0, [10000.0], 0.1, 50.0,
+                            output_times=times))
+        self.assertEqual([x[0] for x in result], times)
+        for x in result:
+            self.assertAlmostEqual(x[1], decay_solution(x[0]), places=3)
+    def testOutputTimesAdaptive(self):
+        result = list(N.DP54(decay_vector, 0.0, [10000.0], 0.1, 50.0,
+                             output_times=[10.0, 25.0, 40.0]))
+        self.assertEqual(len(result), 3)
+        for x in result:
+            self.assertAlmostEqual(x[1], decay_solution(x[0]), places=2)
+    def testEvery(self):
+        result = list(N.Euler([decay], 0.0, [10000.0], 0.1, 1.0, 
+                              every=3))
+        self.assertEqual(len(result), 5)
+        self.assertAlmostEqual(result[1][0], 0.3)
+        self.assertTrue(result[-1][0] >= 1.0)
+    def testEveryWithinSolver(self):
+        for (solver, funcs) in [(N.RK4, oscillator_vector),
+                                (N.DP54, [oscillator, oscillator_prime]),
+                                (N.ABM4, [oscillator, oscillator_prime]),
+                                (N.BulirschStoer, oscillator_vector)]:
+            full = [list(x) for x in
+                    solver(funcs, 0.0, [0.0, 1.0], 0.1, 5.0)]
+            stats = N.Statistics()
+            result = [list(x) for x in
+                      solver(funcs, 0.0, [0.0, 1.0], 0.1, 5.0, every=4,
+                             stats=stats)]
+            expected = full[::4]
+            if (len(full) - 1) % 4: expected.append(full[-1])
+            self.assertEqual(result, expected)
+            self.assertEqual(stats.accepted_steps, len(full) - 1)
+
+
+class testCompiler(unittest.TestCase):
+    def setUp(self):
+        self.expressions = {'human': ['birth_rate',
+                                      '- (rate * human * zombie)',
+                                      '- (death_rate * human)'],
+                            'zombie': ['(rate * human * zombie)']}
+        self.parameters = {'birth_rate': 0.0, 
+                           'rate': 0.0095, 
+                           'death_rate': 0.0001}
+        self.initial_conditions = {'human': 500.0, 'zombie': 1.0}
+    def testSubstitution(self):
+        (ODE, modifying, y0, variables) = \
+            N.ODE_compiler(self.expressions, self.parameters, 
+                           self.initial_conditions)
+        self.assertEqual(variables, ['human', 'zombie'])
+        self.assertEqual(modifying, None)
+        dy = ODE(0.0, y0)
+        self.assertAlmostEqual(dy[0], -0.0095*500.0 - 0.0001*500.0)
+        self.assertAlmostEqual(dy[1], 0.0095*500.0)
+    def testModifying(self):
+        (ODE, modifying, y0, variables) = \
+            N.ODE_compiler(self.expressions, self.parameters, 
+                           self.initial_conditions, 
+                           ['human = human + (rate * step)'])
+        y = modifying(y0.copy(), 10.0)
+        self.assertAlmostEqual(y[0], 500.095)
+    def testParameterVariant(self):
+        (ODE1, m1, y0, v1) = N.ODE_compiler(self.expressions, 
+                                            self.parameters, 
+                                            self.initial_conditions)
+        self.parameters['rate'] = 0.0
+        (ODE2, m2, y0, v2) = N.ODE_compiler(self.expressions, 
+                                            self.parameters, 
+                                            self.initial_conditions)
+        self.assertAlmostEqual(ODE1(0.0, y0)[1], 0.0095*500.0)
+        self.assertAlmostEqual(ODE2(0.0, y0)[1], 0.0)
+    def testConstructor(self):
+        statements = N.ODE_constructor(os.devnull, 'results.csv', 
+                                       (0.0, 0.1, 1.0), 'RK4',
+                                       self.expressions, self.parameters,
+                                       self.initial_conditions)
+        script = ''.join(statements)
+        self.assertTrue('y[0] * y[1]' in script)
+        self.assertFalse('death_rate' in script)
+    def testCacheBound(self):
+        for i in range(N._compiled_models_size + 10):
+            N.ODE_compiler({'N': ['- (%s * N)' % str(i)]}, {}, 
+                           {'N': 1.0})
+        self.assertEqual(len(N._compiled_models), N._compiled_models_size)
+
+
+class testCSE(unittest.TestCase):
+    def setUp(self):
+        self.expressions = {'human': ['- (rate * human * zombie)'],
+                            'zombie': ['(rate * human * zombie)',
+                                       '- (kill * human * zombie)']}
+        self.parameters = {'rate': 0.0095, 'kill': 0.0003}
+        self.initial_conditions = {'human': 500.0, 'zombie': 1.0}
+    def testSharedTerm(self):
+        (temporaries, derivatives) = N._fused_constructor(
+            self.expressions, ['human', 'zombie'],
+            {'rate': '0.0095', 'kill': '0.0003',
+             'human': 'y[0]', 'zombie': 'y[1]'})
+        shared = [t for t in temporaries if '0.0095' in t]
+        self.assertEqual(len(shared), 1)
+        self.assertFalse('0.0095' in ''.join(derivatives))
+    def testFusedCompiler(self):
+        (ODE, modifying, y0, variables) = \
+            N.ODE_compiler(self.expressions, self.parameters,
+                           self.initial_conditions)
+        dy = ODE(0.0, y0)
+        self.assertAlmostEqual(dy[0], -0.0095*500.0)
+        self.assertAlmostEqual(dy[1], 0.0095*500.0 - 0.0003*500.0)
+    def testFusedConstructor(self):
+        statements = N.ODE_constructor(os.devnull, 'results.csv',
+                                       (0.0, 0.1, 1.0), 'RK4',
+                                       self.expressions, self.parameters,
+                                       self.initial_conditions,
+                                       fused=True)
+        script = ''.join(statements)
+        self.assertTrue('def ODE(t, y):' in script)
+        self.assertTrue('_cse' in script)
+        self.assertFalse('ODE = [None]' in script)
+    def testImpureTerm(self):
+        # calls and guarded branches are computed as in the expressions
+        (temporaries, derivatives) = N._fused_constructor(
+            {'human': ['random.random() * human', 
+                       '(rate / zombie if zombie else 0)'],
+             'zombie': ['random.random() * human',
+                        '(rate / zombie if zombie else 0)']},
+            ['human', 'zombie'], 
+            {'rate': '0.0095', 'human': 'y[0]', 'zombie': 'y[1]'})
+        self.assertEqual(temporaries, [])
+        self.assertEqual(derivatives[0].count('random.random()'), 1)
+        self.assertTrue('if y[1] else 0' in derivatives[1])
+
+
+class testEvent(unittest.TestCase):
+    def setUp(self):
+        def half(t, y): return y[0] - 5000.0
+        self.half = half
+        self.half_life = math.log(2.0) / decay_constant
+    def testTerminal(self):
+        event = N.Event(self.half, terminal=True)
+        result = list(N.RK4([decay], 0.0, [10000.0], 0.1, 50.0,
+                            events=[event]))
+        self.assertAlmostEqual(result[-1][0], self.half_life, places=6)
+        self.assertAlmostEqual(result[-1][1], 5000.0, places=6)
+        self.assertEqual(len(event.occurrences), 1)
+    def testReuse(self):
+        event = N.Event(self.half, terminal=True)
+        for i in range(2):
+            list(N.RK4([decay], 0.0, [10000.0], 0.1, 50.0, events=[event]))
+        self.assertEqual(len(event.occurrences), 1)
+    def testRecord(self):
+        def crossing(t, y): return y[0]
+        event = N.Event(crossing)
+        result = list(N.RK4([oscillator, oscillator_prime], 0.0, 
+                            [1.0, 0.0], 0.01, 10.0, events=[event]))
+        self.assertTrue(result[-1][0] >= 10.0)
+        self.assertEqual(len(event.occurrences), 3)
+        for (k, occurrence) in enumerate(event.occurrences):
+            self.assertAlmostEqual(occurrence[0], (k + 0.5) * math.pi, 
+                                   places=6)
+    def testDirection(self):
+        def crossing(t, y): return y[0]
+        event = N.Event(crossing, direction=1)
+        list(N.RK4(oscillator_vector, 0.0, [1.0, 0.0], 0.01, 10.0, 
+                   events=[event]))
+        self.assertEqual(len(event.occurrences), 1)
+        self.assertAlmostEqual(event.occurrences[0][0], 1.5 * math.pi, 
+                               places=6)
+    def testAdaptive(self):
+        event = N.Event(self.half, terminal=True)
+        result = list(N.DP54(decay_vector, 0.0, [10000.0], 0.1, 50.0,
+                             rtol=1e-8, atol=1e-8, events=[event]))
+        self.assertAlmostEqual(result[-1][0], self.half_life, places=5)
+
+
+class testMultistep(unittest.TestCase):
+    def error(self, solver, step):
+        result = list(solver([decay], 0.0, [10000.0], step, 10.0))
+        return abs(result[-1][1] - decay_solution(result[-1][0]))
+    def order(self, solver):
+        return math.log(self.error(solver, 0.1) / 
+                        self.error(solver, 0.05), 2)
+    def testABM2(self): self.assertAlmostEqual(self.order(N.ABM2), 2, 1)
+    def testABM3(self): self.assertAlmostEqual(self.order(N.ABM3), 3, 1)
+    def testABM4(self): self.assertAlmostEqual(self.order(N.ABM4), 4, 1)
+    def testABM5(self): self.assertAlmostEqual(self.order(N.ABM5), 5, 1)
+    def testEvaluations(self):
+        count = [0]
+        def counted(t, y):
+            count[0] = count[0] + 1
+            return decay(t, y)
+        result = list(N.ABM4([counted], 0.0, [10000.0], 0.1, 10.0))
+        # 3 starting steps by RK4 (4 evaluations each) and 2 evaluations
+        # per step afterwards, including the derivatives of the history
+        steps = len(result) - 1
+        self.assertTrue(count[0] <= 2 * steps + 3 * 4 + 4)
+
+
+class testBulirschStoer(unittest.TestCase):
+    def testDecay(self):
+        result = list(N.BulirschStoer([decay], 0.0, [10000.0], 0.1, 50.0,
+                                      rtol=1e-10, atol=1e-10))
+        self.assertAlmostEqual(result[-1][0], 50.0)
+        self.assertAlmostEqual(result[-1][1], decay_solution(50.0),
+                               places=6)
+    def testFewerSteps(self):
+        dp = list(N.DP54(oscillator_vector, 0.0, [1.0, 0.0], 0.1, 20.0,
+                         rtol=1e-10, atol=1e-10))
+        bs = list(N.BulirschStoer(oscillator_vector, 0.0, [1.0, 0.0], 
+                                  0.1, 20.0, rtol=1e-10, atol=1e-10))
+        self.assertTrue(len(bs) * 5 < len(dp))
+        self.assertAlmostEqual(bs[-1][1], math.cos(20.0), places=8)
+    def testRejectLargeStep(self):
+        result = list(N.BulirschStoer([decay], 0.0, [10000.0], 50.0, 50.0,
+                                      rtol=1e-8, atol=1e-8))
+        self.assertTrue(result[1][0] < 50.0)
+        self.assertAlmostEqual(result[-1][1], decay_solution(50.0),
+                               places=4)
+    def testVectorized(self):
+        listed = list(N.BulirschStoer([oscillator, oscillator_prime], 0.0,
+                                      [1.0, 0.0], 0.1, 5.0))
+        vectorized = list(N.BulirschStoer(oscillator_vector, 0.0, 
+                                          [1.0, 0.0], 0.1, 5.0))
+        self.assertEqual(len(listed), len(vectorized))
+        self.assertAlmostEqual(listed[-1][1], vectorized[-1][1])
+
+
+class testSink(unittest.TestCase):
+    def setUp(self):
+        self.expected = list(N.RK4([decay], 0.0, [10000.0], 0.1, 10.0))
+        self.directory = tempfile.mkdtemp()
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+    def testAbstract(self):
+        self.assertRaises(TypeError, N.ResultSink)
+    def testArraySinkBlock(self):
+        sink = N.ArraySink(capacity=2)
+        sink.write_block(np.array(self.expected))
+        self.assertEqual(sink.array().tolist(), self.expected)
+    def testArraySink(self):
+        sink = N.ArraySink(capacity=10)
+        sink.extend(N.RK4([decay], 0.0, [10000.0], 0.1, 10.0))
+        sink.close()
+        data = sink.array()
+        self.assertEqual(data.shape, (len(self.expected), 2))
+        self.assertEqual(data[-1].tolist(), self.expected[-1])
+    def testNPYSink(self):
+        filename = os.path.join(self.directory, 'results.npy')
+        with N.NPYSink(filename, block_size=16) as sink:
+            sink.extend(N.RK4([decay], 0.0, [10000.0], 0.1, 10.0))
+        data = sink.load()
+        self.assertEqual(data.shape, (len(self.expected), 2))
+        self.assertEqual(data[-1].tolist(), self.expected[-1])
+        self.assertEqual(np.load(filename)[5].tolist(), self.expected[5])
+    def testCSVSink(self):
+        filename = os.path.join(self.directory, 'results.csv')
+        with N.CSVSink(filename, ['time', 'y'], block_size=16) as sink:
+            sink.extend(N.RK4([decay], 0.0, [10000.0], 0.1, 10.0))
+        with open(filename) as f:
+            lines = f.read().split('\n')
+        self.assertEqual(lines[0], 'time,y')
+        self.assertEqual(len(lines), len(self.expected) + 2)
+        self.assertEqual([float(x) for x in lines[-2].split(',')], 
+                         self.expected[-1])
+
+
+class testThreaded(unittest.TestCase):
+    def setUp(self):
+        self.expected = list(N.RK4([decay], 0.0, [10000.0], 0.1, 10.0))
+    def testThreadedResults(self):
+        result = list(N.threaded_results(N.RK4([decay], 0.0, [10000.0], 
+                                               0.1, 10.0), 
+                                         maxsize=2, block_size=8))
+        self.assertEqual(result, self.expected)
+    def testAsyncResults(self):
+        async def consume():
+            return [x async for x in 
+                    N.async_results(N.RK4([decay], 0.0, [10000.0], 
+                                          0.1, 10.0))]
+        self.assertEqual(asyncio.run(consume()), self.expected)
+    def testException(self):
+        def failing(t, y): 
+            if t > 1.0: raise ValueError('failing')
+            return 0.0
+        rows = N.threaded_results(N.RK4([failing], 0.0, [1.0], 0.1, 10.0))
+        self.assertRaises(ValueError, list, rows)
+    def testStop(self):
+        rows = N.threaded_results(N.RK4([decay], 0.0, [10000.0], 0.1, 
+                                        1e6), maxsize=1, block_size=4)
+        self.assertEqual(next(rows), [0.0, 10000.0])
+        rows.close()
+
+
+class testIntegrator(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.checkpoint = os.path.join(self.directory, 'run.npz')
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+    def testMatchGenerator(self):
+        for method in ['RK4', 'DP54', 'ABM4']:
+            integrator = N.Integrator(oscillator_vector, 0.0, [1.0, 0.0], 
+                                      0.1, 10.0, method)
+            expected = getattr(N, method)(oscillator_vector, 0.0, 
+                                          [1.0, 0.0], 0.1, 10.0)
+            self.assertEqual([x.tolist() for x in integrator],
+                             [x.tolist() for x in expected])
+    def resume(self, method):
+        full = list(N.Integrator([oscillator, oscillator_prime], 0.0, 
+                                 [1.0, 0.0], 0.1, 10.0, method))
+        integrator = N.Integrator([oscillator, oscillator_prime], 0.0, 
+                                  [1.0, 0.0], 0.1, 10.0, method, 
+                                  checkpoint=self.checkpoint,
+                                  checkpoint_steps=7)
+        partial = []
+        for x in integrator:
+            partial.append(x)
+            # Pre-empted between checkpoints
+            if len(partial) == 40: break
+        integrator = N.Integrator([oscillator, oscillator_prime], 0.0, 
+                                  [1.0, 0.0], 0.1, 10.0, method)
+        integrator.load(self.checkpoint)
+        self.assertEqual(integrator.steps, 35)
+        self.assertEqual(partial[:36] + list(integrator), full)
+    def testResumeRK4(self): self.resume('RK4')
+    def testResumeDP54(self): self.resume('DP54')
+    def testResumeABM4(self): self.resume('ABM4')
+    def testCheckpointSeconds(self):
+        integrator = N.Integrator([decay], 0.0, [10000.0], 0.1, 1.0, 
+                                  checkpoint=self.checkpoint,
+                                  checkpoint_seconds=0.0)
+        result = list(integrator)
+        integrator = N.Integrator([decay], 0.0, [10000.0], 0.1, 1.0)
+        integrator.load(self.checkpoint)
+        self.assertEqual(integrator.steps, len(result) - 1)
+        self.assertEqual(integrator.x, result[-1][0])
+    def testMethodMismatch(self):
+        N.Integrator([decay], 0.0, [10000.0], 0.1, 1.0).save(self.checkpoint)
+        integrator = N.Integrator([decay], 0.0, [10000.0], 0.1, 1.0, 'DP54')
+        self.assertRaises(N.FunctionParameterValueError, 
+                          integrator.load, self.checkpoint)
+
+
+class testStatistics(unittest.TestCase):
+    def testSameResults(self):
+        stats = N.Statistics()
+        result = list(N.DP54([decay], 0.0, [10000.0], 0.1, 50.0, 
+                             stats=stats))
+        expected = list(N.DP54([decay], 0.0, [10000.0], 0.1, 50.0))
+        self.assertEqual(result, expected)
+        self.assertEqual(stats.accepted_steps, len(expected) - 1)
+    def testEvaluations(self):
+        stats = N.Statistics()
+        result = list(N.RK4(oscillator_vector, 0.0, [1.0, 0.0], 0.1, 1.0,
+                            stats=stats))
+        self.assertEqual(stats.rhs_evaluations, 4 * (len(result) - 1))
+        stats = N.Statistics()
+        result = list(N.RK4([oscillator, oscillator_prime], 0.0, 
+                            [1.0, 0.0], 0.1, 1.0, stats=stats))
+        self.assertEqual(stats.rhs_evaluations, 4 * (len(result) - 1))
+    def testRejectedSteps(self):
+        stats = N.Statistics()
+        list(N.DP54([decay], 0.0, [10000.0], 25.0, 50.0, stats=stats))
+        self.assertTrue(stats.rejected_steps > 0)
+    def testBoundaryCorrections(self):
+        def drain(t, y): return -1.0
+        stats = N.Statistics()
+        result = list(N.Euler([drain], 0.0, [0.45], 0.1, 1.0, 
+                              lower_bound={'0': [0.0, 0.0]}, stats=stats))
+        self.assertEqual(result[-1][1], 0.0)
+        self.assertEqual(stats.boundary_corrections, len(result) - 5)
+    def testFallbacks(self):
+        def reciprocal(t, y): return 1.0 / y[0]
+        stats = N.Statistics()
+        list(N.Euler([reciprocal], 0.0, [0.0], 0.1, 0.1, stats=stats))
+        self.assertEqual(stats.fallbacks['ZeroDivisionError'], 1)
+        stats = N.Statistics()
+        list(N.Euler(lambda t, y: 1.0 / y, 0.0, [0.0], 0.1, 0.1, 
+                     stats=stats))
+        self.assertEqual(stats.fallbacks['nonfinite'], 1)
+    def testZeroDivision(self):
+        # division by zero is given zerodivision value with statistics
+        def pole(t, y): return np.array([1.0 / (y[0] - 1.0)])
+        expected = list(N.Euler(pole, 0.0, [1.0], 0.1, 0.2, 
+                                overflow=5.0, zerodivision=7.0))
+        stats = N.Statistics()
+        result = list(N.Euler(pole, 0.0, [1.0], 0.1, 0.2, 
+                              overflow=5.0, zerodivision=7.0, stats=stats))
+        self.assertAlmostEqual(expected[1][1], 1.7)
+        self.assertEqual([list(row) for row in result], 
+                         [list(row) for row in expected])
+        self.assertEqual(stats.fallbacks['nonfinite'], 1)
+    def testInterleaved(self):
+        stats = N.Statistics()
+        first = N.RK4([decay], 0.0, [10000.0], 0.1, 1.0, stats=stats)
+        second = N.RK4([decay], 0.0, [10000.0], 0.1, 1.0, stats=stats)
+        result = [row for pair in zip(first, second) for row in pair]
+        self.assertEqual(stats.accepted_steps, len(result) - 2)
+        self.assertEqual(stats.rhs_evaluations, 4 * (len(result) - 2))
+
+class testJacobian(unittest.TestCase):
+    def chain(self, t, y):
+        d = np.empty_like(y)
+        d[0] = -2.0 * y[0] + y[1]
+        d[1:-1] = y[:-2] - 2.0 * y[1:-1] + y[2:] - y[1:-1] * y[1:-1]
+        d[-1] = y[-2] - 2.0 * y[-1]
+        return d
+    def testSparsity(self):
+        y = np.zeros(50)
+        pattern = N.jacobian_sparsity(self.chain, 0.0, y)
+        expected = (np.abs(np.subtract.outer(np.arange(50), 
+                                             np.arange(50))) <= 1)
+        self.assertTrue((pattern == expected).all())
+        self.assertEqual(len(N.column_groups(pattern)), 3)
+    def testBilinear(self):
+        # d(human * zombie)/d(human) is zero at zombie = 0
+        def zombie(t, y): return [-y[0] * y[1], y[0] * y[1]]
+        pattern = N.jacobian_sparsity(zombie, 0.0, [500.0, 0.0])
+        self.assertTrue(pattern.all())
+    def testGroups(self):
+        pattern = np.array([[1, 1, 0, 0], [0, 0, 1, 1], [1, 0, 1, 0]], 
+                           dtype=bool)
+        for group in N.column_groups(pattern):
+            self.assertTrue((pattern[:, group].sum(axis=1) <= 1).all())
+    def testMatrix(self):
+        y = np.linspace(0.0, 1.0, 50)
+        dense = N.jacobian_matrix(self.chain, 0.0, y, sparse=False)
+        sparse = N.jacobian_matrix(self.chain, 0.0, y)
+        self.assertTrue(np.allclose(dense, sparse, rtol=0.0, atol=0.0))
+        self.assertAlmostEqual(sparse[10, 10], -2.0 - 2.0 * y[10], 5)
+    def testListMode(self):
+        J = N.jacobian_matrix([decay, decay], 0.0, [1.0, 2.0])
+        self.assertAlmostEqual(J[0, 0], -0.2, 6)
+        self.assertAlmostEqual(J[1, 0], -0.2, 6)
+        self.assertEqual(J[0, 1], 0.0)
+        self.assertEqual(J[1, 1], 0.0)
+    def testCacheBound(self):
+        for i in range(N._jacobian_patterns_size + 10):
+            def f(t, y): return -y
+            N.jacobian_sparsity(f, 0.0, [1.0, 2.0])
+        self.assertEqual(len(N._jacobian_patterns), 
+                         N._jacobian_patterns_size)
+        self.assertTrue(N._jacobian_key(f, 2) in N._jacobian_patterns)
+
+class testSensitivity(unittest.TestCase):
+    def testDecay(self):
+        (ODE, y0, variables, names) = \
+            N.ODE_sensitivity({'N': ['- (k * N)']}, {'k': 0.2}, 
+                              {'N': 100.0})
+        self.assertEqual(list(y0), [100.0, 0.0])
+        result = list(N.DP54(ODE, 0.0, y0, 0.1, 5.0, 
+                             rtol=1e-10, atol=1e-10))
+        (t, y, S) = N.split_sensitivity(result[-1], 1)
+        self.assertEqual(t, 5.0)
+        expected = -5.0 * 100.0 * math.exp(-0.2 * 5.0)
+        self.assertAlmostEqual(S[0, 0] / expected, 1.0, 5)
+    def testParameters(self):
+        (ODE, y0, variables, names) = \
+            N.ODE_sensitivity({'N': ['b', '- (k * N)']}, 
+                              {'b': 1.0, 'k': 0.2}, {'N': 100.0},
+                              ['k'])
+        self.assertEqual(names, ['k'])
+        self.assertEqual(len(y0), 2)
+        self.assertRaises(N.FunctionParameterValueError, 
+                          N.ODE_sensitivity, {'N': ['- (k * N)']}, 
+                          {'k': 0.2}, {'N': 100.0}, ['c'])
+    def testMathFunctions(self):
+        # math.exp does not broadcast over copies of the model
+        (ODE, y0, variables, names) = \
+            N.ODE_sensitivity({'N': ['- (k * exp(N))']}, {'k': 0.2}, 
+                              {'N': 1.0})
+        dz = ODE(0.0, np.array([1.0, 2.0]))
+        self.assertAlmostEqual(dz[0], -0.2 * math.exp(1.0))
+        self.assertAlmostEqual(dz[1], -0.2 * math.exp(1.0) * 2.0 - 
+                               math.exp(1.0), 5)
+
+class testSteadyState(unittest.TestCase):
+    def logistic(self, t, y):
+        return np.array([0.4 * y[0] * (1.0 - y[0] / 80.0), 
+                         0.2 * (y[0] - y[1])])
+    def testNewton(self):
+        result = N.steady_state(self.logistic, 0.0, [1.0, 0.0], 
+                                step=0.5, transient=20.0)
+        self.assertEqual(result[0], 20.0)
+        self.assertAlmostEqual(result[1], 80.0, 8)
+        self.assertAlmostEqual(result[2], 80.0, 8)
+    def testListMode(self):
+        def inflow(t, y): return 2.0 - 0.5 * y[0]
+        result = N.steady_state([inflow], 0.0, [0.0])
+        self.assertEqual(type(result), list)
+        self.assertAlmostEqual(result[1], 4.0, 10)
+    def testSingular(self):
+        def exchange(t, y): 
+            return np.array([-y[0] + 2.0 * y[1], y[0] - 2.0 * y[1]])
+        result = N.steady_state(exchange, 0.0, [3.0, 0.0])
+        self.assertAlmostEqual(result[1], 2.0 * result[2], 10)
+    def testNotFound(self):
+        def growth(t, y): return np.array([1.0 + y[0] * y[0]])
+        self.assertRaises(N.MaxIterationsException, N.steady_state, 
+                          growth, 0.0, [0.0], maxiter=5)
+    def testEvent(self):
+        settled = N.SteadyState(self.logistic, 1e-6)
+        result = list(N.DP54(self.logistic, 0.0, [1.0, 0.0], 0.1, 1e4, 
+                             rtol=1e-10, atol=1e-10, events=[settled]))
+        self.assertTrue(result[-1][0] < 1e4)
+        self.assertEqual(len(settled.occurrences), 1)
+        derivatives = self.logistic(result[-1][0], result[-1][1:])
+        self.assertAlmostEqual(float(np.max(np.abs(derivatives))), 
+                               1e-6, 10)
+
+class testBoundary(unittest.TestCase):
+    def testChecker(self):
+        y = N.boundary_checker([-1.0, 5.0, -2.0], 
+                               {'0': [0.0, 0.0], '2': [-1.0, 1]}, 'lower')
+        self.assertEqual(y, [0.0, 5.0, 1])
+        y = N.boundary_checker([-1.0, 5.0], {'1': [4.0, 4.0]}, 'upper')
+        self.assertEqual(y, [-1.0, 4.0])
+    def testFixedStep(self):
+        def drain(t, y): return -1.0
+        for solver in [N.Euler, N.Heun, N.RK4, N.DP5]:
+            result = list(solver([drain, drain], 0.0, [0.45, 0.45], 0.1, 
+                                 1.0, lower_bound={'0': [0.0, 0.0]}, 
+                                 upper_bound={'1': [0.2, 0.2]}))
+            self.assertEqual(result[-1][1], 0.0)
+            self.assertTrue(result[-1][2] < 0.0)
+            self.assertTrue(max([r[2] for r in result[1:]]) <= 0.2)
+
+def final_values(result):
+    return result[-1][1:]
+
+class testSweep(unittest.TestCase):
+    def setUp(self):
+        self.expressions = {'human': ['birth_rate',
+                                      '- (rate * human * zombie)'],
+                            'zombie': ['(rate * human * zombie)']}
+        self.parameters = {'birth_rate': 0.0, 'rate': 0.0095}
+        self.initial_conditions = {'human': 500.0, 'zombie': 1.0}
+    def testGrid(self):
+        samples = N.parameter_grid({'rate': [0.1, 0.2], 
+                                    'birth_rate': [0.0, 0.5, 1.0]})
+        self.assertEqual(len(samples), 6)
+        self.assertEqual(samples[1], {'rate': 0.1, 'birth_rate': 0.5})
+    def testSerial(self):
+        samples = [{'rate': 0.0}, {'rate': 0.0095}, {'human': 100.0}]
+        results = list(N.parameter_sweep(self.expressions, 
+                                         self.parameters,
+                                         self.initial_conditions, samples,
+                                         0.0, 0.125, 1.0, workers=0))
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].shape, (9, 3))
+        self.assertAlmostEqual(results[0][-1][1], 500.0)
+        self.assertEqual(results[2][0][1], 100.0)
+        (ODE, m, y0, v) = N.ODE_compiler(self.expressions, 
+                                         self.parameters,
+                                         self.initial_conditions)
+        expected = np.array(list(N.RK4(ODE, 0.0, y0, 0.125, 1.0)))
+        self.assertTrue((results[1] == expected).all())
+    def testProcessPool(self):
+        samples = N.parameter_grid({'rate': [0.0, 0.001, 0.002, 0.003]})
+        serial = list(N.parameter_sweep(self.expressions, self.parameters,
+                                        self.initial_conditions, samples,
+                                        0.0, 0.5, 10.0, 'DP54', 
+                                        reducer=final_values, workers=0, 
+                                        rtol=1e-8))
+        pooled = list(N.parameter_sweep(self.expressions, self.parameters,
+                                        self.initial_conditions, samples,
+                                        0.0, 0.5, 10.0, 'DP54', 
+                                        reducer=final_values, workers=2, 
+                                        chunksize=1, rtol=1e-8))
+        self.assertTrue((np.array(serial) == np.array(pooled)).all())
+        self.assertEqual(np.array(pooled).shape, (4, 2))
+    def testUnknownSolver(self):
+        self.assertRaises(N.FunctionParameterValueError, list,
+                          N.parameter_sweep(self.expressions, 
+                                            self.parameters,
+                                            self.initial_conditions, [{}],
+                                            0.0, 0.1, 1.0, 'RK9'))
+
+
+if __name__ == '__main__':
+    unittest.main()
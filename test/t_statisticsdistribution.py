@@ -1,5 +1,6 @@
 import sys
 import os
+import math
 import unittest
 
 sys.path.append(os.path.join(os.path.dirname(os.getcwd()), 'copads'))
@@ -71,7 +72,7 @@ class testCauchy(unittest.TestCase):
         p = N.CauchyDistribution(location = 0.0, scale = 1.0).inverseCDF(0.75)[0]
         self.assertAlmostEqual(p, 1.0)
     def testinverseCDF3(self):
-        p = N.CauchyDistribution(location = 0.0, scale = 1.0).inverseCDF(0.8524163)[0]
+        p = N.CauchyDistribution(location = 0.0, scale = 1.0).inverseCDF(0.8524163823)[0]
         self.assertAlmostEqual(p, 2.0)
 
 
@@ -307,6 +308,27 @@ class testGeometric(unittest.TestCase):
         self.assertAlmostEqual(p, 6.0000, places=4)
 
         
+class testHyperbolicSecant(unittest.TestCase):
+    def testCDF(self):
+        d = N.HyperbolicSecantDistribution(location=0.0, scale=1.0)
+        self.assertAlmostEqual(d.CDF(0.0), 0.5)
+        self.assertAlmostEqual(d.CDF(1.0), 0.8695181, places=6)
+        self.assertAlmostEqual(d.CDF([1.0])[0], 0.8695181, places=6)
+    def testPDF(self):
+        d = N.HyperbolicSecantDistribution(location=0.0, scale=1.0)
+        self.assertAlmostEqual(d.PDF(0.0), 0.5)
+        self.assertAlmostEqual(math.exp(d.logPDF(1.5)), d.PDF(1.5))
+    def testinverseCDF(self):
+        d = N.HyperbolicSecantDistribution(location=1.0, scale=2.0)
+        self.assertAlmostEqual(d.inverseCDF(0.5)[0], 1.0, places=6)
+        self.assertAlmostEqual(d.CDF(d.inverseCDF(0.9)[0]), 0.9, places=6)
+    def testRandom(self):
+        d = N.HyperbolicSecantDistribution(location=1.0, scale=2.0)
+        x = d.random(20000, N.randomize.MersenneTwister(1))
+        self.assertAlmostEqual(x.mean(), 1.0, places=1)
+        self.assertAlmostEqual(x.var() / d.variance(), 1.0, places=1)
+
+        
 class testHypergeometric(unittest.TestCase):
     def testPDF(self):
         p = N.HypergeometricDistribution(sample_size=10,
@@ -508,12 +530,20 @@ class testUniform(unittest.TestCase):
         self.assertAlmostEqual(p, 0.5)
     def testPDF1(self):
         p = N.UniformDistribution(location=1.0,
-                scale=3.0).PDF()
+                scale=3.0).PDF(1.5)
         self.assertTrue(p == 0.5)
     def testPDF2(self):
         p = N.UniformDistribution(location=1.0,
-                scale=3.0).PDF()
+                scale=3.0).PDF(2.5)
         self.assertTrue(p == 0.5)
+    def testPDF3(self):
+        # outside of the distribution
+        d = N.UniformDistribution(location=1.0, scale=3.0)
+        self.assertEqual(d.PDF(0.5), 0.0)
+        self.assertEqual(d.logPDF(3.5), -math.inf)
+        self.assertEqual(list(d.PDF([0.5, 2.0, 3.5])),
+                         [0.0, 0.5, 0.0])
+        self.assertEqual(list(d.logPDF([0.5, 3.5])), [-math.inf] * 2)
     def testinverseCDF1(self):
         p = N.UniformDistribution(location=1.0,
                 scale=3.0).inverseCDF(0.25)[0]
@@ -543,11 +573,11 @@ class testWeibull(unittest.TestCase):
         self.assertAlmostEqual(p, 0.135335, places=5)
     def testinverseCDF1(self):
         p = N.WeiBullDistribution(location=1.0, 
-                    scale=1.0).inverseCDF(0.864664)[0]
+                    scale=1.0).inverseCDF(0.8646647168)[0]
         self.assertAlmostEqual(p, 2.000000, places=5)
     def testinverseCDF2(self):
         p = N.WeiBullDistribution(location=2.0, 
-                    scale=2.0).inverseCDF(0.632120)[0]
+                    scale=2.0).inverseCDF(0.6321205588)[0]
         self.assertAlmostEqual(p, 2.000000, places=5)
     def testmedian(self):
         p = N.WeiBullDistribution(location=2.0, 
@@ -559,5 +589,183 @@ class testWeibull(unittest.TestCase):
         self.assertAlmostEqual(p, 1.414213, places=5)
 
         
+class testInverseCDF(unittest.TestCase):
+    def testNormal(self):
+        p = N.NormalDistribution().inverseCDF(0.975)[0]
+        self.assertAlmostEqual(p, 1.959964, places=5)
+    def testNormalLowerTail(self):
+        p = N.NormalDistribution().inverseCDF(0.025, 0.0, 1.0)[0]
+        self.assertAlmostEqual(p, -1.959964, places=5)
+    def testContinuous(self):
+        d = N.ExponentialDistribution(location=0.0, scale=2.0)
+        (x, cprob) = d.inverseCDF(0.9)
+        self.assertAlmostEqual(cprob, 0.9, places=8)
+        self.assertAlmostEqual(d.CDF(x), 0.9, places=8)
+    def testBrent(self):
+        p = N.ChiSquareDistribution(df=10).inverseCDF(0.95)[0]
+        self.assertAlmostEqual(p, 18.307038, places=5)
+    def testDiscrete(self):
+        p = N.GeometricDistribution(success=0.001).inverseCDF(0.8)
+        self.assertEqual(p[0], 1609)
+        self.assertTrue(p[1] >= 0.8)
+        self.assertTrue(N.GeometricDistribution(success=0.001).CDF(1608)
+                        < 0.8)
+    def testStart(self):
+        p = N.ExponentialDistribution(location=0.0,
+                                      scale=2.0).inverseCDF(0.1, 1.0)
+        self.assertEqual(p[0], 1.0)
+    def testOutOfRange(self):
+        self.assertRaises(N.DistributionFunctionError,
+                          N.NormalDistribution().inverseCDF, 1.5)
+
+class testArray(unittest.TestCase):
+    def testCDF(self):
+        x = [0.5, 1.0, 2.5, 7.0]
+        for d in [N.ChiSquareDistribution(df=4), N.FDistribution(5, 7),
+                  N.TDistribution(shape=5), N.NormalDistribution(),
+                  N.ExponentialDistribution(0.0, 2.0)]:
+            p = d.CDF(x)
+            for i in range(len(x)):
+                self.assertAlmostEqual(p[i], d.CDF(x[i]), places=10)
+    def testPDF(self):
+        x = [0.5, 1.0, 2.5, 7.0]
+        d = N.TDistribution(shape=5)
+        p = d.PDF(x)
+        for i in range(len(x)):
+            self.assertAlmostEqual(p[i], d.PDF(x[i]), places=10)
+    def testElements(self):
+        # no vectorized CDF for Hypergeometric distribution
+        d = N.HypergeometricDistribution(10, 100, 50)
+        p = d.CDF([2, 5, 20])
+        self.assertAlmostEqual(p[0], d.CDF(2), places=10)
+        self.assertAlmostEqual(p[1], d.CDF(5), places=10)
+        self.assertTrue(p[2] != p[2])
+    def testInverseCDF(self):
+        (x, cprob) = N.ChiSquareDistribution(df=10).inverseCDF([0.05, 0.95])
+        self.assertAlmostEqual(x[0], 3.940299, places=5)
+        self.assertAlmostEqual(x[1], 18.307038, places=5)
+        self.assertAlmostEqual(cprob[1], 0.95, places=8)
+    def testInverseCDFNormal(self):
+        (x, cprob) = N.NormalDistribution().inverseCDF([0.025, 0.5, 0.975])
+        self.assertAlmostEqual(x[0], -1.959964, places=5)
+        self.assertAlmostEqual(x[1], 0.0, places=5)
+        self.assertAlmostEqual(x[2], 1.959964, places=5)
+    def testInverseCDFDiscrete(self):
+        d = N.GeometricDistribution(success=0.001)
+        (x, cprob) = d.inverseCDF([0.5, 0.8])
+        self.assertEqual(x[1], 1609)
+        self.assertEqual(x[0], d.inverseCDF(0.5)[0])
+    def testInverseCDFOutOfRange(self):
+        (x, cprob) = N.NormalDistribution().inverseCDF([0.5, 1.5])
+        self.assertTrue(x[1] != x[1])
+
+class testRandom(unittest.TestCase):
+    def testSize(self):
+        x = N.NormalDistribution().random(size=(2, 3))
+        self.assertEqual(x.shape, (2, 3))
+        self.assertTrue(isinstance(N.NormalDistribution().random(), float))
+    def testMersenneTwister(self):
+        # same sequence as random() of MersenneTwister
+        rng = N.randomize.MersenneTwister(42)
+        u = [(rng.random() + 0.5) / 4294967296.0 for i in range(1000)]
+        x = N.UniformDistribution(0.0, 1.0).random(1000,
+            N.randomize.MersenneTwister(42))
+        for i in range(1000):
+            self.assertAlmostEqual(x[i], u[i], places=12)
+    def testReproducible(self):
+        x1 = N.ChiSquareDistribution(df=4).random(100, N.randomize.LCG(7))
+        x2 = N.ChiSquareDistribution(df=4).random(100, N.randomize.LCG(7))
+        self.assertEqual(list(x1), list(x2))
+    def testRange(self):
+        for rng in [N.randomize.LCG(7), N.randomize.CLCG(7, 'mmix', 11),
+                    N.randomize.CLCG(7, 'ansic', 11, 'cdc')]:
+            x = N.UniformDistribution(0.0, 1.0).random(2000, rng)
+            self.assertTrue(x.min() > 0.0 and x.max() < 1.0)
+            self.assertAlmostEqual(x.mean(), 0.5, places=1)
+    def testMean(self):
+        rng = N.randomize.MersenneTwister(1)
+        for (d, mean) in [(N.ExponentialDistribution(0.0, 2.0), 2.0),
+                          (N.GammaDistribution(0.0, 2.0, 3.0), 6.0),
+                          (N.BetaDistribution(0, 1, 2, 3), 0.4),
+                          (N.PoissonDistribution(3.0), 3.0),
+                          (N.BinomialDistribution(0.4, 20), 8.0)]:
+            x = d.random(20000, rng)
+            self.assertAlmostEqual(x.mean() / mean, 1.0, places=1)
+    def testInverseTransform(self):
+        # no direct method of generating random numbers for Cosine
+        # distribution
+        x = N.CosineDistribution(0.0, 1.0).random(20000,
+            N.randomize.MersenneTwister(1))
+        self.assertTrue(abs(x.mean()) < 0.05)
+        self.assertTrue(x.min() > -N.PI and x.max() < N.PI)
+
+class testLogPDF(unittest.TestCase):
+    def testLogPDF(self):
+        for (d, x) in [(N.BetaDistribution(0, 1, 2, 3), 0.3),
+                       (N.GammaDistribution(0, 2, 3), 3.0),
+                       (N.FDistribution(5, 7), 1.0),
+                       (N.TDistribution(shape=5), 1.0),
+                       (N.PoissonDistribution(3.5), 2),
+                       (N.BinomialDistribution(0.3, 20), 7)]:
+            self.assertAlmostEqual(d.logPDF(x), math.log(d.PDF(x)),
+                                   places=8)
+    def testPDF(self):
+        self.assertAlmostEqual(N.BetaDistribution(0, 1, 2, 3).PDF(0.5),
+                               1.5, places=8)
+        self.assertAlmostEqual(N.TDistribution(shape=5).PDF(1.0),
+                               0.219680, places=6)
+        self.assertAlmostEqual(N.GammaDistribution(0, 2, 3).PDF(3.0),
+                               0.125511, places=6)
+        self.assertAlmostEqual(N.PoissonDistribution(3.5).PDF(2),
+                               0.184959, places=6)
+        self.assertAlmostEqual(N.ParetoDistribution(1, 2).PDF(3.0),
+                               2.0 / 27, places=10)
+    def testArray(self):
+        d = N.TDistribution(shape=5)
+        p = d.logPDF([-2.0, 0.0, 1.0])
+        self.assertAlmostEqual(p[2], d.logPDF(1.0), places=10)
+    def testTail(self):
+        # CDF of Normal distribution underflows to 0
+        self.assertAlmostEqual(N.NormalDistribution().logCDF(-40.0),
+                               -804.608442, places=5)
+        self.assertEqual(N.GammaDistribution(0, 1, 2).logPDF(-1.0),
+                         -math.inf)
+    def testBelowLocation(self):
+        d = N.ParetoDistribution(1, 2)
+        self.assertEqual(d.logCDF(-1.0), -math.inf)
+        self.assertEqual(list(d.logCDF([-1.0, 0.5])), [-math.inf] * 2)
+        self.assertAlmostEqual(d.logCDF([3.0])[0], math.log(8.0 / 9),
+                               places=10)
+
+class testQuantileTable(unittest.TestCase):
+    def testQuantile(self):
+        table = N.QuantileTable(N.ChiSquareDistribution(df=10))
+        self.assertAlmostEqual(table.quantile(0.95), 18.307038, places=5)
+        x = table.quantile([0.05, 0.95])
+        self.assertAlmostEqual(x[0], 3.940299, places=5)
+        self.assertAlmostEqual(x[1], 18.307038, places=5)
+    def testOutside(self):
+        # solved by inverseCDF() of the distribution
+        d = N.NormalDistribution()
+        table = N.QuantileTable(d, 0.01, 0.99, 101)
+        self.assertAlmostEqual(table.quantile(0.999),
+                               d.inverseCDF(0.999)[0], places=10)
+        self.assertAlmostEqual(table.quantile(0.999), 3.090232, places=4)
+    def testHeavyTail(self):
+        # quantile of t distribution (1 degree of freedom) is
+        # tan(pi * (p - 0.5))
+        table = N.QuantileTable(N.TDistribution(shape=1))
+        p = [0.0006, 0.001, 0.5003, 0.9994]
+        for (x, q) in zip(table.quantile(p), p):
+            self.assertAlmostEqual(x / math.tan(N.PI * (q - 0.5)), 1.0,
+                                   places=6)
+        d = N.FDistribution(1, 1)
+        self.assertAlmostEqual(N.QuantileTable(d).quantile(0.9994) /
+                               d.inverseCDF(0.9994)[0], 1.0, places=6)
+    def testBounds(self):
+        self.assertRaises(N.DistributionFunctionError, N.QuantileTable,
+                          N.NormalDistribution(), 0.0, 0.9995)
+
+        
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file